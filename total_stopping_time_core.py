@@ -0,0 +1,6676 @@
+#########################################################################################################
+# total_stopping_time_core.py
+#
+# Collatz total stopping time predictor: engines, tables and command implementations
+#
+# The command-line entry point is total_stopping_time_predictor.py, which only imports this module
+# and calls main(). Keeping the code here lets Python reuse the bytecode cached in __pycache__
+# instead of compiling the whole module on every run.
+#########################################################################################################
+
+# Standard library imports
+import io
+import marshal
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from functools import wraps
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Union
+# csv and json are imported by the functions that use them: together with the re module they
+# pull in, they take longer to import than a whole single-n run
+
+# Start of the module execution, reference point of the --time-startup report
+MODULE_START_TIME = time.perf_counter()
+
+# Optional dependency: NumPy enables the vectorized batch kernel. Importing it takes
+# longer than a whole single-n run, so it is only imported on first use (see load_numpy)
+np = None
+NUMPY_IMPORT_ATTEMPTED = False
+
+# Durations of the lazily initialized parts, reported by --time-startup
+STARTUP_TIMINGS = {}
+
+# Configuration constants
+DEFAULT_MAX_COMPUTATION_STEPS = 10000  # Default safety limit on the steps of one trajectory
+MAX_COMPUTATION_STEPS = DEFAULT_MAX_COMPUTATION_STEPS  # Safety limit to prevent infinite loops (see configure_limits)
+MAX_INPUT_VALUE = None             # Maximum allowed input, None for no limit (see configure_limits)
+DEFAULT_CHUNK_SIZE = 100000        # Maximum numbers per chunk when testing on a process pool
+DEFAULT_CHECKPOINT_INTERVAL = 1000000  # Numbers tested between two checkpoints of --test-sequences
+CHECKPOINT_VERSION = 1             # Format version of --test-sequences checkpoint files
+MAX_RECORDED_DIFFERENCES = 100     # Differing comparisons kept (with their sequences) by --test-sequences
+MAX_RECORDED_ERRORS = 100          # (n, error message) pairs kept by --test-sequences
+DEFAULT_MEMO_SIZE = 1000000        # Default number of stopping times kept by a StoppingTimeMemo
+OVERFLOW_THRESHOLD = (2**62 - 1) // 3  # Largest odd value whose 3n+1 step stays on the native fast path
+OUTPUT_BLOCK_SIZE = 10000          # Lines written per block by the bulk output modes
+INPUT_BLOCK_BYTES = 1 << 16        # Bytes of input lines read per block by the streaming mode
+DEFAULT_BENCHMARK_RANGE = 100000   # Default upper bound of the --benchmark range workload
+DEFAULT_BENCHMARK_SAMPLES = 10000  # Default size of the --benchmark random workload
+BENCHMARK_RANDOM_MAX = 2**50       # Upper bound of the values of the --benchmark random workload
+DEFAULT_JUMP_BITS = 12             # Default number of steps k covered by one JumpTable lookup
+MIN_JUMP_BITS = 1                  # Smallest supported JumpTable size (2^1 entries)
+MAX_JUMP_BITS = 24                 # Largest supported JumpTable size (2^24 entries, about 150 MB)
+
+# Binary wormhole table files (see WormholeTable.save and WormholeTable.from_file)
+TABLE_FILE_MAGIC = b"CLZWHT01"      # First bytes of a binary table file
+TABLE_FILE_HEADER = struct.Struct("=8sQQQQ")  # Magic, byte order mark, key, pool and core counts
+TABLE_BYTE_ORDER_MARK = 0x0102030405060708  # Read back differently on a machine of the other endianness
+
+# Marshalled cache of the built-in table, kept in __pycache__ (see load_cached_table)
+TABLE_CACHE_VERSION = 1            # Format version of the marshalled table cache
+
+# Wormhole validation verdicts, computed once per entry point (see get_wormhole_validation)
+WORMHOLE_VALIDATION_CACHE = {}
+STRICT_REVALIDATE = False          # Re-walk every wormhole on each use (--strict-revalidate)
+
+# Output of the streaming batch mode
+STREAM_FORMATS = ("csv", "jsonl")
+STREAM_COLUMNS = ("n", "total_stopping_time", "entry_point_found", "entry_point_position", "saved_steps", "error")
+
+# Query server (--serve) and its client (--query)
+DEFAULT_SERVER_HOST = "127.0.0.1"  # Only local clients by default
+DEFAULT_SERVER_PORT = 8765         # TCP port of --serve and --query
+DEFAULT_SERVER_CACHE_SIZE = 100000 # Result dictionaries kept by the server cache
+SERVER_MAX_BATCH = 4096            # Most queries answered by one batch call
+SERVER_LATENCY_WINDOW = 100000     # Most recent latencies used for the p50/p99 counters
+SERVER_CLIENT_TIMEOUT = 30.0       # Seconds query_server() waits for the server
+
+# Instrumentation (--stats, --profile): functions wrapped while it is enabled, by phase.
+# Nothing is wrapped in a normal run, so the hot paths run at full speed
+INSTRUMENTED_FUNCTIONS = {
+    "input_validation": ("validate_input", "validate_fast_input"),
+    "wormhole_engine": ("calculate_wormhole_total_stopping_time", "total_stopping_time_with_entry",
+                        "walk_with_memo"),
+    "standard_engine": ("calculate_standard_total_stopping_time", "standard_total_stopping_time"),
+    "batch_engine": ("calculate_batch_total_stopping_times", "compute_range"),
+    "sequences": ("generate_standard_sequence", "generate_wormhole_sequence", "compare_sequences",
+                  "stream_compare_sequences"),
+    "wormhole_validation": ("validate_wormhole_sequence", "get_wormhole_validation"),
+    "output": ("display_complete_analysis", "display_standard_and_predicted_sequences", "display_wormhole_info",
+               "display_validation_results", "display_efficiency_table", "display_equivalence_summary",
+               "display_range_statistics", "display_benchmark_results", "print_range_results", "print_sequence",
+               "print_predecessors", "print_sequence_difference")
+}
+STATS_FORMATS = ("text", "json")   # Report formats of --stats and --profile
+PROFILE_REPORT_LINES = 25          # Functions listed by the --profile report
+PROFILE_MEMORY_LINES = 10          # Allocation sites listed by the --profile report
+STATS_TOP_ENTRY_POINTS = 10        # Entry points listed by the --statistics and --stats text reports
+
+# Lane status codes reported by the vectorized batch kernel
+BATCH_REACHED_ONE = 0              # Lane reached 1
+BATCH_ENTRY_POINT = 1              # Lane reached a wormhole entry point
+BATCH_OVERFLOW = 2                 # Lane would leave the 64-bit range on the next 3n+1 step
+BATCH_TOO_LONG = 3                 # Lane exceeded MAX_COMPUTATION_STEPS
+
+
+DICTIONARY = {
+    1: {
+        "wormhole": [1],
+        "mr": 0,
+        "pseudocycle": [1,1]
+    },
+    3: {
+        "wormhole": [3,10,5,16,8,4,2,1],
+        "mr": 1,
+        "pseudocycle": [3,4]
+    },
+    6: {
+        "wormhole": [6,3,10,5,16,8,4,2,1],
+        "mr": 2,
+        "pseudocycle": [6,5]
+    },
+    7: {
+        "wormhole": [7,22,11,34,17,52,26,13,40,20,10,5,16,8,4,2,1],
+        "mr": 3,
+        "pseudocycle": [7,8]
+    },
+    14: {
+        "wormhole": [14,7,22,11,34,17,52,26,13,40,20,10,5,16,8,4,2,1],
+        "mr": 6,
+        "pseudocycle": [14,13]
+    },
+    15: {
+        "wormhole": [15,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 7,
+        "pseudocycle": [15,16]
+    },
+    18: {
+        "wormhole": [18,9,28,14,7,22,11,34,17,52,26,13,40,20,10,5,16,8,4,2,1],
+        "mr": 8,
+        "pseudocycle": [18,17]
+    },
+    19: {
+        "wormhole": [19,58,29,88,44,22,11,34,17,52,26,13,40,20,10,5,16,8,4,2,1],
+        "mr": 9,
+        "pseudocycle": [19,20]
+    },
+    25: {
+        "wormhole": [25,76,38,19,58,29,88,44,22,11,34,17,52,26,13,40,20,10,5,16,8,4,2,1],
+        "mr": 12,
+        "pseudocycle": [25,26]
+    },
+    33: {
+        "wormhole": [33,100,50,25,76,38,19,58,29,88,44,22,11,34,17,52,26,13,40,20,10,5,16,8,4,2,1],
+        "mr": 16,
+        "pseudocycle": [33,34]
+    },
+    39: {
+        "wormhole": [39,118,59,178,89,268,134,67,202,101,304,152,76,38,19,58,29,88,44,22,11,34,17,52,26,13,40,20,10,5,16,8,4,2,1],
+        "mr": 19,
+        "pseudocycle": [39,40]
+    },
+    51: {
+        "wormhole": [51,154,77,232,116,58,29,88,44,22,11,34,17,52,26,13,40,20,10,5,16,8,4,2,1],
+        "mr": 25,
+        "pseudocycle": [51,52]
+    },
+    91: {
+        "wormhole": [91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 45,
+        "pseudocycle": [91,92]
+    },
+    108: {
+        "wormhole": [108,54,27,82,41,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 53,
+        "pseudocycle": [108,107]
+    },
+    121: {
+        "wormhole": [121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 60,
+        "pseudocycle": [121,122]
+    },
+    159: {
+        "wormhole": [159,478,239,718,359,1078,539,1618,809,2428,1214,607,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 79,
+        "pseudocycle": [159,160]
+    },
+    183: {
+        "wormhole": [183,550,275,826,413,1240,620,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 91,
+        "pseudocycle": [183,184]
+    },
+    243: {
+        "wormhole": [243,730,365,1096,548,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 121,
+        "pseudocycle": [243,244]
+    },
+    252: {
+        "wormhole": [252,126,63,190,95,286,143,430,215,646,323,970,485,1456,728,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 125,
+        "pseudocycle": [252,251]
+    },
+    284: {
+        "wormhole": [284,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 141,
+        "pseudocycle": [284,283]
+    },
+    333: {
+        "wormhole": [333,1000,500,250,125,376,188,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 166,
+        "pseudocycle": [333,334]
+    },
+    378: {
+        "wormhole": [378,189,568,284,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 188,
+        "pseudocycle": [378,377]
+    },
+    411: {
+        "wormhole": [411,1234,617,1852,926,463,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 205,
+        "pseudocycle": [411,412]
+    },
+    487: {
+        "wormhole": [487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 243,
+        "pseudocycle": [487,488]
+    },
+    501: {
+        "wormhole": [501,1504,752,376,188,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 250,
+        "pseudocycle": [501,502]
+    },
+    649: {
+        "wormhole": [649,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 324,
+        "pseudocycle": [649,650]
+    },
+    667: {
+        "wormhole": [667,2002,1001,3004,1502,751,2254,1127,3382,1691,5074,2537,7612,3806,1903,5710,2855,8566,4283,12850,6425,19276,9638,4819,14458,7229,21688,10844,5422,2711,8134,4067,12202,6101,18304,9152,4576,2288,1144,572,286,143,430,215,646,323,970,485,1456,728,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 333,
+        "pseudocycle": [667,668]
+    },
+    865: {
+        "wormhole": [865,2596,1298,649,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 432,
+        "pseudocycle": [865,866]
+    },
+    889: {
+        "wormhole": [889,2668,1334,667,2002,1001,3004,1502,751,2254,1127,3382,1691,5074,2537,7612,3806,1903,5710,2855,8566,4283,12850,6425,19276,9638,4819,14458,7229,21688,10844,5422,2711,8134,4067,12202,6101,18304,9152,4576,2288,1144,572,286,143,430,215,646,323,970,485,1456,728,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 444,
+        "pseudocycle": [889,890]
+    },
+    975: {
+        "wormhole": [975,2926,1463,4390,2195,6586,3293,9880,4940,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 487,
+        "pseudocycle": [975,976]
+    },
+    1153: {
+        "wormhole": [1153,3460,1730,865,2596,1298,649,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 576,
+        "pseudocycle": [1153,1154]
+    },
+    1185: {
+        "wormhole": [1185,3556,1778,889,2668,1334,667,2002,1001,3004,1502,751,2254,1127,3382,1691,5074,2537,7612,3806,1903,5710,2855,8566,4283,12850,6425,19276,9638,4819,14458,7229,21688,10844,5422,2711,8134,4067,12202,6101,18304,9152,4576,2288,1144,572,286,143,430,215,646,323,970,485,1456,728,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 592,
+        "pseudocycle": [1185,1186]
+    },
+    1299: {
+        "wormhole": [1299,3898,1949,5848,2924,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 649,
+        "pseudocycle": [1299,1300]
+    },
+    1335: {
+        "wormhole": [1335,4006,2003,6010,3005,9016,4508,2254,1127,3382,1691,5074,2537,7612,3806,1903,5710,2855,8566,4283,12850,6425,19276,9638,4819,14458,7229,21688,10844,5422,2711,8134,4067,12202,6101,18304,9152,4576,2288,1144,572,286,143,430,215,646,323,970,485,1456,728,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 667,
+        "pseudocycle": [1335,1336]
+    },
+    1368: {
+        "wormhole": [1368,684,342,171,514,257,772,386,193,580,290,145,436,218,109,328,164,82,41,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 683,
+        "pseudocycle": [1368,1367]
+    },
+    1731: {
+        "wormhole": [1731,5194,2597,7792,3896,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 865,
+        "pseudocycle": [1735,1736]
+    },
+    1779: {
+        "wormhole": [1779,5338,2669,8008,4004,2002,1001,3004,1502,751,2254,1127,3382,1691,5074,2537,7612,3806,1903,5710,2855,8566,4283,12850,6425,19276,9638,4819,14458,7229,21688,10844,5422,2711,8134,4067,12202,6101,18304,9152,4576,2288,1144,572,286,143,430,215,646,323,970,485,1456,728,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 889,
+        "pseudocycle": [1779,1780]
+    },
+    2307: {
+        "wormhole": [2307,6922,3461,10384,5192,2596,1298,649,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 1153,
+        "pseudocycle": [2307,2308]
+    },
+    2430: {
+        "wormhole": [2430,1215,3646,1823,5470,2735,8206,4103,12310,6155,18466,9233,27700,13850,6925,20776,10388,5194,2597,7792,3896,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 1214,
+        "pseudocycle": [2430,2429]
+    },
+    3643: {
+        "wormhole": [3643,10930,5465,16396,8198,4099,12298,6149,18448,9224,4612,2306,1153,3460,1730,865,2596,1298,649,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 1821,
+        "pseudocycle": [3643,3644]
+    },
+    4857: {
+        "wormhole": [4857,14572,7286,3643,10930,5465,16396,8198,4099,12298,6149,18448,9224,4612,2306,1153,3460,1730,865,2596,1298,649,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 2428,
+        "pseudocycle": [4857,4858]
+    },
+    7287: {
+        "wormhole": [7287,21862,10931,32794,16397,49192,24596,12298,6149,18448,9224,4612,2306,1153,3460,1730,865,2596,1298,649,1948,974,487,1462,731,2194,1097,3292,1646,823,2470,1235,3706,1853,5560,2780,1390,695,2086,1043,3130,1565,4696,2348,1174,587,1762,881,2644,1322,661,1984,992,496,248,124,62,31,94,47,142,71,214,107,322,161,484,242,121,364,182,91,274,137,412,206,103,310,155,466,233,700,350,175,526,263,790,395,1186,593,1780,890,445,1336,668,334,167,502,251,754,377,1132,566,283,850,425,1276,638,319,958,479,1438,719,2158,1079,3238,1619,4858,2429,7288,3644,1822,911,2734,1367,4102,2051,6154,3077,9232,4616,2308,1154,577,1732,866,433,1300,650,325,976,488,244,122,61,184,92,46,23,70,35,106,53,160,80,40,20,10,5,16,8,4,2,1],
+        "mr": 3643,
+        "pseudocycle": [7287,7288]
+    },
+}
+
+# Custom exceptions for specific error handli   ng
+class ValidationError(Exception):
+    pass
+
+class ComputationError(Exception):
+    """
+    A computation that could not be completed.
+    
+    Attributes:
+        steps (int): Steps walked before the failure, reported as computed_steps by
+                     the result dictionaries. A walk over MAX_COMPUTATION_STEPS fails
+                     at step MAX_COMPUTATION_STEPS + 1, as in a step-by-step walk, even
+                     when a fast path skipped past that step in one move.
+    """
+    def __init__(self, message: str = "", steps: int = 0):
+        super().__init__(message)
+        self.steps = steps
+
+class SortedArrayMap:
+    """
+    Read-only mapping over a sorted key array and a parallel value array.
+    
+    Lookups are binary searches (bisect) directly on the arrays, so a table
+    memory-mapped from disk is used without building a Python dict of its
+    entries. The arrays can be array.array objects or memoryviews.
+    
+    Attributes:
+        keys_array: Sorted keys
+        values_array: Values, values_array[i] belongs to keys_array[i]
+        convert: Optional function applied to a value before it is returned
+    
+    Examples:
+        >>> table = SortedArrayMap(array("Q", [3, 7, 91]), array("Q", [7, 16, 92]))
+        >>> 91 in table, table[7], table.get(8)
+        (True, 16, None)
+    """
+
+    def __init__(self, keys_array, values_array, convert=None):
+        self.keys_array = keys_array
+        self.values_array = values_array
+        self.convert = convert
+
+    def index(self, key: int) -> int:
+        """Return the position of key in keys_array, or -1 if key is absent."""
+        keys_array = self.keys_array
+        # Values outside the unsigned 64-bit range cannot be keys (and cannot be compared with a memoryview)
+        if not 0 <= key < 2**64:
+            return -1
+        position = bisect_left(keys_array, key)
+        if position < len(keys_array) and keys_array[position] == key:
+            return position
+        return -1
+
+    def __contains__(self, key: int) -> bool:
+        return self.index(key) >= 0
+
+    def __getitem__(self, key: int):
+        position = self.index(key)
+        if position < 0:
+            raise KeyError(key)
+        value = self.values_array[position]
+        return self.convert(value) if self.convert is not None else value
+
+    def get(self, key: int, default=None):
+        position = self.index(key)
+        if position < 0:
+            return default
+        value = self.values_array[position]
+        return self.convert(value) if self.convert is not None else value
+
+    def __len__(self) -> int:
+        return len(self.keys_array)
+
+    def __iter__(self):
+        return iter(self.keys_array)
+
+    def keys(self):
+        """Return the keys in ascending order."""
+        return list(self.keys_array)
+
+    def items(self):
+        """Return the (key, value) pairs in ascending key order."""
+        return [(key, self[key]) for key in self.keys_array]
+
+def exponents_from_mask(mask: int) -> tuple:
+    """
+    Decode a bit mask of power-of-two exponents into a descending tuple.
+    
+    Examples:
+        >>> exponents_from_mask(0b11)
+        (1, 0)
+    """
+    return tuple(exponent for exponent in range(mask.bit_length() - 1, -1, -1) if mask >> exponent & 1)
+
+class WormholeTable:
+    """
+    Compact, read-only representation of the wormhole entry points.
+    
+    The hot paths only need two things from a wormhole: whether a value is an
+    entry point and how many steps its wormhole covers. The table therefore keeps
+    a frozen key -> stopping time map for lookups, and stores the wormhole
+    sequences themselves only for display and validation.
+    
+    Many wormholes are suffixes of each other (108, 121, 252, 284 and 333 all end
+    in the tail of 91, and every wormhole ends in 16, 8, 4, 2, 1). Sequences are
+    therefore stored once as a shared suffix tree: a pool of values in an
+    array('Q') plus, for every pool node, the index of the node that follows it.
+    Each entry point only keeps the index of its first node, and a full sequence
+    is expanded lazily by following the links.
+    
+    A table is either built in memory from a DICTIONARY-style mapping
+    (from_dictionary) or memory-mapped from a binary file written by save()
+    (from_file). A mapped table keeps its sorted keys, stopping times, pool and
+    links in the file and answers lookups by binary search (SortedArrayMap), so
+    large tables are used without loading them into Python objects.
+    
+    Attributes:
+        stopping_times: Frozen map of entry point -> wormhole steps (a MappingProxyType,
+                        or a SortedArrayMap for a mapped table)
+        pool (array): array('Q') of the distinct suffix-tree node values (a memoryview
+                     for a mapped table)
+        links (array): array('i') with the index of the next node (-1 at the final 1)
+        heads: Frozen map of entry point -> index of its first node
+        odd_cores (MappingProxyType): Frozen map of odd core -> exponents e (descending)
+                                     of the entry points core * 2^e, used by the walkers
+                                     to strip trailing zeros without missing an entry
+                                     point (the entry point 1 is left out)
+        owners (MappingProxyType): For a table built by with_interior_points(), frozen map of
+                                  entry point -> (owning key, offset in its wormhole);
+                                  None for a table of keys only
+    
+    Examples:
+        >>> table = WormholeTable.from_dictionary(DICTIONARY)
+        >>> 91 in table, table.stopping_time(91)
+        (True, 92)
+        >>> table.sequence(3)
+        [3, 10, 5, 16, 8, 4, 2, 1]
+        >>> len(table.pool)
+        396
+        >>> table.odd_cores[3]
+        (1, 0)
+    
+    Notes:
+        - The 42 DICTIONARY wormholes (4155 values) are stored as 396 pool nodes
+        - Sharing is exact: two nodes are merged only when their whole suffixes are equal
+    """
+
+    def __init__(self, stopping_times, pool, links, heads, odd_cores=None, owners=None):
+        self.stopping_times = MappingProxyType(stopping_times) if isinstance(stopping_times, dict) else stopping_times
+        self.pool = pool
+        self.links = links
+        self.heads = MappingProxyType(heads) if isinstance(heads, dict) else heads
+        self.owners = MappingProxyType(owners) if isinstance(owners, dict) else owners
+        
+        # Split every entry point into its odd core and power-of-two exponent
+        if odd_cores is None:
+            odd_cores = {}
+            for key in stopping_times:
+                if key != 1:
+                    exponent = (key & -key).bit_length() - 1
+                    odd_cores.setdefault(key >> exponent, []).append(exponent)
+            odd_cores = MappingProxyType({core: tuple(sorted(exponents, reverse=True))
+                                          for core, exponents in odd_cores.items()})
+        self.odd_cores = odd_cores
+
+    @classmethod
+    def from_dictionary(cls, dictionary: dict) -> "WormholeTable":
+        """
+        Build a compact table from a DICTIONARY-style mapping.
+        
+        Args:
+            dictionary (dict): Mapping of entry point -> {"wormhole": [...], ...}
+        
+        Returns:
+            WormholeTable: The compact table
+        
+        Raises:
+            ValidationError: If an entry point is above OVERFLOW_THRESHOLD, where the
+                            arbitrary-precision engine does not look for entry points
+        """
+        pool = array("Q")
+        links = array("i")
+        nodes = {}  # (value, index of next node) -> node index
+        heads = {}
+        stopping_times = {}
+        
+        for key, entry in dictionary.items():
+            if key > OVERFLOW_THRESHOLD:
+                raise ValidationError(f"Entry point {key} is above the native range (limit: {OVERFLOW_THRESHOLD})")
+            wormhole = entry["wormhole"]
+            # Insert the sequence from its end, reusing every suffix already stored
+            next_index = -1
+            for value in reversed(wormhole):
+                node = (value, next_index)
+                index = nodes.get(node)
+                if index is None:
+                    index = len(pool)
+                    pool.append(value)
+                    links.append(next_index)
+                    nodes[node] = index
+                next_index = index
+            heads[key] = next_index
+            stopping_times[key] = len(wormhole) - 1
+        
+        return cls(stopping_times, pool, links, heads)
+
+    @classmethod
+    def from_file(cls, path: str) -> "WormholeTable":
+        """
+        Memory-map a binary table written by save().
+        
+        The file layout is a TABLE_FILE_HEADER followed by native 8-byte arrays:
+        sorted keys, stopping times, head indices, pool values, pool links,
+        sorted odd cores and their exponent bit masks.
+        
+        Args:
+            path (str): Binary table file
+        
+        Returns:
+            WormholeTable: A table whose arrays are views of the mapped file
+        
+        Raises:
+            ValidationError: If the file is not a binary table for this machine
+        """
+        try:
+            with open(path, "rb") as table_file:
+                mapped = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, byte_order_mark, key_count, pool_count, core_count = TABLE_FILE_HEADER.unpack_from(mapped, 0)
+        except (OSError, ValueError, struct.error) as e:
+            raise ValidationError(f"Invalid wormhole table {path}: {e}") from e
+        if magic != TABLE_FILE_MAGIC:
+            raise ValidationError(f"Invalid wormhole table {path}: not a binary table file")
+        if byte_order_mark != TABLE_BYTE_ORDER_MARK:
+            raise ValidationError(f"Invalid wormhole table {path}: written on a machine with another byte order")
+        expected_size = TABLE_FILE_HEADER.size + 8 * (3 * key_count + 2 * pool_count + 2 * core_count)
+        if len(mapped) != expected_size:
+            raise ValidationError(f"Invalid wormhole table {path}: expected {expected_size} bytes, got {len(mapped)}")
+        
+        # Slice the mapped file into typed views, without copying
+        view = memoryview(mapped)
+        offset = TABLE_FILE_HEADER.size
+        arrays = []
+        for count, typecode in ((key_count, "Q"), (key_count, "Q"), (key_count, "q"),
+                                (pool_count, "Q"), (pool_count, "q"), (core_count, "Q"), (core_count, "Q")):
+            arrays.append(view[offset:offset + 8 * count].cast(typecode))
+            offset += 8 * count
+        keys, stopping_times, heads, pool, links, cores, core_masks = arrays
+        
+        return cls(SortedArrayMap(keys, stopping_times), pool, links, SortedArrayMap(keys, heads),
+                   SortedArrayMap(cores, core_masks, exponents_from_mask))
+
+    def save(self, path: str) -> None:
+        """
+        Write the table as a binary file that from_file() memory-maps.
+        
+        Args:
+            path (str): Output file path
+        """
+        keys = sorted(self.stopping_times)
+        cores = sorted(self.odd_cores)
+        with open(path, "wb") as table_file:
+            table_file.write(TABLE_FILE_HEADER.pack(TABLE_FILE_MAGIC, TABLE_BYTE_ORDER_MARK,
+                                                    len(keys), len(self.pool), len(cores)))
+            array("Q", keys).tofile(table_file)
+            array("Q", [self.stopping_times[key] for key in keys]).tofile(table_file)
+            array("q", [self.heads[key] for key in keys]).tofile(table_file)
+            array("Q", self.pool).tofile(table_file)
+            array("q", self.links).tofile(table_file)
+            array("Q", cores).tofile(table_file)
+            array("Q", [sum(1 << exponent for exponent in self.odd_cores[core]) for core in cores]).tofile(table_file)
+
+    def with_interior_points(self) -> "WormholeTable":
+        """
+        Return a table in which every value stored inside a wormhole is an entry point.
+        
+        Every value of a wormhole has a known remaining distance to 1, so a walk can
+        stop at the first value of any stored sequence instead of only at the keys.
+        The new table shares the pool and links of this one: the head of an interior
+        value is its own pool node, and its stopping time is the number of steps
+        left in the wormhole. The owners map records, for every entry point, the key
+        of the first wormhole (in ascending key order) that contains it and its
+        offset there, so that validation verdicts are inherited from that key.
+        
+        Returns:
+            WormholeTable: The interior-point table (this table if it already is one)
+        
+        Examples:
+            >>> interior = get_wormhole_table().with_interior_points()
+            >>> len(get_wormhole_table()), len(interior)
+            (42, 392)
+            >>> interior.owners[9232], interior.stopping_time(9232)
+            ((91, 58), 34)
+        
+        Notes:
+            - Memory is one dictionary entry per pool node, also for a mapped table
+            - Powers of two inside a wormhole (the tail 16, 8, 4, 2 shared by every
+              trajectory) are not indexed, so the hit rate still means something
+        """
+        if self.owners is not None:
+            return self
+        pool = self.pool
+        links = self.links
+        stopping_times = {}
+        heads = {}
+        owners = {}
+        visited = set()
+        for key in sorted(self.stopping_times):
+            index = self.heads[key]
+            steps = self.stopping_times[key]
+            offset = 0
+            # Shared suffixes were already indexed through the wormhole that reached them first
+            while index != -1 and index not in visited:
+                visited.add(index)
+                value = pool[index]
+                # Powers of two only halve down to 1: the tail 16, 8, 4, 2 ends every
+                # trajectory, so indexing it would count every n as an entry point hit
+                trivial = offset and not value & (value - 1)
+                if value not in stopping_times and not trivial:
+                    stopping_times[value] = steps - offset
+                    heads[value] = index
+                    owners[value] = (key, offset)
+                index = links[index]
+                offset += 1
+        return WormholeTable(stopping_times, pool, links, heads, owners=owners)
+
+    def interior_point(self, value: int) -> tuple:
+        """
+        Return (owning key, offset, remaining steps) of an entry point.
+        
+        For a table of keys only, every entry point is its own owner at offset 0.
+        
+        Raises:
+            KeyError: If value is not an entry point of the table
+        """
+        remaining = self.stopping_times[value]
+        owner, offset = self.owners[value] if self.owners is not None else (value, 0)
+        return owner, offset, remaining
+
+    def __contains__(self, value: int) -> bool:
+        return value in self.stopping_times
+
+    def __len__(self) -> int:
+        return len(self.stopping_times)
+
+    def keys(self):
+        """Return the entry points of the table."""
+        return self.stopping_times.keys()
+
+    def stopping_time(self, key: int) -> int:
+        """Return the number of steps covered by the wormhole of key."""
+        return self.stopping_times[key]
+
+    def length(self, key: int) -> int:
+        """Return the number of elements of the wormhole of key."""
+        return self.stopping_times[key] + 1
+
+    def iter_sequence(self, key: int, start: int = 0):
+        """
+        Yield the wormhole of key element by element, starting at position start.
+        
+        Args:
+            key (int): The entry point
+            start (int): Number of leading elements to skip
+        
+        Yields:
+            int: The wormhole values, ending with 1
+        """
+        pool = self.pool
+        links = self.links
+        index = self.heads[key]
+        for _ in range(start):
+            index = links[index]
+        while index != -1:
+            yield pool[index]
+            index = links[index]
+
+    def sequence(self, key: int) -> list:
+        """
+        Expand the wormhole of key into a list (used for display and validation).
+        
+        Args:
+            key (int): The entry point
+        
+        Returns:
+            list: The complete wormhole, from key down to 1
+        """
+        return list(self.iter_sequence(key))
+
+    def memory_bytes(self) -> int:
+        """Return the approximate memory used by the sequence pool and links."""
+        return len(self.pool) * self.pool.itemsize + len(self.links) * self.links.itemsize
+
+# Compact table used by all walkers; DICTIONARY remains the built-in default table,
+# and --table replaces it with a JSON or binary table file. It is built on first use
+# (see get_wormhole_table), so commands that never walk a trajectory do not pay for it.
+WORMHOLE_TABLE = None
+
+def get_wormhole_table() -> WormholeTable:
+    """
+    Return the wormhole table used by every engine, building it from DICTIONARY on first use.
+    
+    Returns:
+        WormholeTable: The current table
+    
+    Examples:
+        >>> get_wormhole_table().stopping_time(91)
+        92
+    """
+    global WORMHOLE_TABLE
+    if WORMHOLE_TABLE is None:
+        start_time = time.perf_counter()
+        table = load_cached_table()
+        STARTUP_TIMINGS["wormhole_table_cached"] = table is not None
+        if table is None:
+            table = WormholeTable.from_dictionary(DICTIONARY)
+            save_cached_table(table)
+        WORMHOLE_TABLE = table
+        STARTUP_TIMINGS["wormhole_table"] = time.perf_counter() - start_time
+    return WORMHOLE_TABLE
+
+def table_cache_path() -> str:
+    """
+    Return the path of the marshalled cache of the built-in table, or None without a cache tag.
+    
+    The cache sits in the __pycache__ directory of this module, next to its bytecode,
+    and its name carries the interpreter cache tag (e.g. cpython-311), since the
+    marshal format is specific to the Python version.
+    """
+    cache_tag = sys.implementation.cache_tag
+    if cache_tag is None:
+        return None
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__")
+    return os.path.join(directory, f"total_stopping_time_core.table.{cache_tag}.marshal")
+
+def table_cache_key() -> tuple:
+    """
+    Return the key that a marshalled table cache must carry to be used.
+    
+    Like a .pyc file, the cache is tied to the modification time and size of this
+    source file, so editing DICTIONARY invalidates it. The byte order is part of the
+    key because the pool and links are stored as raw array bytes.
+    """
+    source = os.stat(__file__)
+    return (TABLE_CACHE_VERSION, marshal.version, sys.byteorder, int(source.st_mtime), source.st_size)
+
+def load_cached_table() -> WormholeTable:
+    """
+    Load the built-in table from its marshalled cache.
+    
+    Unmarshalling the table components takes about a tenth of the time of
+    WormholeTable.from_dictionary(DICTIONARY), which matters for single-n runs.
+    
+    Returns:
+        WormholeTable: The cached table, or None when there is no valid cache
+    """
+    path = table_cache_path()
+    if path is None:
+        return None
+    try:
+        key = table_cache_key()
+        with open(path, "rb") as cache_file:
+            cached = marshal.load(cache_file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(cached, tuple) or len(cached) != 6 or cached[0] != key:
+        return None
+    _, stopping_times, pool_bytes, links_bytes, heads, odd_cores = cached
+    pool = array("Q")
+    pool.frombytes(pool_bytes)
+    links = array("i")
+    links.frombytes(links_bytes)
+    return WormholeTable(stopping_times, pool, links, heads, MappingProxyType(odd_cores))
+
+def save_cached_table(table: WormholeTable) -> None:
+    """
+    Write the built-in table to its marshalled cache for the next runs.
+    
+    The cache is written like Python writes bytecode: not at all when
+    sys.dont_write_bytecode is set (PYTHONDONTWRITEBYTECODE, python -B), and
+    silently skipped when __pycache__ is not writable. The file is written under a
+    temporary name and renamed, so concurrent runs never read a partial cache.
+    
+    Args:
+        table (WormholeTable): The table built from DICTIONARY
+    """
+    path = table_cache_path()
+    if path is None or sys.dont_write_bytecode:
+        return
+    temporary_path = f"{path}.{os.getpid()}"
+    try:
+        cached = (table_cache_key(), dict(table.stopping_times), table.pool.tobytes(),
+                  table.links.tobytes(), dict(table.heads), dict(table.odd_cores))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary_path, "wb") as cache_file:
+            marshal.dump(cached, cache_file)
+        os.replace(temporary_path, path)
+    except OSError:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+
+def load_numpy():
+    """
+    Import NumPy on first use.
+    
+    Returns:
+        module: The numpy module, or None when NumPy is not installed
+    """
+    global np, NUMPY_IMPORT_ATTEMPTED
+    if not NUMPY_IMPORT_ATTEMPTED:
+        NUMPY_IMPORT_ATTEMPTED = True
+        start_time = time.perf_counter()
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+        STARTUP_TIMINGS["numpy_import"] = time.perf_counter() - start_time
+    return np
+
+def validate_input(n: Union[int, str, float]) -> int:
+    """
+    Validate and convert input to a positive integer for Collatz sequence computation.
+    
+    This function performs comprehensive input validation and type conversion to ensure
+    the input is suitable for Collatz sequence analysis. It handles various input types
+    (string, float, int) and applies mathematical and practical constraints.
+    
+    Args:
+        n (Union[int, str, float]): The input value to validate and convert.
+                                   Can be a string representation of a number,
+                                   a float (must be a whole number), or an integer.
+    
+    Returns:
+        int: A validated positive integer ready for Collatz computation.
+    
+    Raises:
+        ValidationError: If input is None, empty, not a whole number, non-positive,
+                        too large, or has invalid format.
+    
+    Examples:
+        >>> validate_input("27")
+        27
+        >>> validate_input(42.0)
+        42
+        >>> validate_input(15)
+        15
+        >>> validate_input("0")  # Raises ValidationError
+        >>> validate_input("3.14")  # Raises ValidationError
+        >>> validate_input("")  # Raises ValidationError
+    
+    Notes:
+        - There is no maximum by default, since the engines work with arbitrary-precision
+          integers; configure_limits() sets one (MAX_INPUT_VALUE)
+        - Floating point inputs must represent exact integers (e.g., 27.0 is valid, 27.1 is not)
+        - Decimal strings are parsed exactly, digit by digit, so "9007199254740993.0" is
+          9007199254740993 and not the nearest float; exponent notation is not accepted
+        - String inputs are stripped of whitespace before processing
+        - Input must be positive (> 0) as Collatz conjecture is defined for positive integers
+    """
+
+    # Check for None input - cannot proceed with null values
+    if n is None:
+        raise ValidationError("Input cannot be None")
+    
+    try:
+        # Handle string input type
+        if isinstance(n, str):
+            # Remove leading/trailing whitespace
+            n = n.strip()
+
+            # Check for empty string after stripping
+            if not n:
+                raise ValidationError("Input cannot be empty")
+            # Check if string contains decimal point (potential float)
+            if '.' in n:
+                # Parse the digits exactly: going through float would round above 2^53
+                whole, _, fraction = n.partition('.')
+                if fraction and not fraction.isdigit():
+                    raise ValueError(f"invalid decimal: {n}")
+                # Ensure the decimal represents a whole number
+                if fraction.strip('0'):
+                    raise ValidationError(f"Input '{n}' is not a whole number")
+                n_int = int(whole)
+            else:
+                # Direct integer conversion for strings without decimal points
+                n_int = int(n)
+        # Handle float input type
+        elif isinstance(n, float):
+            # Verify that float represents a whole number
+            if not n.is_integer():
+                raise ValidationError(f"Input {n} is not a whole number")
+            n_int = int(n)
+        # Handle integer input type (direct assignment)
+        elif isinstance(n, int):
+            n_int = n
+        # Handle unsupported input types
+        else:
+            raise ValidationError(f"Cannot convert {type(n).__name__} to integer")
+    # Catch conversion errors and provide meaningful feedback
+    except (ValueError, OverflowError) as e:
+        raise ValidationError(f"Invalid number format: {n}") from e
+    # Validate that the number is positive (Collatz conjecture requirement)
+    if n_int <= 0:
+        raise ValidationError(f"n must be positive, got {n_int}")
+    # Check against the configured maximum, if any
+    if MAX_INPUT_VALUE is not None and n_int > MAX_INPUT_VALUE:
+        raise ValidationError(f"n={n_int} too large (limit: {MAX_INPUT_VALUE})")
+    
+    return n_int
+
+def next_collatz_value(n: int) -> int:
+    """
+    Apply one step of the Collatz function to compute the next value in the sequence.
+    
+    This function implements the core Collatz conjecture transformation:
+    - If n is even: return n/2
+    - If n is odd: return 3n+1
+    
+    Python integers have arbitrary precision, so the 3n+1 operation never
+    overflows, however large n is.
+    
+    Args:
+        n (int): A positive integer for which to compute the next Collatz value.
+                Must be greater than 0.
+    
+    Returns:
+        int: The next value in the Collatz sequence according to the transformation rules.
+    
+    Raises:
+        ComputationError: If n is non-positive
+    
+    Examples:
+        >>> next_collatz_value(6)    # Even: 6/2
+        3
+        >>> next_collatz_value(3)    # Odd: 3*3+1
+        10
+        >>> next_collatz_value(1)    # Odd: 3*1+1
+        4
+        >>> next_collatz_value(0)    # Raises ComputationError
+        
+    Notes:
+        - This is the fundamental operation of the Collatz conjecture
+        - Even numbers are always divided by 2 (right bit shift equivalent)
+        - Odd numbers follow the 3n+1 rule
+        - The sequence eventually reaches 1 for all tested positive integers
+    """
+    # Validate input is positive (Collatz function domain requirement)
+    if n <= 0:
+        raise ComputationError(f"Invalid value: {n}")
+    # Apply Collatz transformation based on parity
+    if n % 2 == 0:
+        # Even case: divide by 2 (equivalent to right bit shift)
+        return n // 2
+    else:
+        # Odd case: apply 3n+1
+        return 3 * n + 1
+
+def iter_standard(n: int):
+    """
+    Yield the Collatz sequence from n to 1 one value at a time (standard algorithm).
+    
+    This is the lazy form of generate_standard_sequence(): nothing is stored, so a
+    consumer can stream through a trajectory in constant memory and stop early.
+    
+    Args:
+        n (int): A positive integer, already validated (typically by validate_input)
+    
+    Yields:
+        int: The values of the sequence, from n down to 1 (inclusive)
+    
+    Raises:
+        ComputationError: When the sequence reaches MAX_COMPUTATION_STEPS steps, after
+                         the values computed so far have been yielded
+    
+    Examples:
+        >>> list(iter_standard(3))
+        [3, 10, 5, 16, 8, 4, 2, 1]
+        >>> next(value for value in iter_standard(27) if value > 9000)
+        9232
+    """
+    current = n
+    steps = 0
+    while current != 1 and steps < MAX_COMPUTATION_STEPS:
+        yield current
+        current = next_collatz_value(current)
+        steps += 1
+    
+    # Safety mechanism to prevent infinite loops
+    if steps >= MAX_COMPUTATION_STEPS:
+        raise ComputationError(f"Sequence too long for n={n}")
+    yield 1
+
+def iter_wormhole(n: int, entry_point_info: dict = None):
+    """
+    Yield the Collatz sequence from n to 1 one value at a time (wormhole algorithm).
+    
+    This is the lazy form of generate_wormhole_sequence(). Values are computed up
+    to the first wormhole entry point, then the stored tail is yielded straight
+    from the table's shared suffix pool, without copying it into a list.
+    
+    Args:
+        n (int): A positive integer, already validated (typically by validate_input)
+        entry_point_info (dict): Optional dictionary that receives the wormhole usage
+                                 information of generate_wormhole_sequence(). It is filled
+                                 when the entry point is reached, before its tail is
+                                 yielded, or when 1 is reached without a wormhole.
+    
+    Yields:
+        int: The values of the sequence, from n down to 1 (inclusive)
+    
+    Raises:
+        ComputationError: If computation exceeds MAX_COMPUTATION_STEPS without
+                         finding a wormhole or reaching 1
+    
+    Examples:
+        >>> info = {}
+        >>> list(iter_wormhole(6, info))
+        [6, 3, 10, 5, 16, 8, 4, 2, 1]
+        >>> info
+        {'entry_point_found': 3, 'entry_point_position': 1, 'wormhole_used': True, 'wormhole_length': 8}
+    """
+    table = get_wormhole_table()
+    entry_points = table.stopping_times  # Frozen map, faster than the table's __contains__
+    current = n
+    steps = 0
+    
+    while current != 1:
+        yield current
+        
+        # Check if current number is a wormhole entry point in our table
+        if current in entry_points:
+            if entry_point_info is not None:
+                entry_point_info.update({
+                    "entry_point_found": current,              # Which number triggered the wormhole
+                    "entry_point_position": steps,             # At what step the wormhole was found
+                    "wormhole_used": True,                     # Confirmation that optimization was applied
+                    "wormhole_length": table.length(current)   # Size of the utilized wormhole
+                })
+            # Splice the stored tail (skip its first element, already yielded as current)
+            yield from table.iter_sequence(current, 1)
+            return
+        
+        # No wormhole found at this step, so let's continue with standard Collatz calculation
+        current = next_collatz_value(current)
+        steps += 1
+        
+        # Safety mechanism to prevent infinite loops
+        if steps > MAX_COMPUTATION_STEPS:
+            raise ComputationError(f"Exceeded {MAX_COMPUTATION_STEPS} steps", MAX_COMPUTATION_STEPS + 1)
+    
+    # Reached 1 without finding any wormhole - standard computation completed
+    if entry_point_info is not None:
+        entry_point_info["wormhole_used"] = False
+    yield 1
+
+def generate_standard_sequence(n: int) -> list:
+    """
+    Generate the complete Collatz sequence from n to 1 using the standard algorithm.
+    
+    This function implements the traditional Collatz sequence generation by repeatedly
+    applying the Collatz function until reaching 1. It serves as the baseline reference
+    for comparison with optimized algorithms (like the wormhole approach).
+    
+    The sequence generation follows these steps:
+    1. Start with the input number n
+    2. Apply next_collatz_value() repeatedly
+    3. Continue until reaching 1
+    4. Include 1 as the final element
+    
+    Args:
+        n (int): A positive integer starting point for the Collatz sequence.
+                Must be already validated (typically by validate_input).
+    
+    Returns:
+        list: Complete Collatz sequence from n to 1 (inclusive).
+              Example: for n=3, returns [3, 10, 5, 16, 8, 4, 2, 1]
+    
+    Raises:
+        ComputationError: If the sequence exceeds MAX_COMPUTATION_STEPS without
+                         reaching 1, indicating potential infinite loop or
+                         computational limits.
+    
+    Examples:
+        >>> generate_standard_sequence(3)
+        [3, 10, 5, 16, 8, 4, 2, 1]
+        >>> generate_standard_sequence(1)
+        [1]
+        >>> generate_standard_sequence(4)
+        [4, 2, 1]
+        
+    Notes:
+        - This is the reference implementation for Collatz sequence generation
+        - Includes safety mechanism to prevent infinite loops via MAX_COMPUTATION_STEPS
+        - The Collatz conjecture states that this sequence reaches 1 for all positive integers
+        - Sequence length equals the total stopping time + 1 (including the starting number)
+        - Used for validation and comparison with optimized algorithms
+        - Materializes iter_standard(); stream with the generator when the list is not needed
+    """
+    return list(iter_standard(n))
+
+def generate_wormhole_sequence(n: int) -> tuple:
+    """
+    Generate Collatz sequence using the wormhole optimization algorithm.
+    
+    This function implements an optimized approach to Collatz sequence generation
+    by utilizing pre-computed "wormhole" sequences. Instead of calculating every
+    step, it searches for known entry points in the WORMHOLE_TABLE and uses the
+    corresponding pre-computed sequence to "jump" directly to the end.
+    
+    Algorithm workflow:
+    1. Start with input number n
+    2. For each step, check if current number is a wormhole entry point
+    3. If found: append the pre-computed wormhole sequence and terminate
+    4. If not found: continue with standard Collatz calculation
+    5. Repeat until reaching 1 or finding a wormhole
+    
+    Args:
+        n (int): A positive integer starting point for the Collatz sequence.
+                Must be already validated (typically by validate_input).
+    
+    Returns:
+        tuple: A 2-tuple containing:
+            - sequence (list): Complete Collatz sequence from n to 1
+            - entry_point_info (dict): Information about wormhole usage containing:
+                * wormhole_used (bool): Whether a wormhole was utilized
+                * entry_point_found (int): The number that served as wormhole entry
+                * entry_point_position (int): Step position where wormhole was found
+                * wormhole_length (int): Length of the utilized wormhole sequence
+    
+    Raises:
+        ComputationError: If computation exceeds MAX_COMPUTATION_STEPS without
+                         finding a wormhole or reaching 1.
+    
+    Examples:
+        >>> seq, info = generate_wormhole_sequence(6)
+        >>> seq
+        [6, 3, 10, 5, 16, 8, 4, 2, 1]
+        >>> info
+        {'entry_point_found': 3, 'entry_point_position': 1, 'wormhole_used': True, 'wormhole_length': 8}
+        
+        >>> seq, info = generate_wormhole_sequence(2)
+        >>> info['wormhole_used']
+        False
+        
+    Notes:
+        - This is the core optimization that provides computational efficiency
+        - Wormholes are pre-computed sequences stored in the global WORMHOLE_TABLE
+        - Entry point detection happens at each step before applying Collatz function
+        - The algorithm gracefully falls back to standard computation if no wormhole is found
+        - Sequence generated is mathematically identical to standard algorithm
+        - Computational savings can be significant for numbers that quickly reach known entry points
+        - Materializes iter_wormhole(); stream with the generator when the list is not needed
+    """
+    entry_point_info = {}
+    sequence = list(iter_wormhole(n, entry_point_info))
+    return sequence, entry_point_info
+
+def stream_compare_sequences(n: int) -> dict:
+    """
+    Compare the standard and wormhole sequences of n in a single pass, without building them.
+    
+    The standard trajectory is walked once. Up to the first entry point both
+    algorithms perform the same steps, so only the part after the entry point
+    needs checking: each further standard value is compared with the stored
+    wormhole tail, stopping at the first difference.
+    
+    Args:
+        n (int): A positive integer, already validated
+    
+    Returns:
+        dict: The compare_sequences() result when both sequences are identical, or
+              None when they differ or the step limit is reached. The caller then
+              builds both sequences to produce the detailed report.
+    
+    Raises:
+        ComputationError: Propagated from next_collatz_value(), as in generate_standard_sequence()
+    
+    Examples:
+        >>> stream_compare_sequences(27)["standard_length"]
+        112
+    """
+    entry_points = get_wormhole_table().stopping_times  # Frozen map, faster than the table's __contains__
+    current = n
+    steps = 0
+    
+    # Shared prefix: walk until the first entry point, or until 1 when there is none
+    while current != 1:
+        if current in entry_points:
+            break
+        current = next_collatz_value(current)
+        steps += 1
+        if steps >= MAX_COMPUTATION_STEPS:
+            return None
+    else:
+        return {
+            "n": n,
+            "sequences_identical": True,
+            "standard_length": steps + 1,
+            "wormhole_length": steps + 1,
+            "entry_point_info": {"wormhole_used": False}
+        }
+    
+    # Wormhole tail: every stored value must be the next standard value
+    entry_point = current
+    entry_point_position = steps
+    for expected in get_wormhole_table().iter_sequence(entry_point, 1):
+        if current == 1:
+            return None  # The standard sequence is shorter
+        current = next_collatz_value(current)
+        steps += 1
+        if current != expected or steps >= MAX_COMPUTATION_STEPS:
+            return None
+    if current != 1:
+        return None  # The standard sequence is longer
+    
+    return {
+        "n": n,
+        "sequences_identical": True,
+        "standard_length": steps + 1,
+        "wormhole_length": steps + 1,
+        "entry_point_info": {
+            "entry_point_found": entry_point,
+            "entry_point_position": entry_point_position,
+            "wormhole_used": True,
+            "wormhole_length": get_wormhole_table().length(entry_point)
+        }
+    }
+
+def compare_sequences(n: int) -> dict:
+    """
+    Compare Collatz sequences generated by standard Colatz algorithm and wormhole algorithm.
+    
+    This function performs a comprehensive comparison between the traditional Collatz
+    sequence generation and the optimized wormhole approach to ensure mathematical
+    equivalence. It serves as a validation mechanism to verify that the wormhole
+    optimization produces identical results to the standard computation.
+    
+    The comparison includes:
+    - Sequence content verification (element-by-element comparison)
+    - Length validation
+    - First difference detection (if sequences differ)
+    - Wormhole usage statistics
+    
+    Args:
+        n (int): A positive integer for which to generate and compare sequences.
+                Must be already validated.
+    
+    Returns:
+        dict: Comprehensive comparison results containing:
+            - n (int): The input number that was analyzed
+            - sequences_identical (bool): Whether both sequences are exactly the same
+            - standard_length (int): Length of the standard algorithm sequence
+            - wormhole_length (int): Length of the wormhole algorithm sequence
+            - entry_point_info (dict): Information about wormhole usage from wormhole algorithm
+            
+            If sequences differ, additional fields are included:
+            - first_difference_position (int): Index where sequences first differ
+            - standard_value_at_diff: Value in standard sequence at difference position
+            - wormhole_value_at_diff: Value in wormhole sequence at difference position
+            - standard_sequence (list): Complete standard sequence for debugging
+            - wormhole_sequence (list): Complete wormhole sequence for debugging
+            
+            If error occurs:
+            - error (str): Description of the error that occurred
+    
+    Examples:
+        >>> result = compare_sequences(27)
+        >>> result['sequences_identical']
+        True
+        >>> result['entry_point_info']['wormhole_used']
+        True
+        
+        >>> result = compare_sequences(1)
+        >>> result['sequences_identical']
+        True
+        >>> result['entry_point_info']['wormhole_used']
+        False
+        
+    Notes:
+        - This function is critical for validating the correctness of wormhole optimization
+        - Sequences should always be identical if wormhole dictionary is correct
+        - Any difference indicates an error in the wormhole pre-computed sequences
+        - Used extensively in testing and validation workflows
+        - Provides detailed debugging information when discrepancies are found
+        - Identical sequences are checked in one pass by stream_compare_sequences();
+          both full sequences are only built to report a difference or an error
+    """
+    try:
+        # Fast path: single-pass check without materializing the sequences
+        result = stream_compare_sequences(n)
+        if result is not None:
+            return result
+        
+        # Generate sequences using both algorithms for comparison
+        standard_sequence = generate_standard_sequence(n)
+        wormhole_sequence, entry_point_info = generate_wormhole_sequence(n)
+        
+        # Perform element-by-element comparison of the sequences
+        sequences_match = standard_sequence == wormhole_sequence
+        
+        # Build basic comparison result structure
+        result = {
+            "n": n,
+            "sequences_identical": sequences_match,
+            "standard_length": len(standard_sequence),
+            "wormhole_length": len(wormhole_sequence),
+            "entry_point_info": entry_point_info
+        }
+        
+        # If sequences differ, provide detailed diagnostic information
+        if not sequences_match:
+            # Find the first position where sequences diverge
+            min_len = min(len(standard_sequence), len(wormhole_sequence))
+            first_diff_pos = None
+            
+            # Scan through sequences to locate first difference
+            for i in range(min_len):
+                if standard_sequence[i] != wormhole_sequence[i]:
+                    first_diff_pos = i
+                    break
+            
+            # Add detailed debugging information for sequence differences
+            result.update({
+                "first_difference_position": first_diff_pos,
+                "standard_value_at_diff": standard_sequence[first_diff_pos] if first_diff_pos is not None else None,
+                "wormhole_value_at_diff": wormhole_sequence[first_diff_pos] if first_diff_pos is not None else None,
+                "standard_sequence": standard_sequence,    # Full sequence for analysis
+                "wormhole_sequence": wormhole_sequence     # Full sequence for analysis
+            })
+        
+        return result
+        
+    except Exception as e:
+        # Handle any errors during sequence generation or comparison
+        return {
+            "n": n,
+            "sequences_identical": False,  # Mark as non-identical due to error
+            "error": str(e)                # Capture error details for debugging
+        }
+
+def validate_wormhole_sequence(n: int, entry_point_num: int, entry_point_position: int) -> Dict[str, any]:
+    """
+    Validate that a wormhole sequence matches the actual Collatz computation.
+    
+    This function performs mathematical verification of wormhole sequences stored
+    in the WORMHOLE_TABLE by computing the actual Collatz sequence from the entry point
+    and comparing it element-by-element with the pre-stored wormhole sequence.
+    This ensures the integrity and correctness of the wormholes.
+    
+    The validation process:
+    1. Retrieve the expected wormhole sequence from WORMHOLE_TABLE
+    2. Compute the actual Collatz sequence from the entry point
+    3. Compare sequences for length and content
+    4. Report any discrepancies with detailed diagnostic information
+    
+    Args:
+        n (int): The original input number (used for context/reporting)
+        entry_point_num (int): The number that serves as the wormhole entry point
+        entry_point_position (int): The step position where the entry point was reached
+    
+    Returns:
+        Dict[str, any]: Validation results containing:
+            - valid (bool): Whether the wormhole sequence is mathematically correct
+            - sequence_length (int): Length of validated sequence (if valid)
+            
+            If validation fails, additional diagnostic fields:
+            - error (str): Description of the validation failure
+            - actual_length (int): Length of computed sequence
+            - expected_length (int): Length of stored wormhole sequence
+            - position (int): First position where sequences differ (if applicable)
+            - actual_value: Value in computed sequence at difference position
+            - expected_value: Value in wormhole sequence at difference position
+            - actual_sequence (list): Complete computed sequence for debugging
+            - expected_sequence (list): Complete wormhole sequence for debugging
+    
+    Examples:
+        >>> validate_wormhole_sequence(27, 3, 1)
+        {'valid': True, 'sequence_length': 8}
+        
+        >>> # If wormhole had an error:
+        >>> validate_wormhole_sequence(100, 999, 5)
+        {'valid': False, 'error': 'Entry point 999 does not lead a valid wormhole'}
+        
+    Notes:
+        - This is a critical quality assurance function for wormhole integrity
+        - Re-walks the whole wormhole on every call; the hot paths use the cached verdicts
+          of get_wormhole_validation() instead
+        - Includes safety mechanisms to prevent infinite loops during validation
+        - Provides detailed debugging information when validation fails
+        - Essential for maintaining trust in the wormhole optimization results
+    """
+    # Check if the entry point exists in our wormhole table
+    if entry_point_num not in get_wormhole_table():
+        return {"valid": False, "error": f"Entry point {entry_point_num} does not lead a valid wormhole"}
+    
+    try:
+        # Expand the expected wormhole sequence from the table
+        expected_sequence = get_wormhole_table().sequence(entry_point_num)
+        
+        # Compute the actual Collatz sequence starting from the entry point
+        actual_sequence = []
+        current = entry_point_num
+        
+        # Generate actual sequence until reaching 1
+        while current != 1:
+            actual_sequence.append(current)
+            current = next_collatz_value(current)
+            
+            # Safety check to prevent infinite loops during validation
+            # Allow some tolerance beyond expected length for safety
+            if len(actual_sequence) > len(expected_sequence) + 100:
+                return {
+                    "valid": False, 
+                    "error": f"Actual sequence too long (>{len(expected_sequence) + 100})",
+                    "actual_length": len(actual_sequence),
+                    "expected_length": len(expected_sequence)
+                }
+        
+        # Add the final 1 to complete the actual sequence
+        actual_sequence.append(1)
+        return compare_wormhole_sequences(actual_sequence, expected_sequence)
+        
+    except Exception as e:
+        # Handle any computational errors during validation
+        return {
+            "valid": False,
+            "error": f"Validation failed: {str(e)}"
+        }
+
+def compare_wormhole_sequences(actual_sequence, expected_sequence: list) -> Dict[str, any]:
+    """
+    Compare the actual Collatz sequence of an entry point with its stored wormhole.
+    
+    Args:
+        actual_sequence: The computed sequence from the entry point down to 1 (list or array)
+        expected_sequence (list): The stored wormhole
+    
+    Returns:
+        Dict[str, any]: Validation results as described in validate_wormhole_sequence()
+    """
+    # Validate sequence lengths match
+    if len(actual_sequence) != len(expected_sequence):
+        return {
+            "valid": False,
+            "error": "Sequence lengths differ",
+            "actual_length": len(actual_sequence),
+            "expected_length": len(expected_sequence),
+            "actual_sequence": list(actual_sequence),
+            "expected_sequence": expected_sequence
+        }
+    
+    # Perform element-by-element validation
+    for i, (actual, expected) in enumerate(zip(actual_sequence, expected_sequence)):
+        if actual != expected:
+            return {
+                "valid": False,
+                "error": f"Sequences differ at position {i}",
+                "position": i,
+                "actual_value": actual,
+                "expected_value": expected,
+                "actual_sequence": list(actual_sequence),
+                "expected_sequence": expected_sequence
+            }
+    
+    # Validation successful - sequences are identical
+    return {
+        "valid": True,
+        "sequence_length": len(actual_sequence)
+    }
+
+def get_wormhole_validation(n: int, entry_point_num: int, entry_point_position: int) -> Dict[str, any]:
+    """
+    Return the validation verdict of a wormhole, verifying each entry point only once.
+    
+    A wormhole's correctness depends only on its entry point, not on the input n that
+    reached it, so the first use of each entry point runs validate_wormhole_sequence()
+    and stores the verdict in WORMHOLE_VALIDATION_CACHE. Every later use is an O(1)
+    dictionary lookup instead of a re-walk of the whole wormhole.
+    
+    When STRICT_REVALIDATE is enabled (see set_strict_revalidation and the
+    --strict-revalidate option), every call re-walks the wormhole as before, which
+    is useful for audits.
+    
+    Args:
+        n (int): The original input number (used for context/reporting)
+        entry_point_num (int): The number that serves as the wormhole entry point
+        entry_point_position (int): The step position where the entry point was reached
+    
+    Returns:
+        Dict[str, any]: Validation results as described in validate_wormhole_sequence().
+                        Cached verdicts are shared between calls and must not be modified.
+    
+    Examples:
+        >>> get_wormhole_validation(27, 121, 16)
+        {'valid': True, 'sequence_length': 96}
+    """
+    if STRICT_REVALIDATE:
+        return validate_wormhole_sequence(n, entry_point_num, entry_point_position)
+    
+    verdict = WORMHOLE_VALIDATION_CACHE.get(entry_point_num)
+    if verdict is None:
+        verdict = inherited_wormhole_validation(n, entry_point_num, entry_point_position)
+        WORMHOLE_VALIDATION_CACHE[entry_point_num] = verdict
+    return verdict
+
+def inherited_wormhole_validation(n: int, entry_point_num: int, entry_point_position: int) -> Dict[str, any]:
+    """
+    Validate an entry point, inheriting the verdict of its owner for an interior point.
+    
+    An interior point of an interior-point table (see WormholeTable.with_interior_points)
+    is a suffix of its owner's wormhole, so a valid owner makes it valid without
+    another walk. An invalid owner marks its interior points invalid as well.
+    
+    Args:
+        n (int): The original input number (used for context/reporting)
+        entry_point_num (int): The entry point reached
+        entry_point_position (int): The step position where the entry point was reached
+    
+    Returns:
+        Dict[str, any]: Validation results as described in validate_wormhole_sequence()
+    """
+    table = get_wormhole_table()
+    if table.owners is None or entry_point_num not in table:
+        return validate_wormhole_sequence(n, entry_point_num, entry_point_position)
+    owner, offset, _ = table.interior_point(entry_point_num)
+    if offset == 0:
+        return validate_wormhole_sequence(n, entry_point_num, entry_point_position)
+    
+    owner_verdict = WORMHOLE_VALIDATION_CACHE.get(owner)
+    if owner_verdict is None:
+        owner_verdict = validate_wormhole_sequence(owner, owner, 0)
+        WORMHOLE_VALIDATION_CACHE[owner] = owner_verdict
+    if not owner_verdict["valid"]:
+        return owner_verdict
+    return {"valid": True, "sequence_length": owner_verdict["sequence_length"] - offset}
+
+def verify_wormhole_table() -> Dict[int, Dict[str, any]]:
+    """
+    Validate every wormhole of WORMHOLE_TABLE up front and cache the verdicts.
+    
+    Returns:
+        Dict[int, Dict[str, any]]: Validation verdict per entry point
+    
+    Examples:
+        >>> all(verdict["valid"] for verdict in verify_wormhole_table().values())
+        True
+    """
+    for entry_point_num in get_wormhole_table().keys():
+        if entry_point_num not in WORMHOLE_VALIDATION_CACHE:
+            WORMHOLE_VALIDATION_CACHE[entry_point_num] = inherited_wormhole_validation(entry_point_num,
+                                                                                       entry_point_num, 0)
+    return dict(WORMHOLE_VALIDATION_CACHE)
+
+def m_value(x: int) -> int:
+    """
+    Return the m value of x, shared by the two members of a pseudocycle.
+    
+    m(x) = (x - 1) / 2 for odd x and (x - 2) / 2 for even x, so an odd value c
+    and c + 1 (or an even value c and c - 1) have the same m value.
+    
+    Examples:
+        >>> m_value(3), m_value(4)
+        (1, 1)
+    """
+    return (x - 1) >> 1 if x & 1 else (x - 2) >> 1
+
+def pseudocycle_partner(x: int) -> int:
+    """
+    Return the value that shares its m value with x (x + 1 for odd x, x - 1 for even x).
+    
+    Examples:
+        >>> pseudocycle_partner(7), pseudocycle_partner(18)
+        (8, 17)
+    """
+    return x + 1 if x & 1 else x - 1
+
+def generate_wormhole_dictionary(bound: int, base: dict = None) -> dict:
+    """
+    Derive wormhole entry points from the trajectories of every n up to bound.
+    
+    An entry point c has the structure recorded in DICTIONARY: walking its own
+    trajectory, the first m value that repeats is mr = m(c) itself, when the
+    pseudocycle partner c +- 1 is reached. A value whose first repeat is another,
+    nested pair (such as 9, whose trajectory meets the pair (14, 13) first) is
+    not an entry point. Every value of every scanned trajectory is tested, which
+    also finds entry points above bound. Before a new entry is added, its length is
+    checked against total_stopping_time_with_entry(), an engine that does not walk
+    the standard sequence.
+    
+    Args:
+        bound (int): Largest input whose trajectory is scanned
+        base (dict): DICTIONARY-style entries to extend (default: DICTIONARY)
+    
+    Returns:
+        dict: The base entries plus the new ones, in the DICTIONARY format, sorted by entry point
+    
+    Raises:
+        ComputationError: If a derived entry point fails the verification
+    
+    Examples:
+        >>> sorted(generate_wormhole_dictionary(100, {1: DICTIONARY[1]}))
+        [1, 3, 6, 7, 14, 15, 18, 19, 25, 33, 39, 51, 91, 121]
+        >>> sorted(set(generate_wormhole_dictionary(100)) - set(DICTIONARY))
+        []
+    
+    Notes:
+        - The trivial pair (2, 1) is not an entry point, as in DICTIONARY
+        - Entry points above OVERFLOW_THRESHOLD are skipped (see WormholeTable)
+        - The test is one backward pass per trajectory: position p is an entry point
+          when the next occurrence of its m value comes before the next occurrence of
+          the m value of any later position, so the cost grows linearly with bound
+        - From the base {1: DICTIONARY[1]}, scanning up to 7300 finds exactly the keys
+          of DICTIONARY; scanning up to 300000 finds no entry point beyond them
+    """
+    dictionary = dict(DICTIONARY if base is None else base)
+    no_repeat = float("inf")
+    
+    for n in range(1, bound + 1):
+        sequence = generate_standard_sequence(n)
+        
+        # Walk backwards: next_position is where the m value of position p occurs
+        # next, first_repeat the earliest such occurrence over all later positions
+        next_positions = {}
+        first_repeat = no_repeat
+        for position in range(len(sequence) - 1, -1, -1):
+            value = sequence[position]
+            mr = m_value(value)
+            next_position = next_positions.get(mr, no_repeat)
+            next_positions[mr] = position
+            is_entry_point = next_position < first_repeat
+            first_repeat = min(first_repeat, next_position)
+            if not is_entry_point or value <= 2 or value in dictionary or value > OVERFLOW_THRESHOLD:
+                continue
+            
+            # Verify the new entry with an independent engine before keeping it
+            wormhole = sequence[position:]
+            partner = sequence[next_position]
+            if (len(wormhole) - 1 != total_stopping_time_with_entry(value)[0] or wormhole[-1] != 1
+                    or partner != pseudocycle_partner(value)):
+                raise ComputationError(f"Derived entry point {value} fails verification")
+            dictionary[value] = {
+                "wormhole": wormhole,
+                "mr": mr,
+                "pseudocycle": [value, partner]
+            }
+    
+    return dict(sorted(dictionary.items()))
+
+def table_coverage(bound: int) -> tuple:
+    """
+    Measure how much WORMHOLE_TABLE helps on the inputs 1..bound.
+    
+    Args:
+        bound (int): Largest input of the measured range
+    
+    Returns:
+        tuple: (hit_rate, saved_steps) with the fraction of inputs that reach an
+               entry point and the total number of steps taken from wormholes
+    """
+    stopping_times, entry_points = compute_range(1, bound + 1, track_entry_points=True)
+    hits = 0
+    saved_steps = 0
+    for entry_point in entry_points:
+        if entry_point:
+            hits += 1
+            saved_steps += get_wormhole_table().stopping_time(entry_point)
+    return hits / bound, saved_steps
+
+def save_wormhole_dictionary(dictionary: dict, path: str) -> None:
+    """
+    Write a DICTIONARY-style table to a JSON file loadable with load_wormhole_dictionary().
+    
+    Args:
+        dictionary (dict): Mapping of entry point -> {"wormhole", "mr", "pseudocycle"}
+        path (str): Output file path
+    """
+    import json
+    
+    with open(path, "w") as table_file:
+        json.dump({str(key): entry for key, entry in dictionary.items()}, table_file, separators=(",", ":"))
+
+def load_wormhole_dictionary(path: str) -> dict:
+    """
+    Read a table written by save_wormhole_dictionary().
+    
+    Args:
+        path (str): JSON table file
+    
+    Returns:
+        dict: Mapping of entry point -> {"wormhole", "mr", "pseudocycle"}
+    
+    Raises:
+        ValidationError: If the file is not a valid wormhole table
+    """
+    import json
+    
+    try:
+        with open(path, "r") as table_file:
+            raw = json.load(table_file)
+        dictionary = {}
+        for key, entry in raw.items():
+            wormhole = [int(value) for value in entry["wormhole"]]
+            if not wormhole or wormhole[0] != int(key) or wormhole[-1] != 1:
+                raise ValueError(f"wormhole of {key} must start at {key} and end at 1")
+            dictionary[int(key)] = {"wormhole": wormhole, "mr": entry["mr"], "pseudocycle": entry["pseudocycle"]}
+    except (OSError, KeyError, TypeError, ValueError, AttributeError) as e:
+        raise ValidationError(f"Invalid wormhole table {path}: {e}") from e
+    return dictionary
+
+def load_wormhole_table(path: str) -> WormholeTable:
+    """
+    Load a table file in either supported format.
+    
+    Binary files written by WormholeTable.save() are memory-mapped; any other
+    file is read as the JSON format of save_wormhole_dictionary().
+    
+    Args:
+        path (str): Table file
+    
+    Returns:
+        WormholeTable: The loaded table
+    
+    Raises:
+        ValidationError: If the file cannot be read or is not a valid table
+    """
+    try:
+        with open(path, "rb") as table_file:
+            magic = table_file.read(len(TABLE_FILE_MAGIC))
+    except OSError as e:
+        raise ValidationError(f"Invalid wormhole table {path}: {e}") from e
+    if magic == TABLE_FILE_MAGIC:
+        return WormholeTable.from_file(path)
+    return WormholeTable.from_dictionary(load_wormhole_dictionary(path))
+
+def table_to_dictionary(table: WormholeTable) -> dict:
+    """
+    Expand a table into the DICTIONARY format, deriving mr and pseudocycle from each key.
+    
+    Args:
+        table (WormholeTable): The table to expand
+    
+    Returns:
+        dict: Mapping of entry point -> {"wormhole", "mr", "pseudocycle"}
+    """
+    dictionary = {}
+    for key in sorted(table.keys()):
+        partner = 1 if key == 1 else pseudocycle_partner(key)
+        dictionary[key] = {
+            "wormhole": table.sequence(key),
+            "mr": m_value(key) if key != 1 else 0,
+            "pseudocycle": [key, partner]
+        }
+    return dictionary
+
+def set_wormhole_table(table: WormholeTable) -> None:
+    """
+    Replace the wormhole table used by every engine.
+    
+    The cached validation verdicts belong to the previous table and are cleared.
+    
+    Args:
+        table (WormholeTable): The new table
+    
+    Examples:
+        >>> set_wormhole_table(WormholeTable.from_dictionary(generate_wormhole_dictionary(1000)))
+    """
+    global WORMHOLE_TABLE
+    WORMHOLE_TABLE = table
+    WORMHOLE_VALIDATION_CACHE.clear()
+
+def configure_limits(max_input_value: int = None,
+                     max_computation_steps: int = DEFAULT_MAX_COMPUTATION_STEPS) -> None:
+    """
+    Set the input and trajectory limits used by every engine.
+    
+    Args:
+        max_input_value (int): Largest accepted input, or None to accept any positive
+                              integer (the arbitrary-precision engine handles them)
+        max_computation_steps (int): Largest number of steps walked for one input
+    
+    Raises:
+        ValueError: If a limit is not a positive integer
+    
+    Examples:
+        >>> configure_limits(max_input_value=2**50)   # The historical input limit
+        >>> configure_limits(max_computation_steps=100000)
+    """
+    global MAX_INPUT_VALUE, MAX_COMPUTATION_STEPS
+    if max_input_value is not None and max_input_value < 1:
+        raise ValueError(f"Maximum input value must be positive, got {max_input_value}")
+    if max_computation_steps < 1:
+        raise ValueError(f"Maximum computation steps must be positive, got {max_computation_steps}")
+    MAX_INPUT_VALUE = max_input_value
+    MAX_COMPUTATION_STEPS = max_computation_steps
+
+def set_strict_revalidation(enabled: bool) -> None:
+    """
+    Enable or disable re-walking every wormhole each time it is used.
+    
+    Args:
+        enabled (bool): True to re-validate on every use, False to use cached verdicts
+    """
+    global STRICT_REVALIDATE
+    STRICT_REVALIDATE = enabled
+
+class StoppingTimeMemo:
+    """
+    Bounded memo table of total stopping times shared across calls.
+    
+    The memo records the stopping time of every value resolved by a wormhole walk,
+    so later walks can stop at the first value whose remaining distance to 1 is
+    already known. When a walk from n reaches a memoized value m after k steps,
+    the total stopping time of n is k plus the stored stopping time of m.
+    
+    Memory is bounded by max_size entries. Entries are kept in least-recently-used
+    order and the oldest entries are evicted once the table is full, so batch runs
+    over increasing ranges keep the recently resolved (small) values that most
+    trajectories fall into.
+    
+    Attributes:
+        max_size (int): Maximum number of stored values
+        hits (int): Lookups that found a stored stopping time
+        misses (int): Lookups that found nothing
+        evictions (int): Entries removed to respect max_size
+    
+    Examples:
+        >>> memo = StoppingTimeMemo(max_size=1000)
+        >>> calculate_wormhole_total_stopping_time(27, memo=memo)["total_stopping_time"]
+        111
+        >>> calculate_wormhole_total_stopping_time(54, memo=memo)["prediction_type"]
+        'memo_hit'
+        >>> memo.stats()
+        {'size': 17, 'max_size': 1000, 'hits': 1, 'misses': 17, 'evictions': 0, 'hit_rate': 0.0556}
+    
+    Notes:
+        - Opt-in: pass an instance to calculate_wormhole_total_stopping_time(memo=...)
+        - Hit and miss counters are per lookup (one lookup per computed step)
+        - Wormhole entry points are still checked first, so entry point usage is unchanged
+          whenever the entry point is reached before a memoized value
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MEMO_SIZE):
+        if max_size < 1:
+            raise ValueError(f"Memo size must be positive, got {max_size}")
+        self.max_size = max_size
+        self.table = OrderedDict()  # value -> total stopping time, oldest first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, value: int) -> bool:
+        return value in self.table
+
+    def get(self, value: int):
+        """
+        Return the stored stopping time of value, or None if it is not memoized.
+        
+        A hit marks the entry as most recently used.
+        """
+        stopping_time = self.table.get(value)
+        if stopping_time is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.table.move_to_end(value)
+        return stopping_time
+
+    def record(self, path: list, total_stopping_time: int) -> None:
+        """
+        Store the stopping times of the values visited by one walk.
+        
+        Args:
+            path (list): Values visited in order, starting with the input number
+            total_stopping_time (int): Total stopping time of path[0]; the value at
+                                      position i has stopping time total - i
+        """
+        table = self.table
+        for position, value in enumerate(path):
+            table[value] = total_stopping_time - position
+            table.move_to_end(value)
+        # Evict least recently used values beyond the configured bound
+        while len(table) > self.max_size:
+            table.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self.table.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Return the memo counters.
+        
+        Returns:
+            dict: size, max_size, hits, misses, evictions and hit_rate (hits per lookup)
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.table),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+def batch_collatz_walk(values: list, stop_at_entry_points: bool = False) -> tuple:
+    """
+    Advance many Collatz trajectories in lock-step with a vectorized NumPy kernel.
+    
+    All values are stored in one uint64 array and advanced together: the parity
+    mask selects between the halving shift and the 3n+1 update, and lanes retire
+    as soon as they reach 1 (or a WORMHOLE_TABLE entry point when stop_at_entry_points
+    is set, found with a searchsorted lookup in the sorted keys). Retired lanes are
+    compacted away, so every iteration only touches the trajectories still running.
+    
+    Args:
+        values (list): Validated positive integers (at most OVERFLOW_THRESHOLD)
+        stop_at_entry_points (bool): Retire lanes at the first wormhole entry point
+    
+    Returns:
+        tuple: A 3-tuple of NumPy arrays aligned with values:
+            - steps (int64): Steps walked by each lane until it retired
+            - exits (uint64): Value at which each lane retired (1, an entry point,
+              or the value that triggered an error)
+            - status (int8): How each lane retired, one of BATCH_REACHED_ONE,
+              BATCH_ENTRY_POINT, BATCH_OVERFLOW or BATCH_TOO_LONG
+    
+    Raises:
+        ComputationError: If NumPy is not installed
+    
+    Examples:
+        >>> steps, exits, status = batch_collatz_walk([27, 28, 1])
+        >>> steps.tolist(), exits.tolist()
+        ([111, 18, 0], [1, 1, 1])
+        >>> steps, exits, status = batch_collatz_walk([27, 28], stop_at_entry_points=True)
+        >>> steps.tolist(), exits.tolist()
+        ([16, 1], [121, 14])
+        >>> saved_table = get_wormhole_table()
+        >>> set_wormhole_table(WormholeTable.from_dictionary({1: DICTIONARY[1]}))
+        >>> batch_collatz_walk([3, 5], stop_at_entry_points=True)[0].tolist()
+        [7, 5]
+        >>> set_wormhole_table(saved_table)
+    
+    Notes:
+        - Lanes whose odd value exceeds OVERFLOW_THRESHOLD retire with BATCH_OVERFLOW,
+          since the next 3n+1 step could leave the uint64 range; callers continue
+          them with the arbitrary-precision scalar engine
+        - Lanes exceeding MAX_COMPUTATION_STEPS retire with BATCH_TOO_LONG
+        - The value 1 is never treated as an entry point
+    """
+    if load_numpy() is None:
+        raise ComputationError("NumPy is required for the batch kernel")
+    
+    count = len(values)
+    steps_out = np.zeros(count, dtype=np.int64)
+    exits_out = np.zeros(count, dtype=np.uint64)
+    status_out = np.zeros(count, dtype=np.int8)
+    
+    # Working set of active lanes: original index, current value and steps walked
+    lanes = np.arange(count)
+    current = np.array(values, dtype=np.uint64)
+    steps = np.zeros(count, dtype=np.int64)
+    keys = np.array(sorted(key for key in get_wormhole_table().keys() if key != 1), dtype=np.uint64)
+    if not keys.size:
+        # A table without any key but 1 has no entry point to stop at (and nothing to search)
+        stop_at_entry_points = False
+    
+    while current.size:
+        # Lanes over the step limit fail before any other check, as in the scalar walkers
+        too_long = steps > MAX_COMPUTATION_STEPS
+        
+        # Lanes that reached the trivial cycle or a wormhole entry point
+        reached_one = current == 1
+        if stop_at_entry_points:
+            positions = np.minimum(np.searchsorted(keys, current), keys.size - 1)
+            at_entry = keys[positions] == current
+            finished = (reached_one | at_entry) & ~too_long
+        else:
+            finished = reached_one & ~too_long
+        
+        # Lanes whose next 3n+1 step would leave the supported range
+        odd = (current & 1).astype(bool)
+        overflow = odd & (current > OVERFLOW_THRESHOLD) & ~finished & ~too_long
+        
+        retired = finished | overflow | too_long
+        if retired.any():
+            # Record the retired lanes, then compact the working set
+            retired_lanes = lanes[retired]
+            steps_out[retired_lanes] = steps[retired]
+            exits_out[retired_lanes] = current[retired]
+            status = np.full(retired_lanes.size, BATCH_REACHED_ONE, dtype=np.int8)
+            if stop_at_entry_points:
+                status[at_entry[retired] & ~reached_one[retired]] = BATCH_ENTRY_POINT
+            status[overflow[retired]] = BATCH_OVERFLOW
+            status[too_long[retired]] = BATCH_TOO_LONG
+            status_out[retired_lanes] = status
+            
+            active = ~retired
+            lanes = lanes[active]
+            current = current[active]
+            steps = steps[active]
+            odd = odd[active]
+        
+        # Apply one Collatz step to every active lane at once
+        current = np.where(odd, current * 3 + 1, current >> 1)
+        steps += 1
+    
+    return steps_out, exits_out, status_out
+
+def calculate_batch_total_stopping_times(values, algorithm: str = "wormhole") -> list:
+    """
+    Calculate the total stopping times of many inputs with the batch kernel.
+    
+    This is the batch= path of calculate_standard_total_stopping_time() and
+    calculate_wormhole_total_stopping_time(). Every input is validated with
+    validate_input(), the valid ones are advanced together by batch_collatz_walk(),
+    and the result dictionaries are identical to those of the scalar functions.
+    When NumPy is not installed, each input goes through the scalar function instead.
+    
+    Args:
+        values: Iterable of inputs (int, str or float, as accepted by validate_input)
+        algorithm (str): "standard" or "wormhole"
+    
+    Returns:
+        list: One result dictionary per input, in input order
+    
+    Examples:
+        >>> results = calculate_batch_total_stopping_times([27, "28", 0])
+        >>> [result["total_stopping_time"] for result in results]
+        [111, 18, -1]
+    """
+    scalar_function = (calculate_wormhole_total_stopping_time if algorithm == "wormhole"
+                       else calculate_standard_total_stopping_time)
+    values = list(values)
+    
+    # Degrade gracefully to the scalar implementation without NumPy
+    if load_numpy() is None:
+        return [scalar_function(value) for value in values]
+    
+    # Invalid inputs and the trivial case keep the scalar result, the rest go to the kernel
+    results = [None] * len(values)
+    pending_indices = []
+    pending_values = []
+    for index, value in enumerate(values):
+        try:
+            n_val = validate_input(value)
+        except ValidationError:
+            results[index] = scalar_function(value)
+            continue
+        if n_val == 1 or n_val > OVERFLOW_THRESHOLD:
+            # Trivial case, or too large for the uint64 lanes: arbitrary-precision scalar engine
+            results[index] = scalar_function(n_val)
+            continue
+        pending_indices.append(index)
+        pending_values.append(n_val)
+    
+    if not pending_values:
+        return results
+    
+    steps, exits, status = batch_collatz_walk(pending_values, stop_at_entry_points=(algorithm == "wormhole"))
+    for lane, index in enumerate(pending_indices):
+        lane_steps = int(steps[lane])
+        lane_status = status[lane]
+        
+        if lane_status == BATCH_OVERFLOW:
+            # The trajectory leaves the uint64 range: hand the input to the scalar bigint engine
+            results[index] = scalar_function(pending_values[lane])
+        elif lane_status == BATCH_TOO_LONG:
+            # Same error reporting as the scalar functions
+            results[index] = {
+                "total_stopping_time": -1,
+                "algorithm": algorithm,
+                "prediction_type": "error",
+                "error_message": f"Exceeded {MAX_COMPUTATION_STEPS} steps",
+                "computed_steps": lane_steps,  # MAX_COMPUTATION_STEPS + 1, as in the scalar functions
+                "saved_steps": 0
+            }
+        elif lane_status == BATCH_ENTRY_POINT:
+            entry_point = int(exits[lane])
+            wormhole_steps = get_wormhole_table().stopping_time(entry_point)
+            result = {
+                "total_stopping_time": lane_steps + wormhole_steps,
+                "algorithm": "wormhole",
+                "prediction_type": "entry_point_found",
+                "entry_point_found": entry_point,
+                "entry_point_position": lane_steps,
+                "computed_steps": lane_steps,
+                "saved_steps": wormhole_steps,
+                "wormhole_length": wormhole_steps + 1
+            }
+            validation_result = get_wormhole_validation(pending_values[lane], entry_point, lane_steps)
+            result["validation"] = validation_result
+            if not validation_result["valid"]:
+                result["prediction_type"] = "validation_failed"
+                result["validation_error"] = validation_result.get("error", "Unknown validation error")
+            results[index] = result
+        else:
+            results[index] = {
+                "total_stopping_time": lane_steps,
+                "algorithm": algorithm,
+                "prediction_type": "no_entry_point" if algorithm == "wormhole" else "complete",
+                "computed_steps": lane_steps,
+                "saved_steps": 0
+            }
+    
+    return results
+
+def validate_fast_input(n: int) -> None:
+    """
+    Check the input of the fast path functions without any type coercion.
+    
+    Args:
+        n (int): The input number
+    
+    Raises:
+        ValidationError: If n is not an int, is not positive, or exceeds MAX_INPUT_VALUE (if set)
+    """
+    if not isinstance(n, int):
+        raise ValidationError(f"Expected int, got {type(n).__name__}")
+    if n <= 0:
+        raise ValidationError(f"n must be positive, got {n}")
+    if MAX_INPUT_VALUE is not None and n > MAX_INPUT_VALUE:
+        raise ValidationError(f"n={n} too large (limit: {MAX_INPUT_VALUE})")
+
+def big_collatz_descent(current: int, floor: int, max_steps: int) -> tuple:
+    """
+    Arbitrary-precision engine: walk a large value down to the native range.
+    
+    Values above floor are advanced with whole runs of halvings at once: the
+    trailing zeros of an even value are counted with (n & -n).bit_length() - 1
+    and stripped with a single shift. Shifts are shortened so that the walk
+    stops at the first value that is at most floor, which means every skipped
+    value is above floor and the caller still sees every small value of the
+    trajectory (wormhole entry points, memoized values, 1).
+    
+    Args:
+        current (int): The current value, typically above floor
+        floor (int): Values at most floor are handed back to the caller
+        max_steps (int): Step budget; the walk stops once it is exceeded
+    
+    Returns:
+        tuple: (value, steps) with the first value at most floor (or the value
+               reached when the budget ran out) and the steps walked to get there
+    
+    Examples:
+        >>> big_collatz_descent(2**100, OVERFLOW_THRESHOLD, MAX_COMPUTATION_STEPS)
+        (1152921504606846976, 40)
+    """
+    floor_bits = floor.bit_length()
+    steps = 0
+    while current > floor and steps <= max_steps:
+        if current & 1:
+            current = 3 * current + 1
+            steps += 1
+        # Strip all factors of 2 at once, without jumping over values at most floor
+        shift = min((current & -current).bit_length() - 1, current.bit_length() - 1 - floor_bits)
+        if shift < 1:
+            shift = 1
+        current >>= shift
+        steps += shift
+    return current, steps
+
+def total_stopping_time_with_entry(n: int) -> tuple:
+    """
+    Fast path: wormhole total stopping time plus the entry point used, as plain values.
+    
+    This is the core of calculate_wormhole_total_stopping_time() without string/float
+    coercion, result dictionaries or nested validation results. It walks the
+    trajectory until it reaches 1 or the first entry point of WORMHOLE_TABLE.
+    
+    Args:
+        n (int): A positive integer (at most MAX_INPUT_VALUE)
+    
+    Returns:
+        tuple: (total_stopping_time, entry_point, entry_point_position), where
+               entry_point and entry_point_position are None if no wormhole was used
+    
+    Raises:
+        ValidationError: If n is not a positive int within MAX_INPUT_VALUE
+        ComputationError: If the walk exceeds MAX_COMPUTATION_STEPS
+    
+    Examples:
+        >>> total_stopping_time_with_entry(27)
+        (111, 121, 16)
+        >>> total_stopping_time_with_entry(2)
+        (1, None, None)
+    
+    Notes:
+        - The wormhole table is trusted here; its verdicts are available from
+          get_wormhole_validation() or verify_wormhole_table()
+    """
+    validate_fast_input(n)
+    
+    wormhole_steps_by_key = get_wormhole_table().stopping_times
+    odd_cores = get_wormhole_table().odd_cores
+    current = n
+    steps = 0
+    while current != 1:
+        # Wormhole entry point: the rest of the trajectory is known
+        if current in wormhole_steps_by_key:
+            return steps + wormhole_steps_by_key[current], current, steps
+        
+        # Apply the Collatz transformation inline, with the bigint engine above the native range
+        if current & 1:
+            if current > OVERFLOW_THRESHOLD:
+                current, big_steps = big_collatz_descent(current, OVERFLOW_THRESHOLD, MAX_COMPUTATION_STEPS - steps)
+                steps += big_steps
+            else:
+                current = 3 * current + 1
+                steps += 1
+        else:
+            # Strip all trailing zeros at once, stopping early at the first entry point
+            # core * 2^e among the skipped values (same odd core, smaller exponent)
+            shift = (current & -current).bit_length() - 1
+            exponents = odd_cores.get(current >> shift)
+            if exponents is not None:
+                for exponent in exponents:
+                    if exponent < shift:
+                        shift -= exponent
+                        break
+            current >>= shift
+            steps += shift
+        
+        # Safety mechanism to prevent infinite computation
+        if steps > MAX_COMPUTATION_STEPS:
+            raise ComputationError(f"Exceeded {MAX_COMPUTATION_STEPS} steps", MAX_COMPUTATION_STEPS + 1)
+    
+    return steps, None, None
+
+def total_stopping_time(n: int, memo: StoppingTimeMemo = None) -> int:
+    """
+    Fast path: wormhole total stopping time of n as a plain int.
+    
+    Args:
+        n (int): A positive integer (at most MAX_INPUT_VALUE)
+        memo (StoppingTimeMemo): Optional memo table shared across calls
+    
+    Returns:
+        int: The number of steps for n to reach 1
+    
+    Raises:
+        ValidationError: If n is not a positive int within MAX_INPUT_VALUE
+        ComputationError: If the walk exceeds MAX_COMPUTATION_STEPS
+    
+    Examples:
+        >>> total_stopping_time(27)
+        111
+        >>> [total_stopping_time(n) for n in range(1, 10)]
+        [0, 1, 7, 2, 5, 8, 16, 3, 19]
+    """
+    if memo is not None:
+        validate_fast_input(n)
+        return walk_with_memo(n, memo)[0]
+    return total_stopping_time_with_entry(n)[0]
+
+def walk_with_memo(n: int, memo: StoppingTimeMemo) -> tuple:
+    """
+    Wormhole walk that also stops at memoized values and records the values it computed.
+    
+    Args:
+        n (int): A validated positive integer
+        memo (StoppingTimeMemo): The memo table to read and update
+    
+    Returns:
+        tuple: (total_stopping_time, prediction_type, stop_value, stop_position) where
+               prediction_type is "entry_point_found", "memo_hit" or "no_entry_point",
+               and stop_value/stop_position describe the entry point or memoized value
+               that ended the walk (None when the walk reached 1)
+    
+    Raises:
+        ComputationError: If the walk exceeds MAX_COMPUTATION_STEPS
+    """
+    wormhole_steps_by_key = get_wormhole_table().stopping_times
+    current = n
+    steps = 0
+    path = []      # Computed values, recorded in the memo once the walk is resolved
+    segments = []  # Earlier (path, first position) runs, split where the bigint engine skipped values
+    path_start = 0
+    while current != 1:
+        # Wormhole entry points take precedence, so entry point usage is unchanged
+        if current in wormhole_steps_by_key:
+            total_steps = steps + wormhole_steps_by_key[current]
+            # Only memoize results backed by a valid wormhole
+            if get_wormhole_validation(n, current, steps)["valid"]:
+                record_memo_segments(memo, segments + [(path, path_start)], total_steps)
+            return total_steps, "entry_point_found", current, steps
+        
+        # Value whose stopping time was resolved by an earlier walk
+        remaining_steps = memo.get(current)
+        if remaining_steps is not None:
+            total_steps = steps + remaining_steps
+            record_memo_segments(memo, segments + [(path, path_start)], total_steps)
+            return total_steps, "memo_hit", current, steps
+        path.append(current)
+        
+        # Apply the Collatz transformation inline, with the bigint engine above the native range
+        if current & 1:
+            if current > OVERFLOW_THRESHOLD:
+                current, big_steps = big_collatz_descent(current, OVERFLOW_THRESHOLD, MAX_COMPUTATION_STEPS - steps)
+                steps += big_steps
+                segments.append((path, path_start))
+                path = []
+                path_start = steps
+            else:
+                current = 3 * current + 1
+                steps += 1
+        else:
+            current >>= 1
+            steps += 1
+        
+        # Safety mechanism to prevent infinite computation
+        if steps > MAX_COMPUTATION_STEPS:
+            raise ComputationError(f"Exceeded {MAX_COMPUTATION_STEPS} steps", MAX_COMPUTATION_STEPS + 1)
+    
+    record_memo_segments(memo, segments + [(path, path_start)], steps)
+    return steps, "no_entry_point", None, None
+
+def record_memo_segments(memo: StoppingTimeMemo, segments: list, total_stopping_time: int) -> None:
+    """
+    Record the runs of consecutive values of one walk in a memo table.
+    
+    Args:
+        memo (StoppingTimeMemo): The memo table to update
+        segments (list): (path, first position) pairs, where path holds consecutive
+                        trajectory values starting at that position of the walk
+        total_stopping_time (int): Total stopping time of the walk's input
+    """
+    for path, first_position in segments:
+        if path:
+            memo.record(path, total_stopping_time - first_position)
+
+def calculate_wormhole_total_stopping_time(n: Union[int, str, float], memo: StoppingTimeMemo = None,
+                                           batch: bool = False) -> Dict[str, any]:
+    """
+    Calculate the total stopping time for Collatz sequence using wormhole optimization.
+    
+    This is the main computational function that implements the wormhole algorithm
+    to efficiently calculate the total stopping time (number of steps to reach 1)
+    for a given input. The function combines input validation, wormhole detection,
+    and mathematical verification to provide both speed and accuracy.
+    
+    Algorithm workflow:
+    1. Validate and convert input to proper integer format
+    2. Handle trivial case (n=1) immediately
+    3. Iterate through Collatz steps, checking for wormhole entry points
+    4. When wormhole found: calculate total time using pre-computed data
+    5. Validate wormhole accuracy to ensure mathematical correctness
+    6. Fall back to standard computation if no wormhole available
+    
+    Args:
+        n (Union[int, str, float]): The input number for which to calculate
+                                   total stopping time. Can be string, float, or int.
+        memo (StoppingTimeMemo): Optional memo table. When given, the walk also stops at
+                                the first value with a memoized stopping time, and the
+                                stopping times of all computed values are recorded.
+        batch (bool): When True, n is an iterable of inputs and a list with one result
+                     dictionary per input is returned. Inputs are advanced together by
+                     the NumPy batch kernel (see calculate_batch_total_stopping_times),
+                     or one by one when NumPy is missing or a memo is given.
+    
+    Returns:
+        Dict[str, any]: Comprehensive results containing:
+            - total_stopping_time (int): Number of steps to reach 1 (-1 if error)
+            - algorithm (str): Always "wormhole" to identify the method used
+            - prediction_type (str): Type of result achieved:
+                * "trivial": Input was 1 (0 steps)
+                * "entry_point_found": Wormhole was successfully used
+                * "no_entry_point": No wormhole available, computed to completion
+                * "memo_hit": A value with a memoized stopping time was reached
+                * "validation_failed": Wormhole found but failed validation
+                * "error": Input validation or computation error occurred
+            - computed_steps (int): Steps calculated before using wormhole
+            - saved_steps (int): Steps saved by using wormhole optimization
+            
+            Additional fields when wormhole is used:
+            - entry_point_found (int): The number that triggered wormhole usage
+            - entry_point_position (int): Step where wormhole entry was reached
+            - wormhole_length (int): Total length of the wormhole sequence
+            - validation (dict): Results from wormhole mathematical verification
+            
+            Additional fields when the memo is used:
+            - memo_hit_value (int): The memoized value that ended the walk
+            - memo_hit_position (int): Step where the memoized value was reached
+            
+            Additional fields when errors occur:
+            - error_message (str): Detailed description of the error
+            - validation_error (str): Specific validation error (if applicable)
+    
+    Examples:
+        >>> calculate_wormhole_total_stopping_time(27)
+        {
+            'total_stopping_time': 111,
+            'algorithm': 'wormhole',
+            'prediction_type': 'entry_point_found',
+            'entry_point_found': 91,
+            'entry_point_position': 27,
+            'computed_steps': 27,
+            'saved_steps': 84,
+            'wormhole_length': 85,
+            'validation': {'valid': True, 'sequence_length': 85}
+        }
+        
+        >>> calculate_wormhole_total_stopping_time(1)
+        {
+            'total_stopping_time': 0,
+            'algorithm': 'wormhole',
+            'prediction_type': 'trivial',
+            'computed_steps': 0,
+            'saved_steps': 0
+        }
+        
+        >>> calculate_wormhole_total_stopping_time("invalid")
+        {
+            'total_stopping_time': -1,
+            'algorithm': 'wormhole',
+            'prediction_type': 'error',
+            'error_message': 'Invalid number format: invalid',
+            'computed_steps': 0,
+            'saved_steps': 0
+        }
+    
+    Notes:
+        - This function provides the main interface for wormhole-optimized computation
+        - Includes comprehensive error handling and input validation
+        - Always validates wormhole results to ensure mathematical accuracy; each entry point
+          is verified once and its verdict cached (see get_wormhole_validation)
+        - Gracefully falls back to standard computation when no optimization available
+        - Tracks computational efficiency metrics (computed vs saved steps)
+        - With a memo, saved_steps counts the steps taken from the memo table
+        - Thin wrapper over total_stopping_time_with_entry(); use the fast paths
+          total_stopping_time() and total_stopping_time_with_entry() to avoid building dicts
+        - Essential for demonstrating the performance benefits of wormhole optimization
+    """
+    # Batch path: many inputs at once through the vectorized kernel
+    if batch:
+        if memo is not None:
+            return [calculate_wormhole_total_stopping_time(value, memo=memo) for value in n]
+        return calculate_batch_total_stopping_times(n, algorithm="wormhole")
+    
+    # Validate and convert input to proper integer format
+    try:
+        n_val = validate_input(n)
+    except ValidationError as e:
+        # Return error result with diagnostic information
+        return {
+            "total_stopping_time": -1,
+            "algorithm": "wormhole",
+            "prediction_type": "error",
+            "error_message": str(e),
+            "computed_steps": 0,
+            "saved_steps": 0
+        }
+    
+    # Handle trivial case where input is already 1
+    if n_val == 1:
+        return {
+            "total_stopping_time": 0,
+            "algorithm": "wormhole",
+            "prediction_type": "trivial",
+            "computed_steps": 0,
+            "saved_steps": 0
+        }
+    
+    try:
+        # Walk with the fast path (or the memoized walk) and wrap the plain results
+        if memo is None:
+            total_steps, stop_value, stop_position = total_stopping_time_with_entry(n_val)
+            prediction_type = "entry_point_found" if stop_value is not None else "no_entry_point"
+        else:
+            total_steps, prediction_type, stop_value, stop_position = walk_with_memo(n_val, memo)
+    except (ComputationError, ValidationError) as e:
+        # Handle computation errors with diagnostic information
+        return {
+            "total_stopping_time": -1,
+            "algorithm": "wormhole",
+            "prediction_type": "error",
+            "error_message": str(e),
+            "computed_steps": getattr(e, "steps", 0),  # Steps walked before the failure
+            "saved_steps": 0
+        }
+    
+    if prediction_type == "memo_hit":
+        # The walk ended at a value whose stopping time was already memoized
+        return {
+            "total_stopping_time": total_steps,
+            "algorithm": "wormhole",
+            "prediction_type": "memo_hit",
+            "memo_hit_value": stop_value,                  # Which value ended the walk
+            "memo_hit_position": stop_position,            # When it was reached
+            "computed_steps": stop_position,               # Steps calculated manually
+            "saved_steps": total_steps - stop_position     # Steps taken from the memo
+        }
+    
+    if prediction_type != "entry_point_found":
+        # Reached 1 without finding any wormhole entry point
+        return wormhole_result_from_walk(total_steps)
+    
+    # Validate wormhole mathematical correctness (cached verdict per entry point)
+    validation_result = get_wormhole_validation(n_val, stop_value, stop_position)
+    return wormhole_result_from_walk(total_steps, stop_value, stop_position, validation_result)
+
+def wormhole_result_from_walk(total_steps: int, entry_point: int = None, entry_point_position: int = None,
+                              validation_result: dict = None) -> dict:
+    """
+    Build the calculate_wormhole_total_stopping_time() result of a walk from n > 1.
+    
+    Args:
+        total_steps (int): Total stopping time of n
+        entry_point (int): First wormhole entry point reached, None if there is none
+        entry_point_position (int): Step at which entry_point was reached
+        validation_result (dict): Validation verdict of the entry point's wormhole
+    
+    Returns:
+        dict: An "entry_point_found" (or "validation_failed") result, or a
+              "no_entry_point" result when entry_point is None
+    """
+    if entry_point is not None:
+        # Wormhole entry point found: build comprehensive result with wormhole usage information
+        wormhole_steps = total_steps - entry_point_position  # Steps after the entry point
+        result = {
+            "total_stopping_time": total_steps,
+            "algorithm": "wormhole",
+            "prediction_type": "entry_point_found",
+            "entry_point_found": entry_point,                  # Which number triggered wormhole
+            "entry_point_position": entry_point_position,      # When wormhole was found
+            "computed_steps": entry_point_position,            # Steps calculated manually
+            "saved_steps": wormhole_steps,                     # Steps saved by optimization
+            "wormhole_length": wormhole_steps + 1,             # Size of wormhole used
+            "validation": validation_result
+        }
+        
+        # Check if validation failed and update prediction type accordingly
+        if not validation_result["valid"]:
+            result["prediction_type"] = "validation_failed"
+            result["validation_error"] = validation_result.get("error", "Unknown validation error")
+        
+        return result
+    
+    # Reached 1 without finding any wormhole entry point
+    return {
+        "total_stopping_time": total_steps,
+        "algorithm": "wormhole",
+        "prediction_type": "no_entry_point",
+        "computed_steps": total_steps,
+        "saved_steps": 0
+    }
+
+class Trace:
+    """
+    One walk of the trajectory of n, shared by every part of the single-n analysis.
+    
+    The standard trajectory is walked once and stored, and the first wormhole
+    entry point on it is noted during the same walk. The standard result, the
+    wormhole result, the wormhole validation and the displayed sequences are all
+    derived from this one walk instead of walking the trajectory again for each.
+    
+    Values are stored in an array('Q') (8 bytes per value) and moved to a list
+    only if the trajectory leaves the 64-bit range.
+    
+    Attributes:
+        n (int): The input value
+        values (array): The standard sequence from n down to 1
+        entry_point (int): First wormhole entry point of the trajectory, None if there is none
+        entry_point_position (int): Step at which entry_point is reached, None if there is none
+    
+    Raises:
+        ComputationError: If the trajectory exceeds MAX_COMPUTATION_STEPS
+    
+    Examples:
+        >>> trace = Trace(27)
+        >>> len(trace.values), trace.entry_point, trace.entry_point_position
+        (112, 121, 16)
+        >>> trace.wormhole_result() == calculate_wormhole_total_stopping_time(27)
+        True
+    """
+    __slots__ = ("n", "values", "entry_point", "entry_point_position")
+
+    def __init__(self, n: int):
+        entry_points = get_wormhole_table().stopping_times
+        values = array("Q")
+        append = values.append
+        entry_point = None
+        entry_point_position = None
+        current = n
+        steps = 0
+        while True:
+            try:
+                append(current)
+            except OverflowError:
+                # Beyond 64 bits: keep the rest of the trajectory as Python integers
+                values = list(values)
+                append = values.append
+                append(current)
+            if current == 1:
+                break
+            if entry_point is None and current in entry_points:
+                entry_point = current
+                entry_point_position = steps
+            current = 3 * current + 1 if current & 1 else current >> 1
+            steps += 1
+            
+            # Safety mechanism to prevent infinite computation
+            if steps > MAX_COMPUTATION_STEPS:
+                raise ComputationError(f"Exceeded {MAX_COMPUTATION_STEPS} steps", MAX_COMPUTATION_STEPS + 1)
+        
+        self.n = n
+        self.values = values
+        self.entry_point = entry_point
+        self.entry_point_position = entry_point_position
+
+    def total_stopping_time(self) -> int:
+        """Return the number of steps from n to 1."""
+        return len(self.values) - 1
+
+    def standard_result(self) -> dict:
+        """Return the calculate_standard_total_stopping_time() result of n."""
+        steps = self.total_stopping_time()
+        return {
+            "total_stopping_time": steps,
+            "algorithm": "standard",
+            "prediction_type": "complete" if steps else "trivial",
+            "computed_steps": steps,
+            "saved_steps": 0
+        }
+
+    def validate(self) -> Dict[str, any]:
+        """
+        Validate the wormhole of the entry point against the walked trajectory.
+        
+        The walked values from the entry point on are the actual Collatz sequence
+        of the entry point, so no further walk is needed.
+        
+        Returns:
+            Dict[str, any]: Validation results as described in validate_wormhole_sequence()
+        """
+        if self.entry_point is None:
+            return {"valid": False, "error": "No wormhole entry point on the trajectory"}
+        return compare_wormhole_sequences(self.values[self.entry_point_position:],
+                                          get_wormhole_table().sequence(self.entry_point))
+
+    def wormhole_result(self) -> dict:
+        """Return the calculate_wormhole_total_stopping_time() result of n, validated by validate()."""
+        steps = self.total_stopping_time()
+        if steps == 0:
+            return {
+                "total_stopping_time": 0,
+                "algorithm": "wormhole",
+                "prediction_type": "trivial",
+                "computed_steps": 0,
+                "saved_steps": 0
+            }
+        return wormhole_result_from_walk(steps, self.entry_point, self.entry_point_position,
+                                         self.validate() if self.entry_point is not None else None)
+
+class JumpTable:
+    """
+    Precomputed k-step jump table for the standard Collatz walker.
+    
+    Write n = 2^k * q + r with r = n mod 2^k. The parity vector of the first k
+    steps of the "shortcut" map T(x) = x/2 (x even), (3x+1)/2 (x odd) depends
+    only on r, which gives the classic affine identity
+    
+        T^k(n) = 3^c * q + T^k(r)
+    
+    where c is the number of odd steps among those k. Each T step on an odd
+    value stands for two standard Collatz steps (3x+1, then the halving), so one
+    table lookup advances the standard trajectory by k + c steps at once.
+    
+    For every residue r the table stores b = T^k(r) and the odd count c, so a
+    jump is n -> 3^c * (n >> k) + b. Jumps are only taken while n > 2^k, which
+    guarantees that none of the skipped values is 1, so the stopping time stays
+    exact; below that bound the walker falls back to single steps.
+    
+    Attributes:
+        bits (int): The number of steps k covered by one jump
+        offsets (array): array('Q') of T^k(r) for every residue r
+        odd_counts (array): array('B') of odd-step counts for every residue r
+        build_seconds (float): Time spent building the table
+        memory_bytes (int): Memory used by the table arrays
+    
+    Examples:
+        >>> table = JumpTable(8)
+        >>> calculate_standard_total_stopping_time(27, jump_table=table)["total_stopping_time"]
+        111
+        >>> table.describe()["entries"]
+        256
+    
+    Notes:
+        - k is configurable between MIN_JUMP_BITS and MAX_JUMP_BITS; memory grows as 9 * 2^k bytes
+        - Jumps work on arbitrary-precision values, so large inputs jump all the way
+          down to 2^k
+    """
+
+    def __init__(self, bits: int = DEFAULT_JUMP_BITS):
+        if not MIN_JUMP_BITS <= bits <= MAX_JUMP_BITS:
+            raise ValueError(f"Jump table bits must be between {MIN_JUMP_BITS} and {MAX_JUMP_BITS}, got {bits}")
+        start_time = time.perf_counter()
+        
+        self.bits = bits
+        self.size = 1 << bits
+        self.mask = self.size - 1
+        
+        # Build level by level: a residue with j+1 bits extends a residue with j bits,
+        # T^j(r' + 2^j * top) = T^j(r') + 3^c' * top, followed by one more T step
+        offsets = [0]
+        odd_counts = [0]
+        for level in range(bits):
+            next_offsets = offsets * 2
+            next_odd_counts = odd_counts * 2
+            half = len(offsets)
+            for r in range(2 * half):
+                base = r & (half - 1)
+                value = offsets[base] + (3 ** odd_counts[base] if r >= half else 0)
+                if value & 1:
+                    next_offsets[r] = (3 * value + 1) >> 1
+                    next_odd_counts[r] = odd_counts[base] + 1
+                else:
+                    next_offsets[r] = value >> 1
+                    next_odd_counts[r] = odd_counts[base]
+            offsets = next_offsets
+            odd_counts = next_odd_counts
+        
+        self.offsets = array("Q", offsets)
+        self.odd_counts = array("B", odd_counts)
+        self.powers_of_three = [3 ** c for c in range(bits + 1)]
+        
+        self.build_seconds = time.perf_counter() - start_time
+        self.memory_bytes = (len(self.offsets) * self.offsets.itemsize
+                             + len(self.odd_counts) * self.odd_counts.itemsize)
+
+    def describe(self) -> dict:
+        """
+        Return the table size and build metrics.
+        
+        Returns:
+            dict: bits, entries, build_seconds and memory_bytes
+        """
+        return {
+            "bits": self.bits,
+            "entries": self.size,
+            "build_seconds": round(self.build_seconds, 6),
+            "memory_bytes": self.memory_bytes
+        }
+
+def standard_total_stopping_time(n: int, jump_table: JumpTable = None) -> int:
+    """
+    Fast path: standard (unoptimized) total stopping time of n as a plain int.
+    
+    This is the core of calculate_standard_total_stopping_time() without string/float
+    coercion or result dictionaries. Every step is computed, optionally k steps at a
+    time with a JumpTable.
+    
+    Args:
+        n (int): A positive integer (at most MAX_INPUT_VALUE)
+        jump_table (JumpTable): Optional k-step jump table used while the value is above 2^k
+    
+    Returns:
+        int: The number of steps for n to reach 1
+    
+    Raises:
+        ValidationError: If n is not a positive int within MAX_INPUT_VALUE
+        ComputationError: If the walk exceeds MAX_COMPUTATION_STEPS
+    
+    Examples:
+        >>> standard_total_stopping_time(27)
+        111
+        >>> standard_total_stopping_time(27, jump_table=JumpTable(8))
+        111
+    """
+    validate_fast_input(n)
+    
+    steps = 0        # Counter for total steps to reach 1
+    current = n      # Start computation from the input
+    
+    # Multi-step jumps while the value is above the table range (exact, see JumpTable)
+    if jump_table is not None:
+        bits = jump_table.bits
+        mask = jump_table.mask
+        offsets = jump_table.offsets
+        odd_counts = jump_table.odd_counts
+        powers_of_three = jump_table.powers_of_three
+        while current > mask:
+            residue = current & mask
+            odd_count = odd_counts[residue]
+            current = powers_of_three[odd_count] * (current >> bits) + offsets[residue]
+            steps += bits + odd_count
+            
+            # Safety mechanism to prevent infinite computation
+            if steps > MAX_COMPUTATION_STEPS:
+                raise ComputationError(f"Exceeded {MAX_COMPUTATION_STEPS} steps", MAX_COMPUTATION_STEPS + 1)
+    
+    # Main computation loop: apply the Collatz transformation inline until reaching 1,
+    # with the bigint engine above the native range
+    while current != 1:
+        if current & 1:
+            if current > OVERFLOW_THRESHOLD:
+                current, big_steps = big_collatz_descent(current, OVERFLOW_THRESHOLD, MAX_COMPUTATION_STEPS - steps)
+                steps += big_steps
+            else:
+                current = 3 * current + 1
+                steps += 1
+        else:
+            # Strip all trailing zeros with one shift
+            shift = (current & -current).bit_length() - 1
+            current >>= shift
+            steps += shift
+        
+        # Safety mechanism to prevent infinite computation
+        if steps > MAX_COMPUTATION_STEPS:
+            raise ComputationError(f"Exceeded {MAX_COMPUTATION_STEPS} steps", MAX_COMPUTATION_STEPS + 1)
+    
+    return steps
+
+def calculate_standard_total_stopping_time(n: Union[int, str, float], batch: bool = False,
+                                           jump_table: JumpTable = None) -> Dict[str, any]:
+    """
+    Calculate the total stopping time for Collatz sequence using standard algorithm.
+    
+    This function implements the traditional, unoptimized approach to calculating
+    the total stopping time by applying the Collatz function repeatedly until
+    reaching 1. It serves as a baseline reference for comparison with optimized
+    algorithms and provides validation that wormhole results are mathematically correct.
+    
+    Algorithm workflow:
+    1. Validate and convert input to proper integer format
+    2. Handle trivial case (n=1) immediately
+    3. Apply Collatz transformations step by step until reaching 1
+    4. Count and return total number of steps taken
+    
+    Args:
+        n (Union[int, str, float]): The input number for which to calculate
+                                   total stopping time. Can be string, float, or int.
+        batch (bool): When True, n is an iterable of inputs and a list with one result
+                     dictionary per input is returned, computed by the NumPy batch
+                     kernel when available (see calculate_batch_total_stopping_times).
+        jump_table (JumpTable): Optional k-step jump table. While the current value is
+                               above 2^k, k + c steps are applied per lookup instead of one.
+    
+    Returns:
+        Dict[str, any]: Standard algorithm results containing:
+            - total_stopping_time (int): Number of steps to reach 1 (-1 if error)
+            - algorithm (str): Always "standard" to identify the method used
+            - prediction_type (str): Type of result achieved:
+                * "trivial": Input was 1 (0 steps)
+                * "complete": Successfully computed full sequence to completion
+                * "error": Input validation or computation error occurred
+            - computed_steps (int): Total steps calculated (same as total_stopping_time)
+            - saved_steps (int): Always 0 (no optimization applied)
+            
+            Additional fields when errors occur:
+            - error_message (str): Detailed description of the error
+    
+    Examples:
+        >>> calculate_standard_total_stopping_time(27)
+        {
+            'total_stopping_time': 111,
+            'algorithm': 'standard',
+            'prediction_type': 'complete',
+            'computed_steps': 111,
+            'saved_steps': 0
+        }
+        
+        >>> calculate_standard_total_stopping_time(1)
+        {
+            'total_stopping_time': 0,
+            'algorithm': 'standard',
+            'prediction_type': 'trivial',
+            'computed_steps': 0,
+            'saved_steps': 0
+        }
+        
+        >>> calculate_standard_total_stopping_time("invalid")
+        {
+            'total_stopping_time': -1,
+            'algorithm': 'standard',
+            'prediction_type': 'error',
+            'error_message': 'Invalid number format: invalid',
+            'computed_steps': 0,
+            'saved_steps': 0
+        }
+    
+    Notes:
+        - This function provides the reference implementation for comparison purposes
+        - No optimizations applied - every step is computed individually
+        - Essential for validating that wormhole algorithm produces identical results
+        - Computational complexity is O(stopping_time) with no shortcuts
+          (about k times fewer loop iterations on large inputs with a jump table)
+        - Used extensively in testing and validation workflows
+        - Provides baseline performance metrics for efficiency comparisons
+        - Thin wrapper over standard_total_stopping_time(), which returns a plain int
+    """
+    # Batch path: many inputs at once through the vectorized kernel
+    if batch:
+        return calculate_batch_total_stopping_times(n, algorithm="standard")
+    
+    # Validate and convert input to proper integer format
+    try:
+        n_val = validate_input(n)
+    except ValidationError as e:
+        # Return error result with diagnostic information
+        return {
+            "total_stopping_time": -1,
+            "algorithm": "standard",
+            "prediction_type": "error",
+            "error_message": str(e),
+            "computed_steps": 0,
+            "saved_steps": 0
+        }
+    
+    # Handle trivial case where input is already 1
+    if n_val == 1:
+        return {
+            "total_stopping_time": 0,
+            "algorithm": "standard",
+            "prediction_type": "trivial",
+            "computed_steps": 0,
+            "saved_steps": 0
+        }
+    
+    try:
+        # Walk with the fast path and wrap the plain result
+        steps = standard_total_stopping_time(n_val, jump_table)
+    except (ComputationError, ValidationError) as e:
+        # Handle computation errors with diagnostic information
+        return {
+            "total_stopping_time": -1,
+            "algorithm": "standard",
+            "prediction_type": "error",
+            "error_message": str(e),
+            "computed_steps": getattr(e, "steps", 0),  # Steps walked before the failure
+            "saved_steps": 0
+        }
+    
+    # Successfully computed stopping time
+    return {
+        "total_stopping_time": steps,
+        "algorithm": "standard",
+        "prediction_type": "complete",
+        "computed_steps": steps,  # Same as total (no optimization)
+        "saved_steps": 0          # No steps saved (no optimization)
+    }
+
+def compute_range(start: int, stop: int, track_entry_points: bool = False) -> tuple:
+    """
+    Compute the total stopping times of every n in [start, stop) in one sweep.
+    
+    Instead of walking each trajectory to 1, the sweep stops a walk as soon as it
+    reaches a value whose stopping time is already known:
+    - a smaller value of the same range (already stored in the result array)
+    - a wormhole entry point from WORMHOLE_TABLE (its stopping time is the wormhole length - 1)
+    - the value 1
+    Since most trajectories drop below their starting value after a few steps,
+    every number costs only a handful of iterations instead of a full walk.
+    
+    Args:
+        start (int): First number of the range (inclusive, must be positive)
+        stop (int): End of the range (exclusive)
+        track_entry_points (bool): Also return, for each n, the first wormhole entry
+                                   point its trajectory reaches (0 if none)
+    
+    Returns:
+        tuple: A 2-tuple containing:
+            - stopping_times (array): array('H') of total stopping times, where
+              stopping_times[i] belongs to n = start + i ('I' if MAX_COMPUTATION_STEPS
+              does not fit in 16 bits)
+            - entry_points (array): array('Q') of entry points when track_entry_points
+              is True, otherwise None
+    
+    Raises:
+        ValidationError: If start is not positive or stop - 1 exceeds MAX_INPUT_VALUE
+        ComputationError: If a trajectory exceeds MAX_COMPUTATION_STEPS
+    
+    Examples:
+        >>> times, _ = compute_range(1, 10)
+        >>> list(times)
+        [0, 1, 7, 2, 5, 8, 16, 3, 19]
+        >>> times, entries = compute_range(26, 29, track_entry_points=True)
+        >>> list(times), list(entries)
+        ([10, 111, 18], [0, 121, 14])
+    
+    Notes:
+        - Entry points follow the same "first hit" rule as calculate_wormhole_total_stopping_time()
+        - Memory use is 2 bytes per number (plus 8 bytes per number with entry points)
+        - Values below start are not stored, so ranges starting at 1 benefit the most
+    """
+    # Validate the bounds of the range
+    start = validate_input(start)
+    if stop <= start:
+        return array("H"), (array("Q") if track_entry_points else None)
+    validate_input(stop - 1)
+    
+    count = stop - start
+    typecode = "H" if MAX_COMPUTATION_STEPS < 2**16 else "I" if MAX_COMPUTATION_STEPS < 2**32 else "Q"
+    stopping_times = array(typecode, [0]) * count
+    entry_points = array("Q", [0]) * count if track_entry_points else None
+    
+    # Wormhole entry points act as seeds with known stopping times
+    seeds = {key: steps for key, steps in get_wormhole_table().stopping_times.items() if key != 1}
+    odd_cores = get_wormhole_table().odd_cores
+    
+    for n in range(start, stop):
+        current = n
+        steps = 0
+        entry_point = 0
+        
+        while True:
+            # Reached the trivial cycle: the walk is complete
+            if current == 1:
+                total = steps
+                break
+            # Wormhole entry point: jump to the end of the pre-computed sequence
+            if current in seeds:
+                total = steps + seeds[current]
+                entry_point = current
+                break
+            # Smaller value of this range: reuse its stopping time
+            if start <= current < n:
+                index = current - start
+                total = steps + stopping_times[index]
+                if track_entry_points:
+                    entry_point = entry_points[index]
+                break
+            
+            # Apply the Collatz transformation inline, with the bigint engine above the native range
+            if current & 1:
+                if current > OVERFLOW_THRESHOLD:
+                    current, big_steps = big_collatz_descent(current, OVERFLOW_THRESHOLD,
+                                                             MAX_COMPUTATION_STEPS - steps)
+                    steps += big_steps
+                else:
+                    current = 3 * current + 1
+                    steps += 1
+            else:
+                # Strip all trailing zeros at once, stopping early at the first entry point
+                # among the skipped values (smaller values of the range are only reused
+                # where the walk lands, which keeps the results identical)
+                shift = (current & -current).bit_length() - 1
+                exponents = odd_cores.get(current >> shift)
+                if exponents is not None:
+                    for exponent in exponents:
+                        if exponent < shift:
+                            shift -= exponent
+                            break
+                current >>= shift
+                steps += shift
+            
+            # Safety mechanism to prevent infinite computation
+            if steps > MAX_COMPUTATION_STEPS:
+                raise ComputationError(f"Exceeded {MAX_COMPUTATION_STEPS} steps", MAX_COMPUTATION_STEPS + 1)
+        
+        stopping_times[n - start] = total
+        if track_entry_points:
+            entry_points[n - start] = entry_point
+    
+    return stopping_times, entry_points
+
+def print_range_results(start: int, stopping_times: array, entry_points: array = None) -> None:
+    """
+    Write the results of compute_range() to stdout as CSV lines.
+    
+    Output is written in blocks to keep the cost of printing low for large ranges.
+    
+    Args:
+        start (int): The first number of the range
+        stopping_times (array): Stopping times returned by compute_range()
+        entry_points (array): Entry points returned by compute_range(), or None
+    
+    Console Output:
+        n,total_stopping_time[,entry_point]
+        27,111,121
+        28,18,14
+    """
+    write = sys.stdout.write
+    if entry_points is None:
+        write("n,total_stopping_time\n")
+    else:
+        write("n,total_stopping_time,entry_point\n")
+    
+    for block_start in range(0, len(stopping_times), OUTPUT_BLOCK_SIZE):
+        block_stop = min(block_start + OUTPUT_BLOCK_SIZE, len(stopping_times))
+        if entry_points is None:
+            lines = [f"{start + i},{stopping_times[i]}\n" for i in range(block_start, block_stop)]
+        else:
+            lines = [f"{start + i},{stopping_times[i]},{entry_points[i]}\n" for i in range(block_start, block_stop)]
+        write("".join(lines))
+
+def print_sequence(n: int, wormhole: bool = False, stream=None) -> int:
+    """
+    Write the trajectory of n to a stream, one value per line, without storing it.
+    
+    Values are pulled from iter_standard() or iter_wormhole() and written in blocks
+    of OUTPUT_BLOCK_SIZE lines, so even very long trajectories of huge inputs are
+    exported in constant memory.
+    
+    Args:
+        n (int): A positive integer, already validated
+        wormhole (bool): Use the wormhole algorithm (stored tail spliced from the table)
+        stream: Text stream to write to (default: sys.stdout)
+    
+    Returns:
+        int: Number of values written
+    
+    Raises:
+        ComputationError: If the trajectory exceeds MAX_COMPUTATION_STEPS
+    
+    Console Output:
+        6
+        3
+        10
+        ...
+    """
+    write = (stream if stream is not None else sys.stdout).write
+    values = iter_wormhole(n) if wormhole else iter_standard(n)
+    written = 0
+    while True:
+        block = list(islice(values, OUTPUT_BLOCK_SIZE))
+        if not block:
+            return written
+        write("".join(f"{value}\n" for value in block))
+        written += len(block)
+
+def iter_predecessors(entry_point: int, limit: int, ceiling: int = None, truncation: dict = None):
+    """
+    Yield every n <= limit whose first wormhole entry point is entry_point.
+    
+    Walks the inverse Collatz tree breadth-first from entry_point: the predecessors
+    of m are 2m, and (m - 1) / 3 when it is an odd integer greater than 1. A branch
+    is cut at values above the ceiling and at every other entry point of
+    WORMHOLE_TABLE, since the forward walk of those values (and of everything below
+    them in the tree) stops there first. The work is proportional to the number of
+    tree values up to the ceiling, not to limit.
+    
+    Args:
+        entry_point (int): An entry point of WORMHOLE_TABLE, other than 1
+        limit (int): Largest n reported
+        ceiling (int): Largest value explored (default: limit)
+        truncation (dict): Optional dict that receives "ceiling" and "cut_at_ceiling",
+                           the number of branches cut because they go above the
+                           ceiling (updated while the results are consumed)
+    
+    Yields:
+        tuple: (n, total_stopping_time, entry_point_position) in breadth-first order,
+               i.e. by increasing entry_point_position
+    
+    Raises:
+        ValidationError: If entry_point is 1 or not an entry point, or limit or ceiling
+                         is not a positive integer, or ceiling is below limit
+    
+    Examples:
+        >>> sorted(iter_predecessors(91, 200))
+        [(91, 92, 0), (182, 93, 1)]
+        >>> sorted(n for n, _, _ in iter_predecessors(121, 1000))[:6]
+        [27, 31, 41, 47, 54, 55]
+        >>> truncation = {}
+        >>> len(list(iter_predecessors(91, 1000, truncation=truncation))), truncation["cut_at_ceiling"]
+        (4, 1)
+    
+    Notes:
+        - An n <= limit whose trajectory climbs above the ceiling before it reaches
+          entry_point is missed. With the default ceiling, for example, n = 63
+          is missed for entry point 91 and limit 1000, since it climbs to 1456
+          first (ceiling 1456 finds it). Raise the ceiling to the largest value of
+          the trajectories of interest for a complete answer. A nonzero
+          "cut_at_ceiling" in truncation means such values may exist.
+        - The same n is reported as a forward walk with total_stopping_time_with_entry()
+          would attribute it: the first entry point reached wins. The key 1 is
+          rejected, since the forward walk ends at 1 without treating it as an entry point
+    """
+    if ceiling is None:
+        ceiling = limit
+    if not isinstance(limit, int) or not isinstance(ceiling, int) or limit < 1 or ceiling < 1:
+        raise ValidationError("Limit and ceiling must be positive integers")
+    if ceiling < limit:
+        raise ValidationError(f"Ceiling {ceiling} is below the limit {limit}")
+    entry_points = get_wormhole_table().stopping_times
+    if entry_point == 1 or entry_point not in entry_points:
+        raise ValidationError(f"{entry_point} is not a wormhole entry point")
+    if truncation is None:
+        truncation = {}
+    truncation["ceiling"] = ceiling
+    truncation["cut_at_ceiling"] = 0
+    if entry_point > ceiling:
+        truncation["cut_at_ceiling"] = 1
+        return
+    
+    wormhole_steps = entry_points[entry_point]
+    level = [entry_point]
+    position = 0
+    while level:
+        next_level = []
+        for value in level:
+            if value <= limit:
+                yield value, position + wormhole_steps, position
+            
+            # Inverse of n -> n / 2
+            doubled = value << 1
+            if doubled not in entry_points:
+                if doubled <= ceiling:
+                    next_level.append(doubled)
+                else:
+                    truncation["cut_at_ceiling"] += 1
+            
+            # Inverse of n -> 3n + 1, for odd predecessors other than 1
+            if value % 6 == 4 and value > 4:
+                odd = (value - 1) // 3
+                if odd not in entry_points:
+                    next_level.append(odd)
+        level = next_level
+        position += 1
+
+def print_predecessors(entry_point: int, limit: int, ceiling: int = None, stream=None) -> int:
+    """
+    Write the results of iter_predecessors() as CSV lines, in blocks, as they are found.
+    
+    Args:
+        entry_point (int): An entry point of WORMHOLE_TABLE
+        limit (int): Largest n reported
+        ceiling (int): Largest value explored (default: limit)
+        stream: Text stream to write to (default: sys.stdout)
+    
+    Returns:
+        tuple: (values written, branches cut at the ceiling); when the second is
+               nonzero, values above the ceiling were not explored
+    
+    Raises:
+        ValidationError: Propagated from iter_predecessors()
+    
+    Console Output:
+        n,total_stopping_time,entry_point_position
+        91,92,0
+        182,93,1
+    """
+    write = (stream if stream is not None else sys.stdout).write
+    truncation = {}
+    results = iter_predecessors(entry_point, limit, ceiling, truncation)
+    
+    # Take the first block before the header, so invalid arguments fail before any output
+    block = list(islice(results, OUTPUT_BLOCK_SIZE))
+    write("n,total_stopping_time,entry_point_position\n")
+    written = 0
+    while block:
+        write("".join(f"{n},{steps},{position}\n" for n, steps, position in block))
+        written += len(block)
+        block = list(islice(results, OUTPUT_BLOCK_SIZE))
+    return written, truncation["cut_at_ceiling"]
+
+class RangeStatistics:
+    """
+    Streaming statistics of the wormhole stopping times of a range of inputs.
+    
+    Values are added one at a time and only aggregated counters are kept, so the
+    memory used depends on the number of distinct stopping times, entry points and
+    positions seen, never on the length of the range. Accumulators of consecutive
+    chunks (or of the chunks of several worker processes) are combined with
+    merge(), and the result is exported as JSON with to_dict().
+    
+    Attributes:
+        first (int): Smallest value added (None while empty)
+        last (int): Largest value added (None while empty)
+        count (int): Values added with a stopping time
+        errors (int): Values that had no verified stopping time (computation errors,
+                      or sequences that differ in an equivalence run)
+        total_steps (int): Sum of the stopping times
+        saved_steps (int): Sum of the steps taken from wormholes
+        no_entry_point (int): Values whose trajectory reached 1 without an entry point
+        stopping_times (dict): Histogram stopping time -> count
+        entry_point_hits (dict): Histogram entry point -> count (first entry point reached)
+        entry_positions (dict): Histogram step at which the entry point was reached -> count
+        percent_saved (dict): Histogram whole percent of steps saved (0..100) -> count
+        min_stopping_time (int), min_holder (int): Smallest stopping time and its first value
+        max_stopping_time (int), max_holder (int): Largest stopping time and its first value
+        records (list): (n, stopping_time) pairs of the values whose stopping time
+                        exceeds that of every smaller value added
+    
+    Examples:
+        >>> statistics = collect_range_statistics(1, 101)
+        >>> statistics.max_holder, statistics.max_stopping_time
+        (97, 118)
+        >>> statistics.records[:4]
+        [(1, 0), (2, 1), (3, 7), (6, 8)]
+    
+    Notes:
+        - Values must be added in ascending order, and merge() must be given the
+          statistics of a later range, for records to keep their meaning
+    """
+
+    def __init__(self):
+        self.first = None
+        self.last = None
+        self.count = 0
+        self.errors = 0
+        self.total_steps = 0
+        self.saved_steps = 0
+        self.no_entry_point = 0
+        self.stopping_times = {}
+        self.entry_point_hits = {}
+        self.entry_positions = {}
+        self.percent_saved = {}
+        self.min_stopping_time = None
+        self.min_holder = None
+        self.max_stopping_time = -1
+        self.max_holder = None
+        self.records = []
+
+    def add(self, n: int, stopping_time: int, entry_point: int = None, entry_position: int = None) -> None:
+        """
+        Add the result of one value.
+        
+        Args:
+            n (int): The input value, larger than every value added before
+            stopping_time (int): Its total stopping time
+            entry_point (int): First wormhole entry point reached, None if there is none
+            entry_position (int): Step at which entry_point was reached
+        """
+        if self.first is None:
+            self.first = n
+        self.last = n
+        self.count += 1
+        self.total_steps += stopping_time
+        self.stopping_times[stopping_time] = self.stopping_times.get(stopping_time, 0) + 1
+        
+        if entry_point is None:
+            self.no_entry_point += 1
+            saved = 0
+        else:
+            saved = stopping_time - entry_position
+            self.saved_steps += saved
+            self.entry_point_hits[entry_point] = self.entry_point_hits.get(entry_point, 0) + 1
+            self.entry_positions[entry_position] = self.entry_positions.get(entry_position, 0) + 1
+        percent = saved * 100 // stopping_time if stopping_time else 0
+        self.percent_saved[percent] = self.percent_saved.get(percent, 0) + 1
+        
+        if self.min_stopping_time is None or stopping_time < self.min_stopping_time:
+            self.min_stopping_time = stopping_time
+            self.min_holder = n
+        if stopping_time > self.max_stopping_time:
+            # A new maximum of an ascending range is a record
+            self.max_stopping_time = stopping_time
+            self.max_holder = n
+            self.records.append((n, stopping_time))
+
+    def add_error(self, n: int) -> None:
+        """Count a value that has no verified stopping time."""
+        if self.first is None:
+            self.first = n
+        self.last = n
+        self.errors += 1
+
+    def merge(self, other: "RangeStatistics") -> "RangeStatistics":
+        """
+        Merge the statistics of the next range into these ones.
+        
+        Args:
+            other (RangeStatistics): Statistics of a range that starts after this one
+        
+        Returns:
+            RangeStatistics: self, updated in place
+        """
+        if other.first is None:
+            return self
+        if self.first is None:
+            self.first = other.first
+        self.last = other.last
+        for name in ("count", "errors", "total_steps", "saved_steps", "no_entry_point"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in ("stopping_times", "entry_point_hits", "entry_positions", "percent_saved"):
+            histogram = getattr(self, name)
+            for key, count in getattr(other, name).items():
+                histogram[key] = histogram.get(key, 0) + count
+        
+        if other.min_stopping_time is not None and (self.min_stopping_time is None
+                                                    or other.min_stopping_time < self.min_stopping_time):
+            self.min_stopping_time = other.min_stopping_time
+            self.min_holder = other.min_holder
+        # Records of the later range only count when they beat this whole range
+        for n, stopping_time in other.records:
+            if stopping_time > self.max_stopping_time:
+                self.max_stopping_time = stopping_time
+                self.max_holder = n
+                self.records.append((n, stopping_time))
+        return self
+
+    def to_dict(self) -> dict:
+        """
+        Return the statistics as a JSON-serializable dictionary.
+        
+        Histogram keys become strings (JSON object keys), in ascending numeric order.
+        """
+        def histogram(counts):
+            return {str(key): counts[key] for key in sorted(counts)}
+        
+        return {
+            "first": self.first,
+            "last": self.last,
+            "count": self.count,
+            "errors": self.errors,
+            "total_steps": self.total_steps,
+            "saved_steps": self.saved_steps,
+            "mean_stopping_time": round(self.total_steps / self.count, 3) if self.count else 0.0,
+            "entry_point_hit_rate": round(1 - self.no_entry_point / self.count, 6) if self.count else 0.0,
+            "no_entry_point": self.no_entry_point,
+            "min": {"n": self.min_holder, "stopping_time": self.min_stopping_time},
+            "max": {"n": self.max_holder, "stopping_time": self.max_stopping_time if self.count else None},
+            "records": [list(record) for record in self.records],
+            "histograms": {
+                "stopping_time": histogram(self.stopping_times),
+                "entry_point": histogram(self.entry_point_hits),
+                "entry_position": histogram(self.entry_positions),
+                "percent_saved": histogram(self.percent_saved)
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RangeStatistics":
+        """
+        Rebuild statistics exported by to_dict() (e.g. from a checkpoint file).
+        
+        Raises:
+            KeyError, TypeError, ValueError: If data is not a to_dict() export
+        """
+        statistics = cls()
+        statistics.first = data["first"]
+        statistics.last = data["last"]
+        for name in ("count", "errors", "total_steps", "saved_steps", "no_entry_point"):
+            setattr(statistics, name, int(data[name]))
+        histograms = data["histograms"]
+        for name, key in (("stopping_times", "stopping_time"), ("entry_point_hits", "entry_point"),
+                          ("entry_positions", "entry_position"), ("percent_saved", "percent_saved")):
+            setattr(statistics, name, {int(value): int(count) for value, count in histograms[key].items()})
+        statistics.min_stopping_time = data["min"]["stopping_time"]
+        statistics.min_holder = data["min"]["n"]
+        if data["max"]["stopping_time"] is not None:
+            statistics.max_stopping_time = data["max"]["stopping_time"]
+            statistics.max_holder = data["max"]["n"]
+        statistics.records = [tuple(record) for record in data["records"]]
+        return statistics
+
+def collect_range_statistics(start: int, stop: int) -> RangeStatistics:
+    """
+    Compute the RangeStatistics of every n in [start, stop) with the wormhole fast path.
+    
+    Args:
+        start (int): First number of the range (inclusive, must be positive)
+        stop (int): End of the range (exclusive)
+    
+    Returns:
+        RangeStatistics: Statistics of the range; values whose walk exceeds
+                         MAX_COMPUTATION_STEPS are counted as errors
+    
+    Raises:
+        ValidationError: If start is not positive or a value exceeds MAX_INPUT_VALUE
+    
+    Examples:
+        >>> collect_range_statistics(1, 1001).to_dict()["entry_point_hit_rate"]
+        0.616
+    """
+    statistics = RangeStatistics()
+    add = statistics.add
+    for n in range(start, stop):
+        try:
+            stopping_time, entry_point, entry_position = total_stopping_time_with_entry(n)
+        except ComputationError:
+            statistics.add_error(n)
+            continue
+        add(n, stopping_time, entry_point, entry_position)
+    return statistics
+
+def range_statistics_worker(task: tuple) -> RangeStatistics:
+    """Process pool entry point: collect_range_statistics() of one (start, stop) chunk."""
+    return collect_range_statistics(*task)
+
+def run_range_statistics(start: int, stop: int, workers: int = 1, chunk_size: int = None) -> RangeStatistics:
+    """
+    Compute the RangeStatistics of [start, stop), optionally on a pool of worker processes.
+    
+    The range is split into chunks whose statistics are merged in ascending order,
+    so the result is identical to a single serial pass.
+    
+    Args:
+        start (int): First number of the range (inclusive, must be positive)
+        stop (int): End of the range (exclusive)
+        workers (int): Number of worker processes (1 for a serial pass)
+        chunk_size (int): Numbers per chunk (default: balanced across workers,
+                          at most DEFAULT_CHUNK_SIZE)
+    
+    Returns:
+        RangeStatistics: Statistics of the whole range
+    """
+    if start < 1:
+        raise ValidationError(f"Range must start at a positive integer, got {start}")
+    if workers <= 1:
+        return collect_range_statistics(start, stop)
+    
+    from multiprocessing import Pool
+    if chunk_size is None:
+        chunk_size = max(1, min(DEFAULT_CHUNK_SIZE, -(-(stop - start) // (workers * 8))))
+    statistics = RangeStatistics()
+    with Pool(workers) as pool:
+        for partial in pool.imap(range_statistics_worker, split_range(start, stop, chunk_size)):
+            statistics.merge(partial)
+    return statistics
+
+def stream_result_row(value, result: dict) -> tuple:
+    """
+    Return the STREAM_COLUMNS row of one wormhole result dictionary.
+    
+    Args:
+        value: The validated input value (or the raw input when it is invalid)
+        result (dict): Result of calculate_wormhole_total_stopping_time() for value
+    
+    Returns:
+        tuple: n, total_stopping_time, entry_point_found, entry_point_position,
+               saved_steps and error, with None for the missing fields
+    """
+    return (
+        value,
+        result["total_stopping_time"],
+        result.get("entry_point_found"),
+        result.get("entry_point_position"),
+        result["saved_steps"],
+        result.get("error_message")
+    )
+
+def stream_stopping_times(input_stream, output_stream, output_format: str = "csv",
+                          memo: StoppingTimeMemo = None) -> int:
+    """
+    Compute wormhole stopping times for a stream of newline-delimited inputs.
+    
+    Values are read in buffered blocks of lines, run through validate_input() and
+    calculate_wormhole_total_stopping_time(), and written back block by block as
+    CSV or JSON Lines without any ANSI or pretty formatting. Only one block is held
+    in memory at a time, so arbitrarily long streams run in constant memory.
+    
+    Args:
+        input_stream: Text stream with one value per line (blank lines are skipped)
+        output_stream: Text stream receiving one result per input value
+        output_format (str): "csv" (with a header line) or "jsonl"
+        memo (StoppingTimeMemo): Optional memo table shared by all values of the stream
+    
+    Returns:
+        int: Number of values processed
+    
+    Raises:
+        ValueError: If output_format is not supported
+    
+    Output Columns:
+        - n: The validated input value (or the raw line when it is invalid)
+        - total_stopping_time: Steps to reach 1 (-1 if the value is invalid)
+        - entry_point_found: First wormhole entry point reached (empty/null if none)
+        - entry_point_position: Step at which the entry point was reached (empty/null if none)
+        - saved_steps: Steps taken from the wormhole (or memo) instead of computed
+        - error: Validation or computation error message (empty/null if none)
+    
+    Examples:
+        $ printf '27\\n28\\nabc\\n' | python total_stopping_time_predictor.py --stdin
+        n,total_stopping_time,entry_point_found,entry_point_position,saved_steps,error
+        27,111,121,16,95,
+        28,18,14,1,17,
+        abc,-1,,,0,Invalid number format: abc
+    """
+    import csv
+    import json
+    
+    if output_format not in STREAM_FORMATS:
+        raise ValueError(f"Unsupported output format {output_format}, expected one of {', '.join(STREAM_FORMATS)}")
+    
+    if output_format == "csv":
+        writer = csv.writer(output_stream, lineterminator="\n")
+        writer.writerow(STREAM_COLUMNS)
+    
+    processed = 0
+    while True:
+        # Read the next block of lines (bounded by INPUT_BLOCK_BYTES)
+        lines = input_stream.readlines(INPUT_BLOCK_BYTES)
+        if not lines:
+            break
+        
+        rows = []
+        for line in lines:
+            value = line.strip()
+            if not value:
+                continue
+            try:
+                n_val = validate_input(value)
+            except ValidationError as e:
+                rows.append((value, -1, None, None, 0, str(e)))
+                continue
+            result = calculate_wormhole_total_stopping_time(n_val, memo=memo)
+            rows.append(stream_result_row(n_val, result))
+        processed += len(rows)
+        
+        # Write the whole block at once
+        if output_format == "csv":
+            writer.writerows(rows)
+        else:
+            output_stream.write("".join(json.dumps(dict(zip(STREAM_COLUMNS, row))) + "\n" for row in rows))
+    
+    output_stream.flush()
+    return processed
+
+class StoppingTimeServer:
+    """
+    Answer wormhole stopping-time queries over a local socket (--serve).
+    
+    Every client connection sends one request per line and receives one response
+    line per request, in request order:
+    
+        - A plain value ("27") returns its STREAM_COLUMNS row as CSV ("27,111,121,16,95,")
+        - A JSON object ({"n": 27}) returns the result dictionary of
+          calculate_wormhole_total_stopping_time() as JSON, with an added "n" field
+        - "stats" or {"command": "stats"} returns the server counters as JSON, taken
+          when the response is written (after the earlier requests of the connection)
+    
+    Results are kept in a least-recently-used cache shared by all connections.
+    Values that miss the cache are queued, and all the queued values are answered
+    by one calculate_batch_total_stopping_times() call the next time the event loop
+    runs the batcher, so the lines pipelined by one client and the queries of
+    concurrent clients share the vectorized kernel when NumPy is installed.
+    
+    Attributes:
+        cache_size (int): Maximum number of cached result dictionaries
+        cache (OrderedDict): Validated value -> result dictionary, oldest first
+        latencies (deque): Seconds from request line to response, for the most recent requests
+        requests (int): Responses written, including stats and error responses
+        cache_hits (int): Valid values answered from the cache
+        cache_misses (int): Valid values that had to be computed
+        invalid (int): Requests rejected by validation or by the JSON parser
+        batches (int): Batch calls made
+        batched_values (int): Values computed by all batch calls
+        max_batch_size (int): Most values computed by one batch call
+        batch_errors (int): Batches whose batch call raised and were answered value by value
+    
+    Examples:
+        >>> server = StoppingTimeServer(cache_size=1000)
+        >>> server.stats()["requests"]
+        0
+    
+    Notes:
+        - Computations run on the event loop thread, so the server suits many cheap
+          queries rather than a few huge inputs
+        - Use run_server() to serve on a TCP or Unix socket and query_server() as client
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_SERVER_CACHE_SIZE):
+        import csv
+        
+        if cache_size < 1:
+            raise ValueError(f"Cache size must be positive, got {cache_size}")
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.latencies = deque(maxlen=SERVER_LATENCY_WINDOW)
+        self.requests = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.invalid = 0
+        self.batches = 0
+        self.batched_values = 0
+        self.max_batch_size = 0
+        self.batch_errors = 0
+        self.started = time.perf_counter()
+        self.loop = None   # Event loop and queue of pending values, set by run_server()
+        self.queue = None
+        self.csv_buffer = io.StringIO()
+        self.csv_writer = csv.writer(self.csv_buffer, lineterminator="\n")
+
+    def format_response(self, value, result: dict, json_request: bool) -> str:
+        """Return the response line of one result, in the protocol of its request."""
+        import json
+        
+        if json_request:
+            response = {"n": value}
+            response.update(result)
+            return json.dumps(response) + "\n"
+        self.csv_buffer.seek(0)
+        self.csv_buffer.truncate()
+        self.csv_writer.writerow(stream_result_row(value, result))
+        return self.csv_buffer.getvalue()
+
+    def submit(self, line: str):
+        """
+        Parse one request line and return a future resolving to its response line.
+        
+        Invalid requests and cached values are answered at once, the other values
+        are queued for the batcher. A stats request resolves to stats_response
+        instead of a line: write_responses() calls it when the response is written,
+        so the counters include every earlier request of the same connection.
+        
+        Args:
+            line (str): One request without its line terminator
+        
+        Returns:
+            asyncio.Future: Resolves to the response line, or to stats_response
+        """
+        import json
+        
+        future = self.loop.create_future()
+        json_request = line.startswith("{")
+        value = line
+        if json_request:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("expected a JSON object")
+                if request.get("command") != "stats" and "n" not in request:
+                    raise ValueError('expected an "n" field or "command": "stats"')
+                # JSON true and false would pass as the ints 1 and 0
+                if isinstance(request.get("n"), bool):
+                    raise ValueError('"n" must be a number or a string, not a boolean')
+            except ValueError as e:
+                self.invalid += 1
+                future.set_result(json.dumps({"error": f"Invalid JSON request: {e}"}) + "\n")
+                return future
+            if request.get("command") == "stats":
+                future.set_result(self.stats_response)
+                return future
+            value = request["n"]
+        elif line.lower() == "stats":
+            future.set_result(self.stats_response)
+            return future
+        
+        try:
+            n_val = validate_input(value)
+        except ValidationError:
+            # The scalar function turns the validation error into an error result
+            self.invalid += 1
+            future.set_result(self.format_response(value, calculate_wormhole_total_stopping_time(value),
+                                                   json_request))
+            return future
+        
+        result = self.cache.get(n_val)
+        if result is not None:
+            self.cache_hits += 1
+            self.cache.move_to_end(n_val)
+            future.set_result(self.format_response(n_val, result, json_request))
+        else:
+            self.cache_misses += 1
+            self.queue.put_nowait((n_val, json_request, future))
+        return future
+
+    def answer_batch(self, batch: list) -> None:
+        """
+        Compute the queued values of one batch and resolve their futures.
+        
+        If the batch call raises, the values are computed one by one with
+        answer_value(), so each client still gets an answer (an error result at worst).
+        
+        Args:
+            batch (list): (value, json_request, future) tuples taken from the queue
+        """
+        # A value queued several times, or cached by an earlier batch, is computed once at most
+        answers = {}
+        pending = []
+        for n_val, _, _ in batch:
+            if n_val in answers:
+                continue
+            result = self.cache.get(n_val)
+            answers[n_val] = result
+            if result is None:
+                pending.append(n_val)
+        
+        if pending:
+            try:
+                if len(pending) > 1:
+                    results = calculate_batch_total_stopping_times(pending, "wormhole")
+                else:
+                    results = [calculate_wormhole_total_stopping_time(pending[0])]
+            except Exception:
+                # Fall back to the scalar path value by value, so one failure cannot stall the queue
+                self.batch_errors += 1
+                results = [self.answer_value(n_val) for n_val in pending]
+            self.batches += 1
+            self.batched_values += len(pending)
+            self.max_batch_size = max(self.max_batch_size, len(pending))
+            
+            cache = self.cache
+            for n_val, result in zip(pending, results):
+                answers[n_val] = result
+                cache[n_val] = result
+            # Evict least recently used results beyond the configured bound
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        
+        for n_val, json_request, future in batch:
+            if not future.done():
+                future.set_result(self.format_response(n_val, answers[n_val], json_request))
+
+    def answer_value(self, n_val: int) -> dict:
+        """
+        Compute one value with the scalar path, turning any exception into an error result.
+        
+        Used for the values of a batch whose batch call raised.
+        """
+        try:
+            return calculate_wormhole_total_stopping_time(n_val)
+        except Exception as e:
+            return self.internal_error(e)
+
+    def internal_error(self, error: Exception) -> dict:
+        """Return the error result answered for a value whose computation raised unexpectedly."""
+        return {
+            "total_stopping_time": -1,
+            "algorithm": "wormhole",
+            "prediction_type": "error",
+            "error_message": f"Internal error: {error}",
+            "computed_steps": 0,
+            "saved_steps": 0
+        }
+
+    async def run_batches(self) -> None:
+        """Answer the queued values, one batch per turn of the event loop."""
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < SERVER_MAX_BATCH and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                self.answer_batch(batch)
+            except Exception as e:
+                # Never leave a client waiting: answer what is left and keep the batcher running
+                self.batch_errors += 1
+                for n_val, json_request, future in batch:
+                    if not future.done():
+                        future.set_result(self.format_response(n_val, self.internal_error(e), json_request))
+
+    async def handle_connection(self, reader, writer) -> None:
+        """Read the request lines of one client and queue their responses in order."""
+        import asyncio
+        responses = asyncio.Queue()
+        responder = asyncio.ensure_future(self.write_responses(responses, writer))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                received = time.perf_counter()
+                request = line.decode("utf-8", "replace").strip()
+                if request:
+                    responses.put_nowait((self.submit(request), received))
+        except (ConnectionError, ValueError):
+            # Client vanished, or sent a line longer than the stream buffer limit
+            pass
+        finally:
+            responses.put_nowait(None)
+            await responder
+            writer.close()
+
+    async def write_responses(self, responses, writer) -> None:
+        """Write the responses of one client in request order as they resolve."""
+        while True:
+            item = await responses.get()
+            if item is None:
+                break
+            future, received = item
+            response = await future
+            if callable(response):
+                # Stats are taken now, after the earlier responses of this connection
+                response = response()
+            writer.write(response.encode("utf-8"))
+            self.requests += 1
+            self.latencies.append(time.perf_counter() - received)
+            if responses.empty():
+                # Flush once per burst of responses rather than once per line
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+
+    def stats_response(self) -> str:
+        """Return the response line of a stats request: stats() as JSON."""
+        import json
+        
+        return json.dumps(self.stats()) + "\n"
+
+    def stats(self) -> dict:
+        """
+        Return the server counters.
+        
+        Returns:
+            dict: requests, uptime and throughput, p50/p99 latency over the last
+                  SERVER_LATENCY_WINDOW requests, cache and batch counters
+        """
+        uptime = time.perf_counter() - self.started
+        latencies = sorted(self.latencies)
+        
+        def percentile(fraction):
+            if not latencies:
+                return 0.0
+            return round(latencies[int(round(fraction * (len(latencies) - 1)))] * 1000, 3)
+        
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "requests": self.requests,
+            "uptime_seconds": round(uptime, 3),
+            "requests_per_second": round(self.requests / uptime, 1) if uptime > 0 else 0.0,
+            "latency_p50_ms": percentile(0.50),
+            "latency_p99_ms": percentile(0.99),
+            "cache_size": len(self.cache),
+            "cache_max_size": self.cache_size,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": round(self.cache_hits / lookups, 4) if lookups else 0.0,
+            "invalid": self.invalid,
+            "batches": self.batches,
+            "mean_batch_size": round(self.batched_values / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "batch_errors": self.batch_errors,
+            "batch_kernel": "numpy" if np is not None else "scalar"
+        }
+
+def run_server(host: str = DEFAULT_SERVER_HOST, port: int = DEFAULT_SERVER_PORT, socket_path: str = None,
+               cache_size: int = DEFAULT_SERVER_CACHE_SIZE) -> dict:
+    """
+    Serve stopping-time queries with a StoppingTimeServer until interrupted.
+    
+    The server listens on a Unix socket when socket_path is given, else on a TCP
+    port, and runs until Ctrl+C or SIGTERM. Only the event loop API of Python 3.6
+    is used (no asyncio.run).
+    
+    Args:
+        host (str): TCP address to listen on (default: localhost only)
+        port (int): TCP port to listen on, 0 for any free port
+        socket_path (str): Path of a Unix socket to listen on instead of TCP
+        cache_size (int): Maximum number of cached result dictionaries
+    
+    Returns:
+        dict: The final StoppingTimeServer.stats()
+    
+    Raises:
+        ValueError: If cache_size is not positive or Unix sockets are not supported
+        OSError: If the address cannot be bound
+    
+    Examples:
+        $ python total_stopping_time_predictor.py --serve --port 8765 &
+        $ python total_stopping_time_predictor.py --query 27 28 stats --port 8765
+    """
+    import asyncio
+    import signal
+    
+    server = StoppingTimeServer(cache_size)
+    # Import NumPy now rather than while answering the first batch
+    load_numpy()
+    
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    server.loop = loop
+    server.queue = asyncio.Queue()
+    
+    if socket_path is not None:
+        if not hasattr(asyncio, "start_unix_server"):
+            raise ValueError("Unix sockets are not supported on this platform")
+        listener = loop.run_until_complete(asyncio.start_unix_server(server.handle_connection, path=socket_path))
+        address = socket_path
+    else:
+        listener = loop.run_until_complete(asyncio.start_server(server.handle_connection, host, port))
+        address = f"{host}:{listener.sockets[0].getsockname()[1]}"
+    loop.create_task(server.run_batches())
+    try:
+        loop.add_signal_handler(signal.SIGTERM, loop.stop)
+    except (NotImplementedError, AttributeError):
+        # No signal handlers in this event loop (Windows)
+        pass
+    
+    print(f"[*] Serving stopping-time queries on {address} ({server.stats()['batch_kernel']} batch kernel, "
+          f"Ctrl+C to stop)", file=sys.stderr)
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        loop.run_until_complete(listener.wait_closed())
+        # Stop the batcher and the open connections before closing the loop
+        all_tasks = getattr(asyncio, "all_tasks", None) or asyncio.Task.all_tasks
+        tasks = [task for task in all_tasks(loop) if not task.done()]
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
+    return server.stats()
+
+def query_server(requests: list, host: str = DEFAULT_SERVER_HOST, port: int = DEFAULT_SERVER_PORT,
+                 socket_path: str = None, timeout: float = SERVER_CLIENT_TIMEOUT) -> list:
+    """
+    Send requests to a running --serve server and return its responses.
+    
+    All requests are written on one connection before any response is read, so
+    the server answers them together in one batch.
+    
+    Args:
+        requests (list): Values or strings ("27", "stats") sent as plain lines, and
+                         dictionaries ({"n": 27}, {"command": "stats"}) sent as JSON
+        host (str): TCP address of the server
+        port (int): TCP port of the server
+        socket_path (str): Path of the server's Unix socket, used instead of TCP
+        timeout (float): Seconds to wait for the server
+    
+    Returns:
+        list: One response per non-blank request: a dictionary for JSON responses,
+              else the CSV row as a string
+    
+    Raises:
+        OSError: If the server cannot be reached or does not answer in time
+    
+    Examples:
+        >>> query_server([27, {"n": 28}])
+        ['27,111,121,16,95,', {'n': 28, 'total_stopping_time': 18, ...}]
+    """
+    import json
+    
+    import socket
+    
+    if socket_path is not None:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        try:
+            connection.connect(socket_path)
+        except OSError:
+            connection.close()
+            raise
+    else:
+        connection = socket.create_connection((host, port), timeout)
+    
+    with connection:
+        payload = "".join((json.dumps(request) if isinstance(request, dict) else str(request).strip()) + "\n"
+                          for request in requests)
+        connection.sendall(payload.encode("utf-8"))
+        # End of requests: the server closes the connection after the last response
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile("r", encoding="utf-8") as stream:
+            lines = stream.read().splitlines()
+    return [json.loads(line) if line.startswith("{") else line for line in lines]
+
+def benchmark_engines() -> dict:
+    """
+    Return the engines measured by run_benchmark(), keyed by name.
+    
+    Each engine is a function that computes the total stopping time of every
+    value of a list. Engines that need a table have a setup attribute that builds
+    it; run_benchmark() calls it outside the timed region and reports its time
+    separately. Engines that need an optional dependency are omitted when it is
+    not installed.
+    
+    Returns:
+        dict: Engine name -> function taking a list of values
+    """
+    def standard(values):
+        for value in values:
+            calculate_standard_total_stopping_time(value)
+    
+    def wormhole(values):
+        for value in values:
+            calculate_wormhole_total_stopping_time(value)
+    
+    def wormhole_strict(values):
+        # Re-walks the wormhole on every hit, as validation did before caching
+        previous = STRICT_REVALIDATE
+        set_strict_revalidation(True)
+        try:
+            for value in values:
+                calculate_wormhole_total_stopping_time(value)
+        finally:
+            set_strict_revalidation(previous)
+    
+    def memo(values):
+        memo_table = StoppingTimeMemo()
+        for value in values:
+            calculate_wormhole_total_stopping_time(value, memo=memo_table)
+    
+    jump_tables = []
+    
+    def jump_setup():
+        jump_tables[:] = [JumpTable()]
+    
+    def jump(values):
+        jump_table = jump_tables[0] if jump_tables else JumpTable()
+        for value in values:
+            calculate_standard_total_stopping_time(value, jump_table=jump_table)
+    
+    def batch(values):
+        calculate_wormhole_total_stopping_time(values, batch=True)
+    
+    engines = {
+        "standard": standard,
+        "wormhole": wormhole,
+        "wormhole-strict": wormhole_strict,
+        "memo": memo,
+        "jump": jump
+    }
+    if load_numpy() is not None:
+        engines["batch"] = batch
+    
+    # The wormhole table is built on first use: build it before timing, like the jump table
+    for name in ("wormhole", "wormhole-strict", "memo", "batch"):
+        if name in engines:
+            engines[name].setup = get_wormhole_table
+    jump.setup = jump_setup
+    return engines
+
+def peak_rss_kb():
+    """
+    Return the peak resident set size of the process in kilobytes.
+    
+    Returns:
+        int: Peak RSS in KB, or None when the resource module is unavailable (Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def run_benchmark(range_max: int = DEFAULT_BENCHMARK_RANGE, samples: int = DEFAULT_BENCHMARK_SAMPLES,
+                  seed: int = 0, engines: list = None) -> dict:
+    """
+    Measure the wall-clock time of every engine over a range and a random sample.
+    
+    Two workloads are timed:
+    - range: every n in [1, range_max]
+    - random: samples values drawn uniformly from [1, BENCHMARK_RANDOM_MAX] with the given seed
+    
+    For each workload and engine the report contains the elapsed time, ns per number,
+    numbers per second, the peak RSS of the process after the run, and the speedup
+    relative to the standard engine on the same workload. Table builds (the engine's
+    setup) are not timed with the run; their time is reported as setup_seconds. Steps saved are not time
+    saved: this is the measurement behind the efficiency claims.
+    
+    Args:
+        range_max (int): Upper bound of the range workload (inclusive)
+        samples (int): Number of values in the random workload
+        seed (int): Seed of the random workload, so runs are reproducible
+        engines (list): Names of the engines to run (default: all available, see
+                        benchmark_engines)
+    
+    Returns:
+        dict: Machine-readable report with "environment", "parameters" and "results"
+    
+    Raises:
+        ValueError: If an unknown engine is requested
+    
+    Examples:
+        >>> report = run_benchmark(range_max=1000, samples=100, engines=["standard", "wormhole"])
+        >>> [result["engine"] for result in report["results"]]
+        ['standard', 'wormhole', 'standard', 'wormhole']
+    
+    Notes:
+        - Peak RSS is process-wide and never decreases, so it is an upper bound per engine
+        - The "range" engine (compute_range) only runs on the range workload
+    """
+    available = benchmark_engines()
+    if engines is None:
+        engines = list(available) + ["range"]
+    for name in engines:
+        if name not in available and name != "range":
+            raise ValueError(f"Unknown or unavailable engine {name}, expected one of {', '.join(list(available) + ['range'])}")
+    
+    # Imported here, only the benchmark needs them
+    import platform
+    import random
+    
+    generator = random.Random(seed)
+    workloads = {
+        "range": list(range(1, range_max + 1)),
+        "random": [generator.randint(1, BENCHMARK_RANDOM_MAX) for _ in range(samples)]
+    }
+    
+    results = []
+    for workload, values in workloads.items():
+        if not values:
+            continue
+        baseline_seconds = None
+        for name in engines:
+            if name == "range":
+                # The sweep solver only applies to contiguous ranges
+                if workload != "range":
+                    continue
+                run = lambda values: compute_range(1, range_max + 1)
+            else:
+                run = available[name]
+            
+            # Build the engine's tables first, so only the computation is timed
+            setup_seconds = 0.0
+            setup = getattr(run, "setup", None)
+            if setup is not None:
+                start_time = time.perf_counter()
+                setup()
+                setup_seconds = time.perf_counter() - start_time
+            
+            start_time = time.perf_counter()
+            run(values)
+            seconds = time.perf_counter() - start_time
+            
+            if name == "standard":
+                baseline_seconds = seconds
+            results.append({
+                "workload": workload,
+                "engine": name,
+                "count": len(values),
+                "seconds": round(seconds, 6),
+                "setup_seconds": round(setup_seconds, 6),
+                "ns_per_number": round(seconds * 1e9 / len(values), 1),
+                "numbers_per_second": round(len(values) / seconds, 1) if seconds > 0 else None,
+                "peak_rss_kb": peak_rss_kb(),
+                "speedup": round(baseline_seconds / seconds, 3) if baseline_seconds and seconds > 0 else None
+            })
+    
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")
+        },
+        "parameters": {
+            "range_max": range_max,
+            "samples": samples,
+            "seed": seed,
+            "random_max": BENCHMARK_RANDOM_MAX
+        },
+        "results": results
+    }
+
+def display_benchmark_results(report: dict) -> None:
+    """
+    Display the benchmark report as a table.
+    
+    Args:
+        report (dict): Report returned by run_benchmark()
+    
+    Console Output:
+        ====================================================================================================
+        ENGINE BENCHMARK
+        ====================================================================================================
+        Workload   Engine            Numbers     Seconds    ns/number    numbers/sec  Peak RSS KB  Speedup
+        ----------------------------------------------------------------------------------------------------
+        range      standard           100000       0.612       6120.4       163389.1        21000    1.000
+        ...
+        Setup (not included above): range/wormhole 0.002 s, range/jump 0.004 s, random/jump 0.004 s
+    """
+    print("=" * 100)
+    print("ENGINE BENCHMARK")
+    print("=" * 100)
+    print(f"{'Workload':<10} {'Engine':<16} {'Numbers':>9} {'Seconds':>11} {'ns/number':>12} "
+          f"{'numbers/sec':>14} {'Peak RSS KB':>12} {'Speedup':>8}")
+    print("-" * 100)
+    for result in report["results"]:
+        speedup = f"{result['speedup']:.3f}" if result["speedup"] is not None else "-"
+        numbers_per_second = result["numbers_per_second"] if result["numbers_per_second"] is not None else "-"
+        peak_rss = result["peak_rss_kb"] if result["peak_rss_kb"] is not None else "-"
+        print(f"{result['workload']:<10} {result['engine']:<16} {result['count']:>9} {result['seconds']:>11.3f} "
+              f"{result['ns_per_number']:>12.1f} {numbers_per_second:>14} {peak_rss:>12} {speedup:>8}")
+    setups = [f"{result['workload']}/{result['engine']} {result['setup_seconds']:.3f} s"
+              for result in report["results"] if result.get("setup_seconds", 0) >= 0.0005]
+    if setups:
+        print(f"Setup (not included above): {', '.join(setups)}")
+    print("=" * 100)
+
+def test_sequence_equivalence(max_n: int, workers: int = 1, chunk_size: int = None, checkpoint_path: str = None,
+                              checkpoint_every: int = DEFAULT_CHECKPOINT_INTERVAL, resume_path: str = None,
+                              quiet: bool = False, progress_every: int = None, detail_path: str = None,
+                              histograms_path: str = None) -> None:
+    """
+    Test mathematical equivalence between standard and wormhole algorithms for a range of inputs.
+    
+    This function performs comprehensive validation testing by comparing the sequences
+    generated by both algorithms across a range of input values from 1 to max_n.
+    It serves as the primary quality assurance mechanism to ensure that wormhole
+    optimization produces mathematically identical results to the standard algorithm.
+    
+    The testing process:
+    1. Iterate through all integers from 1 to max_n
+    2. Generate sequences using both standard and wormhole algorithms
+    3. Compare sequences element-by-element for exact matches
+    4. Track statistics about wormhole usage and computational savings
+    5. Report any discrepancies with detailed diagnostic information
+    6. Display comprehensive summary of testing results
+    
+    Args:
+        max_n (int): The maximum number to test (inclusive). Testing range is [1, max_n].
+                    Should be reasonable size to avoid excessive computation time.
+        workers (int): Number of worker processes. With more than one worker the range
+                      is split into chunks that run on a process pool, and the merged
+                      counters are identical to those of a serial run.
+        chunk_size (int): Numbers per chunk in parallel mode (see run_parallel_equivalence)
+        checkpoint_path (str): Save the loop state (last n, counters, differences) to this
+                              file every checkpoint_every numbers, with an atomic write
+        checkpoint_every (int): Numbers tested between two checkpoints
+        resume_path (str): Continue from the checkpoint in this file. The final totals are
+                          identical to an uninterrupted run.
+        quiet (bool): Only keep the counters: no per-n lines on the console. Combine with
+                     progress_every for a progress indicator and detail_path for a log.
+        progress_every (int): Print a progress line (numbers/sec, ETA) each time this
+                             many more numbers have been tested
+        detail_path (str): Write the per-n lines to this file through a large buffer
+                          instead of the console
+        histograms_path (str): Accumulate a RangeStatistics of the run (histograms, records,
+                              entry point hits) and write it to this file as JSON
+    
+    Returns:
+        None: This function prints results directly to console and doesn't return values.
+              All output is displayed in real-time during execution.
+    
+    Console Output:
+        - Header with testing information
+        - Real-time progress for each number tested:
+          * Success cases showing wormhole usage and savings
+          * Error cases highlighting sequence differences
+        - Comprehensive summary with statistics:
+          * Total numbers tested
+          * Percentage of identical sequences
+          * Wormhole usage statistics
+          * Computational savings metrics
+          * Detailed error reports (if any)
+    
+    Examples:
+        >>> test_sequence_equivalence(100)
+        # Outputs detailed testing results for n=1 to n=100
+        
+        >>> test_sequence_equivalence(1000)
+        # Comprehensive testing across larger range
+        
+        >>> test_sequence_equivalence(10**8, workers=64)
+        # Same summary as a serial run, computed on 64 processes
+        
+        >>> test_sequence_equivalence(10**9, checkpoint_path="run.json", resume_path="run.json")
+        # Continues an interrupted run and keeps checkpointing to the same file
+        
+        >>> test_sequence_equivalence(10**9, quiet=True, progress_every=10**7)
+        # One progress line per 10 million numbers, then the usual summary
+        
+        >>> test_sequence_equivalence(10**9, workers=64, histograms_path="histograms.json")
+        # Same run, plus the statistics of the whole range in constant memory
+    
+    Notes:
+        - This is the primary function for validating wormhole algorithm correctness
+        - Any sequence differences indicate errors in wormhole dictionary entries
+        - Essential for quality assurance before deploying wormhole optimization
+        - Provides valuable statistics about optimization effectiveness
+        - Should be run regularly when updating wormhole dictionary
+        - Execution time scales linearly with max_n and complexity of sequences
+        - Parallel runs only print differences, errors and chunk progress, not per-n lines
+        - At large max_n, formatting and printing one line per n costs more than the
+          arithmetic; quiet mode skips it entirely unless a detail file is requested
+        - Critical for maintaining mathematical integrity of the optimization
+    """
+    import json
+    
+    # Display testing header with configuration information
+    print("=" * 100)
+    print("  COLLATZ TOTAL STOPPING TIME PREDICTOR")
+    print("=" * 100)
+    
+    # Display testing configuration and start message
+    print(f"\n[*] Testing sequences equivalence for n <= {max_n}")
+    print("")
+
+    # Continue an interrupted run from its checkpoint, or start from scratch
+    if resume_path is not None:
+        last_n, totals = load_checkpoint(resume_path, max_n)
+        print(f"[*] Resuming from {resume_path} after n = {last_n}")
+        print("")
+    else:
+        last_n, totals = 0, new_equivalence_counters()
+    if histograms_path is not None and totals["statistics"] is None:
+        if last_n > 0:
+            raise ValueError(f"Checkpoint {resume_path} has no statistics, resume it without --histograms")
+        totals["statistics"] = RangeStatistics()
+    
+    # Per-n lines go to the detail file, to the console, or nowhere in quiet mode
+    detail_file = open(detail_path, "w", buffering=OUTPUT_BLOCK_SIZE * 64) if detail_path is not None else None
+    progress = EquivalenceProgress(max_n, progress_every, last_n) if progress_every is not None else None
+    
+    try:
+        if workers <= 1:
+            # Serial run with real-time per-n output
+            detail_stream = detail_file if detail_file is not None else (None if quiet else sys.stdout)
+            run_serial_equivalence(last_n + 1, max_n, totals, checkpoint_path, checkpoint_every,
+                                   detail_stream, progress)
+        else:
+            # Parallel run: split the range into chunks and merge the partial counters
+            run_parallel_equivalence(max_n, workers, chunk_size, last_n + 1, totals, checkpoint_path, checkpoint_every,
+                                     quiet, detail_file, progress)
+    except KeyboardInterrupt:
+        # The last checkpoint holds every completed chunk
+        if checkpoint_path is not None:
+            print(f"\n[*] Progress saved in {checkpoint_path}, continue with --resume {checkpoint_path}")
+        raise
+    finally:
+        if detail_file is not None:
+            detail_file.close()
+    
+    # Display comprehensive summary of all testing results
+    display_equivalence_summary(max_n, totals["identical_count"], totals["different_count"], totals["error_count"],
+                                totals["entry_points_used"], totals["total_savings"], totals["differences"])
+    if histograms_path is not None:
+        with open(histograms_path, "w") as histograms_file:
+            json.dump(totals["statistics"].to_dict(), histograms_file, indent=2)
+        print(f"\n[*] Statistics written to {histograms_path}")
+
+def new_equivalence_counters() -> dict:
+    """
+    Create an empty set of counters for sequence equivalence testing.
+    
+    Returns:
+        dict: Counters with the same meaning as the arguments of display_equivalence_summary():
+            - identical_count (int): Number of cases where sequences matched exactly
+            - different_count (int): Number of cases where sequences differed
+            - error_count (int): Number of cases where computation errors occurred
+            - entry_points_used (int): Number of cases where wormholes were utilized
+            - total_savings (int): Total computational steps saved across all tests
+            - differences (list): Detailed list of the first MAX_RECORDED_DIFFERENCES cases
+                                  where sequences differed (different_count counts them all)
+            - errors (list): (n, error message) pairs for the first MAX_RECORDED_ERRORS
+                             cases that failed to compute (error_count counts them all)
+            - stop (int): End (exclusive) of the last range merged into the counters
+            - statistics (RangeStatistics): Histograms of the tested range, or None when
+                                            they are not collected
+    """
+    return {
+        "stop": 0,
+        "statistics": None,
+        "identical_count": 0,
+        "different_count": 0,
+        "error_count": 0,
+        "entry_points_used": 0,
+        "total_savings": 0,
+        "differences": [],
+        "errors": []
+    }
+
+def merge_equivalence_counters(totals: dict, partial: dict) -> dict:
+    """
+    Merge the partial counters of one chunk into the running totals.
+    
+    Chunks must be merged in ascending order of their ranges so that the
+    differences list keeps the same order as a serial run.
+    
+    Args:
+        totals (dict): Running totals created by new_equivalence_counters()
+        partial (dict): Counters returned by run_equivalence_chunk()
+    
+    Returns:
+        dict: The updated totals (modified in place)
+    """
+    for key in ("identical_count", "different_count", "error_count", "entry_points_used", "total_savings"):
+        totals[key] += partial[key]
+    totals["stop"] = partial["stop"]
+    totals["differences"].extend(partial["differences"][:MAX_RECORDED_DIFFERENCES - len(totals["differences"])])
+    totals["errors"].extend(partial["errors"][:MAX_RECORDED_ERRORS - len(totals["errors"])])
+    if partial["statistics"] is not None:
+        if totals["statistics"] is None:
+            totals["statistics"] = RangeStatistics()
+        totals["statistics"].merge(partial["statistics"])
+    return totals
+
+def run_equivalence_chunk(start: int, stop: int, detail_stream=None, collect_statistics: bool = False) -> dict:
+    """
+    Compare standard and wormhole sequences for every n in the range [start, stop).
+    
+    This is the unit of work of test_sequence_equivalence(). A serial run processes
+    the whole range as one chunk, while a parallel run sends many chunks to a
+    process pool and merges the returned counters.
+    
+    Args:
+        start (int): First number to test (inclusive)
+        stop (int): Last number to test (exclusive)
+        detail_stream: Text stream that receives the per-n lines as each number is
+                       tested (sys.stdout for real-time output, a file for a detail
+                       log), or None to only count
+        collect_statistics (bool): Also accumulate a RangeStatistics of the chunk from the
+                                   identical sequences (the others count as errors)
+    
+    Returns:
+        dict: Partial counters as described in new_equivalence_counters()
+    
+    Examples:
+        >>> counters = run_equivalence_chunk(1, 101)
+        >>> counters["identical_count"]
+        100
+    """
+    counters = new_equivalence_counters()
+    counters["stop"] = stop
+    statistics = RangeStatistics() if collect_statistics else None
+    counters["statistics"] = statistics
+    
+    # Main testing loop: iterate through all numbers in range
+    for n in range(start, stop):
+        
+        # Compare sequences generated by both algorithms for current n
+        comparison = compare_sequences(n)
+        
+        # Handle cases where comparison failed due to computational errors
+        if "error" in comparison:
+            counters["error_count"] += 1
+            if len(counters["errors"]) < MAX_RECORDED_ERRORS:
+                counters["errors"].append((n, comparison["error"]))
+            if statistics is not None:
+                statistics.add_error(n)
+            if detail_stream is not None:
+                print(f"    ERROR n={n}: {comparison['error']}", file=detail_stream)
+            continue
+        
+        # Process cases where sequences are mathematically identical
+        if comparison["sequences_identical"]:
+            counters["identical_count"] += 1
+            if statistics is not None:
+                entry_point_info = comparison["entry_point_info"]
+                statistics.add(n, comparison["standard_length"] - 1, entry_point_info.get("entry_point_found"),
+                               entry_point_info.get("entry_point_position"))
+            
+            # Track and report wormhole usage statistics
+            if comparison["entry_point_info"]["wormhole_used"]:
+                counters["entry_points_used"] += 1
+                wormhole_len = comparison["entry_point_info"]["wormhole_length"]
+                counters["total_savings"] += wormhole_len - 1  # Steps saved by using wormhole
+                
+                if detail_stream is not None:
+                    entry_point = comparison["entry_point_info"]["entry_point_found"]
+                    entry_point_pos = comparison["entry_point_info"]["entry_point_position"]
+                    print(f"\tn={n} uses the wormhole {entry_point} from position {entry_point_pos}, saving {wormhole_len-1} steps", file=detail_stream)
+            elif detail_stream is not None:
+                # Case where no wormhole was available or needed
+                print(f"\tn={n} uses the trivial cycle, so no saves", file=detail_stream)
+
+        else:
+            # Critical case: sequences differ, indicating potential wormhole error
+            counters["different_count"] += 1
+            if len(counters["differences"]) < MAX_RECORDED_DIFFERENCES:
+                counters["differences"].append(comparison)
+            if statistics is not None:
+                statistics.add_error(n)
+            if detail_stream is not None:
+                print_sequence_difference(comparison, detail_stream)
+    
+    return counters
+
+def print_sequence_difference(comparison: dict, stream=None) -> None:
+    """
+    Print the one-line report for a number whose sequences differ.
+    
+    Args:
+        comparison (dict): Result from compare_sequences() for a mismatching n
+        stream: Text stream to write to (default: sys.stdout)
+    """
+    # Extract diagnostic information for error reporting
+    diff_pos = comparison.get("first_difference_position", "unknown")
+    standard_val = comparison.get("standard_value_at_diff", "?")
+    wormhole_val = comparison.get("wormhole_value_at_diff", "?")
+    print(f"\tn={comparison['n']} \033[31mSEQUENCES DIFFER\033[0m at position {diff_pos} (standard value is {standard_val} and wormhole is {wormhole_val})", file=stream)
+
+def equivalence_chunk_worker(task: tuple) -> dict:
+    """
+    Process pool entry point: test one (start, stop) chunk without printing.
+    
+    Args:
+        task (tuple): The (start, stop, detailed, collect_statistics) task. stop is
+                     exclusive, and when detailed is true the per-n lines are collected as text.
+    
+    Returns:
+        dict: Partial counters from run_equivalence_chunk(), plus a "detail" string
+              holding the per-n lines of the chunk when detailed is true
+    """
+    start, stop, detailed, collect_statistics = task
+    if not detailed:
+        return run_equivalence_chunk(start, stop, collect_statistics=collect_statistics)
+    
+    # Collect the lines in memory; the parent writes them to the detail file in chunk order
+    detail_stream = io.StringIO()
+    partial = run_equivalence_chunk(start, stop, detail_stream, collect_statistics)
+    partial["detail"] = detail_stream.getvalue()
+    return partial
+
+def split_range(start: int, stop: int, chunk_size: int):
+    """
+    Yield consecutive (chunk_start, chunk_stop) pairs covering [start, stop).
+    
+    Args:
+        start (int): First value of the range (inclusive)
+        stop (int): End of the range (exclusive)
+        chunk_size (int): Maximum number of values per chunk
+    
+    Yields:
+        tuple: (chunk_start, chunk_stop) pairs in ascending order
+    
+    Examples:
+        >>> list(split_range(1, 11, 4))
+        [(1, 5), (5, 9), (9, 11)]
+    """
+    for chunk_start in range(start, stop, chunk_size):
+        yield chunk_start, min(chunk_start + chunk_size, stop)
+
+def save_checkpoint(path: str, max_n: int, last_n: int, totals: dict) -> None:
+    """
+    Atomically write the state of a sequence equivalence run to a checkpoint file.
+    
+    The state is written to a temporary file next to path and then moved over it,
+    so an interruption while saving never leaves a truncated checkpoint behind.
+    
+    Args:
+        path (str): Checkpoint file path
+        max_n (int): The maximum number of the run
+        last_n (int): The last number whose results are included in totals
+        totals (dict): Counters as described in new_equivalence_counters()
+    """
+    import json
+    
+    counters = dict(totals)
+    if totals["statistics"] is not None:
+        counters["statistics"] = totals["statistics"].to_dict()
+    state = {
+        "version": CHECKPOINT_VERSION,
+        "max_n": max_n,
+        "last_n": last_n,
+        "counters": counters
+    }
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as checkpoint_file:
+        json.dump(state, checkpoint_file)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temporary_path, path)
+
+def load_checkpoint(path: str, max_n: int) -> tuple:
+    """
+    Read the state of an interrupted sequence equivalence run.
+    
+    Args:
+        path (str): Checkpoint file written by save_checkpoint()
+        max_n (int): The maximum number of the run being resumed
+    
+    Returns:
+        tuple: (last_n, totals) with the last tested number and the counters so far
+    
+    Raises:
+        ValueError: If the file is not a valid checkpoint or belongs to a run with another max_n
+    """
+    import json
+    
+    try:
+        with open(path, "r") as checkpoint_file:
+            state = json.load(checkpoint_file)
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"unsupported checkpoint version {state.get('version')}")
+        last_n = int(state["last_n"])
+        totals = new_equivalence_counters()
+        for key in ("identical_count", "different_count", "error_count", "entry_points_used", "total_savings"):
+            totals[key] = int(state["counters"][key])
+        totals["differences"] = state["counters"]["differences"]
+        totals["errors"] = [tuple(error) for error in state["counters"]["errors"]]
+        totals["stop"] = last_n + 1
+        if state["counters"].get("statistics") is not None:
+            totals["statistics"] = RangeStatistics.from_dict(state["counters"]["statistics"])
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Cannot resume from {path}: {e}") from e
+    
+    if state["max_n"] != max_n:
+        raise ValueError(f"Checkpoint {path} belongs to a run with max_n={state['max_n']}, not {max_n}")
+    return last_n, totals
+
+class EquivalenceProgress:
+    """
+    Rate-limited progress line for long sequence equivalence runs.
+    
+    Instead of one line per tested number, a single line with the tested count,
+    the throughput and the estimated time to completion is printed each time at
+    least `every` more numbers have been tested.
+    
+    Attributes:
+        max_n (int): The maximum number of the run
+        every (int): Minimum number of tested values between two progress lines
+        first (int): The last number tested before this run started (0, or last_n on resume)
+        last_reported (int): The last number reported in a progress line
+        started (float): perf_counter() value at the start of the run
+    
+    Examples:
+        >>> progress = EquivalenceProgress(10**9, 10**7)
+        >>> progress.update(10**7)
+        	[*] Tested 10000000 out of 1000000000 numbers (812,345 numbers/sec, ETA 1219s)
+    """
+    
+    def __init__(self, max_n: int, every: int, first: int = 0):
+        self.max_n = max_n
+        self.every = every
+        self.first = first
+        self.last_reported = first
+        self.started = time.perf_counter()
+    
+    def update(self, tested_up_to: int) -> None:
+        """
+        Report that every number up to tested_up_to has been tested.
+        
+        A line is printed only once `every` numbers have been tested since the
+        previous line, and always for the last number of the run.
+        
+        Args:
+            tested_up_to (int): The last tested number
+        """
+        if tested_up_to - self.last_reported < self.every and tested_up_to < self.max_n:
+            return
+        self.last_reported = tested_up_to
+        
+        # Throughput of this run only, so that a resumed run estimates its own speed
+        elapsed = time.perf_counter() - self.started
+        rate = (tested_up_to - self.first) / elapsed if elapsed > 0 else 0.0
+        eta = (self.max_n - tested_up_to) / rate if rate > 0 else 0.0
+        print(f"\t[*] Tested {tested_up_to} out of {self.max_n} numbers ({rate:,.0f} numbers/sec, ETA {eta:.0f}s)",
+              flush=True)
+
+def run_serial_equivalence(start: int, max_n: int, totals: dict, checkpoint_path: str = None,
+                           checkpoint_every: int = DEFAULT_CHECKPOINT_INTERVAL, detail_stream=sys.stdout,
+                           progress: EquivalenceProgress = None) -> dict:
+    """
+    Run the sequence equivalence test for [start, max_n] in this process.
+    
+    Without a checkpoint or progress reporting the range is tested as a single
+    chunk. Otherwise it is tested in chunks of the smaller interval; the state is
+    saved once checkpoint_every numbers were tested since the last save, so an
+    interrupted run loses at most one checkpoint interval of work.
+    
+    Args:
+        start (int): First number to test
+        max_n (int): The maximum number to test (inclusive)
+        totals (dict): Counters to merge the results into (modified in place); histograms
+                      are collected when totals["statistics"] is a RangeStatistics
+        checkpoint_path (str): Optional checkpoint file
+        checkpoint_every (int): Numbers tested between checkpoints
+        detail_stream: Destination of the per-n lines, or None (see run_equivalence_chunk)
+        progress (EquivalenceProgress): Optional rate-limited progress reporter
+    
+    Returns:
+        dict: The merged counters
+    """
+    collect_statistics = totals["statistics"] is not None
+    if checkpoint_path is None and progress is None:
+        return merge_equivalence_counters(totals, run_equivalence_chunk(start, max_n + 1, detail_stream,
+                                                                        collect_statistics))
+    
+    # Chunks end on every checkpoint or progress boundary
+    intervals = []
+    if checkpoint_path is not None:
+        intervals.append(checkpoint_every)
+    if progress is not None:
+        intervals.append(progress.every)
+    
+    last_saved = start - 1
+    for chunk_start, chunk_stop in split_range(start, max_n + 1, min(intervals)):
+        merge_equivalence_counters(totals, run_equivalence_chunk(chunk_start, chunk_stop, detail_stream,
+                                                                 collect_statistics))
+        if checkpoint_path is not None and (chunk_stop - 1 - last_saved >= checkpoint_every or chunk_stop > max_n):
+            last_saved = chunk_stop - 1
+            save_checkpoint(checkpoint_path, max_n, last_saved, totals)
+        if progress is not None:
+            progress.update(chunk_stop - 1)
+    return totals
+
+def run_parallel_equivalence(max_n: int, workers: int, chunk_size: int = None, start: int = 1, totals: dict = None,
+                             checkpoint_path: str = None, checkpoint_every: int = DEFAULT_CHECKPOINT_INTERVAL,
+                             quiet: bool = False, detail_stream=None, progress: EquivalenceProgress = None) -> dict:
+    """
+    Run the sequence equivalence test for [1, max_n] on a pool of worker processes.
+    
+    The range is split into chunks that are tested independently by
+    run_equivalence_chunk(). Results are consumed in chunk order, so the merged
+    counters (including the order of the differences list) are identical to
+    those of a serial run. Per-n progress lines are not printed, since output
+    from several processes would interleave; instead, differences and errors
+    are reported as each chunk completes, followed by a progress line.
+    
+    Args:
+        max_n (int): The maximum number to test (inclusive)
+        workers (int): Number of worker processes
+        chunk_size (int): Numbers per chunk. Defaults to DEFAULT_CHUNK_SIZE or
+                         less, so that every worker receives several chunks.
+        start (int): First number to test (greater than 1 when resuming)
+        totals (dict): Counters to merge the results into (default: new counters)
+        checkpoint_path (str): Optional checkpoint file, saved once at least
+                              checkpoint_every numbers were tested since the last save
+        checkpoint_every (int): Numbers tested between checkpoints
+        quiet (bool): Do not print differences, errors or chunk progress while running
+        detail_stream: Optional text stream that receives the per-n lines of every
+                       chunk, written in chunk order
+        progress (EquivalenceProgress): Rate-limited progress reporter that replaces
+                                        the per-chunk "Tested" lines
+    
+    Returns:
+        dict: Merged counters as described in new_equivalence_counters()
+    """
+    # Keep chunks small enough to balance the load across all workers
+    if chunk_size is None:
+        chunk_size = max(1, min(DEFAULT_CHUNK_SIZE, -(-max_n // (workers * 8))))
+    
+    if totals is None:
+        totals = new_equivalence_counters()
+    last_saved = start - 1
+    
+    # Imported on first use: multiprocessing is slow to import and only parallel runs need it
+    from multiprocessing import Pool
+    
+    with Pool(processes=workers) as pool:
+        # imap returns results in submission order, which keeps the merge deterministic
+        # and makes the tested numbers a contiguous prefix of the range for checkpoints
+        tasks = ((chunk_start, chunk_stop, detail_stream is not None, totals["statistics"] is not None)
+                 for chunk_start, chunk_stop in split_range(start, max_n + 1, chunk_size))
+        for partial in pool.imap(equivalence_chunk_worker, tasks):
+            if detail_stream is not None:
+                detail_stream.write(partial.pop("detail"))
+            merge_equivalence_counters(totals, partial)
+            if checkpoint_path is not None and (partial["stop"] - 1 - last_saved >= checkpoint_every
+                                                or partial["stop"] > max_n):
+                last_saved = partial["stop"] - 1
+                save_checkpoint(checkpoint_path, max_n, last_saved, totals)
+            
+            if progress is not None:
+                progress.update(partial["stop"] - 1)
+            if quiet:
+                continue
+            
+            # Report chunk-level problems in the same format as the serial run
+            for n, error in partial["errors"]:
+                print(f"    ERROR n={n}: {error}")
+            for comparison in partial["differences"]:
+                print_sequence_difference(comparison)
+            
+            if progress is None:
+                tested = totals["identical_count"] + totals["different_count"] + totals["error_count"]
+                print(f"\t[*] Tested {tested} out of {max_n} numbers")
+    
+    return totals
+
+def display_equivalence_summary(max_n: int, identical_count: int, different_count: int, 
+                               error_count: int, entry_points_used: int, total_savings: int,
+                               differences: list) -> None:
+    """
+    Display comprehensive summary of sequence equivalence testing results.
+    
+    This function generates a detailed report summarizing the results of sequence
+    equivalence testing between standard and wormhole algorithms. It provides
+    statistical analysis, efficiency metrics, and detailed error reporting to
+    help assess the quality and performance of the wormhole optimization.
+    
+    The summary includes:
+    1. Overall testing statistics (counts and percentages)
+    2. Wormhole usage and efficiency metrics
+    3. Detailed error analysis (if any differences found)
+    4. Success/failure determination with clear conclusions
+    
+    Args:
+        max_n (int): The maximum number that was tested (defines the testing range)
+        identical_count (int): Number of cases where sequences were exactly identical
+        different_count (int): Number of cases where sequences differed
+        error_count (int): Number of cases where computation errors occurred
+        entry_points_used (int): Number of cases where wormholes were successfully utilized
+        total_savings (int): Total computational steps saved across all wormhole usage
+        differences (list): Detailed list of comparison results for the first
+                           MAX_RECORDED_DIFFERENCES cases where sequences differed
+    
+    Returns:
+        None: This function prints the summary directly to console.
+    
+    Console Output Structure:
+        - Header section with title
+        - Basic statistics (tested, identical, different counts with percentages)
+        - Error analysis section:
+          * If differences found: detailed breakdown of each discrepancy
+          * If no differences: success message with efficiency metrics
+        - Wormhole performance metrics:
+          * Usage frequency and percentage
+          * Total and average computational savings
+        - Final conclusion (SUCCESS or ERROR status)
+    
+    Examples:
+        # For successful testing (no differences):
+        >>> display_equivalence_summary(100, 98, 0, 2, 45, 2340, [])
+        # Outputs success summary with efficiency metrics
+        
+        # For testing with sequence differences:
+        >>> display_equivalence_summary(50, 48, 2, 0, 20, 1200, [diff1, diff2])
+        # Outputs detailed error analysis and diagnostic information
+    
+    Notes:
+        - This function is called by test_sequence_equivalence() to present results
+        - Provides clear SUCCESS/ERROR determination for quality assurance
+        - Essential for identifying wormhole dictionary errors
+        - Calculates and displays optimization effectiveness metrics
+        - Uses color coding (red) for critical error highlighting
+        - Serves as the final report for validation testing
+    """
+    total_tested = max_n  # Total number of values tested in the range [1, max_n]
+    
+    # Display formatted summary header
+    print("\n" + "=" * 100)
+    print("SEQUENCE EQUIVALENCE SUMMARY")
+    print("=" * 100)
+    
+    # Display basic testing statistics with percentages
+    print(f"Numbers tested: {total_tested}")
+    print(f"Sequences identical: {identical_count} ({100*identical_count/total_tested:.3f}%)")
+    print(f"Sequences different: {different_count} ({100*different_count/total_tested:.3f}%)")
+      
+    # Analyze and report sequence differences (critical errors)
+    if different_count > 0:
+        # Error case: sequences differ, indicating wormhole dictionary problems
+        print(f"Errors: {different_count} sequences are DIFFERENT. This indicates errors in a wormhole sequence.")
+        
+        # Provide detailed breakdown of each difference found
+        if differences:
+            shown = f" (first {len(differences)})" if len(differences) < different_count else ""
+            print(f"\nRegistered differences{shown}:")
+            for i, diff in enumerate(differences):
+                n = diff["n"]
+                pos = diff.get("first_difference_position", "?")
+                standard_val = diff.get("standard_value_at_diff", "?")
+                wormhole_val = diff.get("wormhole_value_at_diff", "?")
+                print(f"  n={n} differs at position {pos} (expected {standard_val}, got {wormhole_val})")
+    else:
+        # Success case: all sequences are mathematically identical
+        print(f"Errors: {different_count}")
+        
+        # Display wormhole optimization efficiency metrics (only when successful)
+        if entry_points_used > 0:
+            print("\nWormholes usage:")
+            print(f"  Cases of n using wormholes: {entry_points_used} out of {total_tested} ({100*entry_points_used/total_tested:.3f}%)")
+            print(f"  Total steps saved: {total_savings}")
+            print(f"  Average steps saved per wormholes: {total_savings/entry_points_used:.3f}")
+        
+        # Display final success message
+        print("\nSUCCESS: All sequences are identical!")
+        print("The wormhole algorithm produced exactly the same results as standard algorithm.")
+    
+    # Display footer
+    print("=" * 100)
+
+def display_range_statistics(statistics: RangeStatistics) -> None:
+    """
+    Display the summary of a RangeStatistics (--statistics).
+    
+    Args:
+        statistics (RangeStatistics): Statistics from run_range_statistics()
+    
+    Console Output:
+        - Range, number of values and errors
+        - Smallest, largest and mean stopping time, and the stopping time records
+        - Entry point hit rate, saved steps and the most used entry points
+        - Distribution of the percent of steps saved, in 10% bands
+    """
+    print("=" * 100)
+    print("RANGE STATISTICS")
+    print("=" * 100)
+    print(f"Numbers: {statistics.count} in [{statistics.first}, {statistics.last}] ({statistics.errors} errors)")
+    if statistics.count == 0:
+        print("=" * 100)
+        return
+    
+    print(f"Stopping time: min {statistics.min_stopping_time} (n={statistics.min_holder}), "
+          f"max {statistics.max_stopping_time} (n={statistics.max_holder}), "
+          f"mean {statistics.total_steps / statistics.count:.3f}")
+    last_record = statistics.records[-1]
+    print(f"Records: {len(statistics.records)} (last: n={last_record[0]} with {last_record[1]} steps)")
+    
+    hits = statistics.count - statistics.no_entry_point
+    print("\nWormholes usage:")
+    print(f"  Cases of n using wormholes: {hits} out of {statistics.count} ({100 * hits / statistics.count:.3f}%)")
+    print(f"  Total steps saved: {statistics.saved_steps} out of {statistics.total_steps} "
+          f"({100 * statistics.saved_steps / statistics.total_steps if statistics.total_steps else 0:.3f}%)")
+    print("  Most used entry points:")
+    ranking = sorted(statistics.entry_point_hits.items(), key=lambda item: (-item[1], item[0]))
+    for entry_point, count in ranking[:STATS_TOP_ENTRY_POINTS]:
+        print(f"    {entry_point:>10}: {count} ({100 * count / statistics.count:.3f}%)")
+    
+    print("\nSteps saved:")
+    bands = [0] * 10
+    for percent, count in statistics.percent_saved.items():
+        bands[min(percent // 10, 9)] += count  # 100% belongs to the last band
+    for band, count in enumerate(bands):
+        upper = "100%]" if band == 9 else f"{band * 10 + 10}%)"
+        print(f"  [{band * 10}%, {upper:<5} {count:>12} ({100 * count / statistics.count:.3f}%)")
+    print("=" * 100)
+
+def display_complete_analysis(n: Union[int, str, float]) -> None:
+    """
+    Display comprehensive analysis comparing standard and wormhole algorithms for a single input.
+    
+    This function provides a complete analytical report for a single input number,
+    showcasing the differences between standard and wormhole algorithms. It serves
+    as the main user interface for demonstrating the capabilities, accuracy, and
+    efficiency benefits of the wormhole optimization approach.
+    
+    The analysis includes:
+    1. Input validation and preprocessing
+    2. Sequence generation using both algorithms
+    3. Visual sequence comparison and representation
+    4. Wormhole detection and usage analysis
+    5. Mathematical validation of wormhole correctness
+    6. Computational efficiency metrics and comparison
+    
+    Args:
+        n (Union[int, str, float]): The input number to analyze. Can be string,
+                                   float, or integer format. Will be validated
+                                   and converted internally.
+    
+    Returns:
+        None: This function prints comprehensive analysis directly to console.
+    
+    Console Output Structure:
+        - Header with program title and input information
+        - Sequence Analysis Section:
+          * Standard algorithm sequence (complete path)
+          * Wormhole algorithm sequence with visual optimization highlighting
+        - Wormhole Detection Section:
+          * Entry point information and position
+          * Optimization strategy explanation
+        - Wormhole Validation Section:
+          * Mathematical correctness verification
+          * Error reporting if validation fails
+        - Computational Efficiency Table:
+          * Side-by-side comparison of both algorithms
+          * Steps computed, saved, and efficiency percentages
+          * Visual highlighting of optimized portions
+    
+    Examples:
+        >>> display_complete_analysis(27)
+        # Displays full analysis for n=27 showing wormhole optimization
+        
+        >>> display_complete_analysis("100")
+        # Analyzes n=100 with string input (automatically converted)
+        
+        >>> display_complete_analysis(1)
+        # Shows trivial case analysis
+        
+        >>> display_complete_analysis("invalid")
+        # Displays input validation error
+    
+    Notes:
+        - This is the primary user-facing function for single number analysis
+        - Combines all analysis components into a unified, comprehensive report
+        - Uses color coding to highlight optimized vs computed portions
+        - Provides educational value by showing algorithm differences
+        - Essential for demonstrating wormhole optimization benefits
+        - Includes robust error handling for all input types
+        - Serves as the main interface for the CLI application
+    """
+    # Display program header with title and formatting
+    print("=" * 100)
+    print("  COLLATZ TOTAL STOPPING TIME PREDICTOR ")
+    print("=" * 100)
+    
+    try:
+        # Validate and convert input to proper integer format
+        n_val = validate_input(n)
+        print(f"\n[*] ANALYZING n = {n_val}")
+        
+        # Walk the trajectory once; both algorithms' results and the validation derive from it
+        try:
+            trace = Trace(n_val)
+        except ComputationError as e:
+            print(f"\n[!] ERROR: {e}")
+            return
+        standard_result = trace.standard_result()
+        wormhole_result = trace.wormhole_result()
+        
+        # Display visual sequences comparison and analysis
+        display_standard_and_predicted_sequences(n_val, wormhole_result, trace)
+        
+        # Display detailed wormhole detection and usage information
+        display_wormhole_info(wormhole_result)
+        
+        # Display mathematical validation results for wormhole accuracy
+        if "validation" in wormhole_result:
+            display_validation_results(wormhole_result["validation"])
+
+        # Display efficiency comparison table (only if validation passed)
+        if "validation_failed" not in wormhole_result["prediction_type"]:
+            display_efficiency_table(standard_result, wormhole_result)
+        
+    except ValidationError as e:
+        # Handle input validation errors with clear messaging
+        print(f"\n[!] INPUT ERROR: {e}")
+    except Exception as e:
+        # Handle unexpected errors with diagnostic information
+        print(f"\n[!] UNEXPECTED ERROR: {e}")
+
+def display_standard_and_predicted_sequences(n: int, wormhole_result: Dict, trace: Trace = None) -> None:
+    """
+    Display visual comparison between standard and predicted Collatz sequences.
+    
+    This function creates a side-by-side visual representation of Collatz sequences
+    generated by both algorithms, highlighting the computational optimization achieved
+    through wormhole usage. It uses color coding to distinguish between computed
+    steps and optimized (wormhole) portions of the sequence.
+    
+    Visual Elements:
+    - Standard sequence: Complete step-by-step path with arrow separators
+    - Wormhole sequence: Color-coded path showing computed vs optimized portions
+    - Orange arrows (computed): Steps calculated manually before wormhole usage
+    - Green arrows (wormhole): Steps retrieved from pre-computed wormhole sequence
+    
+    Args:
+        n (int): The input number for which sequences were generated
+        wormhole_result (Dict): Results from wormhole algorithm containing:
+                               - prediction_type: Type of optimization applied
+                               - entry_point_found: Wormhole entry point (if applicable)
+                               - entry_point_position: Position where wormhole was triggered
+        trace (Trace): The walk of n shared by the analysis (walked here when omitted)
+    
+    Returns:
+        None: This function prints formatted sequences directly to console.
+    
+    Console Output:
+        - Section header for sequence analysis
+        - Standard sequence: Complete numerical path with arrow separators
+        - Wormhole sequence: Color-coded path showing optimization breakdown
+        - Information about sequence lengths and step counts
+    
+    Examples:
+        For n=6 with wormhole at position 1:
+        Standard sequence (9 elements and 8 steps):
+        6 → 3 → 10 → 5 → 16 → 8 → 4 → 2 → 1
+        
+        Predicted sequence (9 elements and 8 steps):
+        6 → 3 → 10 → 5 → 16 → 8 → 4 → 2 → 1
+        (orange portion: computed, green portion: from wormhole)
+    
+    Notes:
+        - This function provides crucial visual feedback for understanding optimization
+        - Color coding helps users distinguish between computed and optimized portions
+        - Essential for educational demonstration of wormhole algorithm benefits
+        - Handles various scenarios: entry point found, no entry point, trivial cases
+        - Uses ANSI escape codes for terminal color formatting
+        - Complements the numerical analysis with intuitive visual representation
+    """
+    print("\n\t= SEQUENCES ANALYSIS:")
+    
+    # Display the standard (reference) sequence stored by the walk
+    try:
+        if trace is None:
+            trace = Trace(n)
+        standard_sequence = trace.values
+        print(f"\n\t   - Standard sequence ({len(standard_sequence)} elements and {len(standard_sequence)-1} steps):")
+        
+        # Display standard sequence with arrow separators
+        print(f"\t   {' → '.join(map(str, standard_sequence))}")
+    except Exception as e:
+        print(f"\t   Error generating standard sequence: {e}")
+        return
+    
+    # Display wormhole sequence based on optimization result type
+    if wormhole_result.get("prediction_type") == "entry_point_found":
+        # Case: Wormhole optimization was successfully applied
+        entry_point_pos = wormhole_result.get("entry_point_position", 0)
+        entry_point_num = wormhole_result.get("entry_point_found")
+
+        # The computed portion (steps before wormhole usage) is the start of the walk
+        computed_part = trace.values[:entry_point_pos + 1]
+        
+        # Expand the wormhole portion from the table
+        # Skip first element to avoid duplication (already in computed_part)
+        if entry_point_num in get_wormhole_table():
+            wormhole_part = list(get_wormhole_table().iter_sequence(entry_point_num, 1))
+        else:
+            wormhole_part = []
+        
+        # Calculate total predicted sequence length
+        predicted_sequence = len(computed_part) + len(wormhole_part)
+
+        print(f"\n\t   - Predicted sequence ({predicted_sequence} elements and {predicted_sequence - 1} steps):")
+        
+        # Display color-coded sequence:
+        # Orange for computed steps, green for wormhole steps
+        computed_str = ' \033[38;5;214m→\033[0m '.join(map(str, computed_part))
+        wormhole_str = ' \033[32m→\033[0m '.join(map(str, wormhole_part))
+
+        print(f"\t   {computed_str} \033[32m→\033[0m {wormhole_str}")
+      
+    else:
+        # Cases where no wormhole optimization was applied
+        if "no_entry_point" in wormhole_result["prediction_type"]:
+            print("\n\t   - Predicted sequence: No wormhole available before trivial cycle")
+        elif "trivial" in wormhole_result["prediction_type"]:
+            print("\n\t   - Predicted sequence: No wormhole needed for trivial cycle")
+        else:
+            print(f"\n\t   - Predicted sequence: Available wormhole {wormhole_result.get('entry_point_found', 'unknown')} is unusable")
+
+def display_wormhole_info(wormhole_result: Dict) -> None:
+    """
+    Display detailed information about wormhole detection and optimization strategy.
+    
+    This function provides comprehensive analysis of wormhole usage, explaining
+    the optimization strategy applied and the computational benefits achieved.
+    It serves as an educational component to help users understand how the
+    wormhole algorithm detects and utilizes pre-computed sequences.
+    
+    Information displayed includes:
+    - Wormhole entry point detection results
+    - Position in sequence where optimization was triggered
+    - Size and characteristics of the utilized wormhole
+    - Optimization strategy explanation based on scenario
+    - Efficiency assessment (best case vs worst case scenarios)
+    
+    Args:
+        wormhole_result (Dict): Results from wormhole algorithm containing:
+                               - prediction_type: Type of optimization result
+                               - entry_point_found: Number that triggered wormhole (if applicable)
+                               - entry_point_position: Step where wormhole was detected
+                               - wormhole_length: Size of the wormhole sequence used
+    
+    Returns:
+        None: This function prints wormhole analysis directly to console.
+    
+    Console Output Scenarios:
+        1. Entry Point Found:
+           - Entry point value and discovery position
+           - Wormhole characteristics (length, steps saved)
+           - Efficiency assessment (immediate vs delayed discovery)
+           - Strategic explanation of the optimization approach
+        
+        2. No Entry Point:
+           - Explanation of worst-case computational scenario
+           - Strategy description for trivial cycle completion
+    
+    Examples:
+        For successful wormhole detection:
+        = WORMHOLE DETECTION:
+        - The wormhole entry point takes the value 91 and it is reached at step 27
+        - This is the most efficient situation, when n equals an entry point of wormholes
+        - The wormhole has 85 elements (84 steps)
+        - Strategy: Compute until it finds an entry point for wormhole, then use it
+        
+        For no wormhole available:
+        = WORMHOLE DETECTION:
+        - The wormhole entry point requires full steps, being the worst computational situation
+        - Strategy: Compute until repetition happens on the trivial cycle (1, 4, 2, 1)
+    
+    Notes:
+        - This function provides educational value about optimization strategies
+        - Helps users understand the computational benefits of wormhole approach
+        - Explains the difference between best-case and worst-case scenarios
+        - Essential for demonstrating algorithm intelligence and efficiency
+        - Complements numerical results with strategic insights
+    """
+    # Skip wormhole analysis for trivial cases (n=1)
+    if "trivial" not in wormhole_result["prediction_type"]:
+        
+        # Case 1: Wormhole entry point was successfully detected and used
+        if wormhole_result.get("prediction_type") == "entry_point_found":
+            entry_point = wormhole_result.get("entry_point_found")
+            position = wormhole_result.get("entry_point_position")
+            wormhole_len = wormhole_result.get("wormhole_length", 0)
+            
+            print("\n\t= WORMHOLE DETECTION:\n")
+            print(f"\t   - The wormhole entry point takes the value {entry_point} and it is reached at step {position}")
+            
+            # Assess optimization efficiency based on entry point position
+            if position == 0:
+                # Best case scenario: input number itself is a wormhole entry point
+                print("\t   - This is the most efficient situation, when n equals an entry point of wormholes")
+            
+            # Display wormhole characteristics and size information
+            print(f"\t   - The wormhole has {wormhole_len} elements ({wormhole_len-1} steps)")
+            print("\t   - Strategy: Compute until it finds an entry point for wormhole, then use it")
+        
+        else:
+            # Case 2: No wormhole entry point was found (worst case scenario)
+            print("\n\t= WORMHOLE DETECTION:\n")
+            print("\t   - The wormhole entry point requires full steps, being the worst computational situation")
+            print("\t   - Strategy: Compute until repetition happens on the trivial cycle (1, 4, 2, 1)")
+    
+    # Note: Trivial case (n=1 or mr=0) don't require wormhole analysis as they complete immediately
+
+def display_validation_results(validation: Dict) -> None:
+    """
+    Display mathematical validation results for wormhole sequence accuracy.
+    
+    This function presents the results of wormhole sequence validation, which
+    verifies that pre-computed wormhole sequences are mathematically correct
+    by comparing them against actual Collatz computations. It serves as a
+    quality assurance component that builds trust in optimization results.
+    
+    The validation display includes:
+    - Pass/fail status of mathematical verification
+    - Detailed error analysis if validation fails
+    - Diagnostic information for troubleshooting sequence discrepancies
+    - Length and content comparison results
+    
+    Args:
+        validation (Dict): Validation results from validate_wormhole_sequence() containing:
+                          - valid (bool): Whether wormhole sequence is mathematically correct
+                          - error (str): Error description if validation failed
+                          - actual_length (int): Length of computed sequence (if length mismatch)
+                          - expected_length (int): Length of wormhole sequence (if length mismatch)
+                          - position (int): Position of first difference (if content mismatch)
+                          - actual_value: Computed value at difference position
+                          - expected_value: Wormhole value at difference position
+    
+    Returns:
+        None: This function prints validation results directly to console.
+    
+    Console Output Scenarios:
+        1. Validation Passed:
+           = WORMHOLE VALIDATION:
+           PASSED: Wormhole sequence matches standard sequence
+        
+        2. Validation Failed - Length Mismatch:
+           = WORMHOLE VALIDATION:
+           FAILED: Sequence lengths differ
+           - Wormhole length is 85 but standard length is 87
+        
+        3. Validation Failed - Content Mismatch:
+           = WORMHOLE VALIDATION:
+           FAILED: Sequences differ at position 15
+           - Wormhole value is 52 but standard value is 26
+    
+    Examples:
+        >>> validation = {'valid': True}
+        >>> display_validation_results(validation)
+        # Outputs success message
+        
+        >>> validation = {
+        ...     'valid': False,
+        ...     'error': 'Sequences differ at position 10',
+        ...     'position': 10,
+        ...     'expected_value': 52,
+        ...     'actual_value': 26
+        ... }
+        >>> display_validation_results(validation)
+        # Outputs detailed failure analysis
+    
+    Notes:
+        - This function is critical for maintaining trust in wormhole optimization
+        - Provides essential quality assurance feedback for algorithm reliability
+        - Helps identify and diagnose errors in wormhole dictionary entries
+        - Essential component of the verification workflow
+        - Builds confidence in optimization results through mathematical proof
+        - Supports debugging and troubleshooting of sequence discrepancies
+    """
+    print("\n\t= WORMHOLE VALIDATION:\n")
+    
+    # Check validation status and display appropriate results
+    if validation["valid"]:
+        # Validation successful: wormhole sequence is mathematically correct
+        print("\t   PASSED: Wormhole sequence matches standard sequence")
+    else:
+        # Validation failed: display detailed error analysis
+        print(f"\t   FAILED: {validation['error']}")
+        
+        # Provide specific diagnostic information based on error type
+        
+        # Case 1: Sequence length mismatch
+        if "actual_length" in validation and "expected_length" in validation:
+            print(f"\t   - Wormhole length is {validation['expected_length']} but standard length is {validation['actual_length']}")
+        
+        # Case 2: Sequence content mismatch at specific position
+        if "position" in validation:
+            print(f"\t   - Wormhole value is {validation['expected_value']} but standard value is {validation['actual_value']}")
+
+def display_efficiency_table(standard_result: Dict, wormhole_result: Dict) -> None:
+    """
+    Display comprehensive efficiency comparison table between standard and wormhole algorithms.
+    
+    This function creates a formatted table that provides side-by-side comparison
+    of computational efficiency between the traditional and optimized approaches.
+    It serves as the primary performance metrics display, highlighting the
+    computational benefits achieved through wormhole optimization.
+    
+    The efficiency table includes:
+    - Total stopping time comparison for both algorithms
+    - Breakdown of computed vs saved steps for wormhole algorithm
+    - Percentage efficiency gains from optimization
+    - Color-coded visualization of optimization components
+    - Assessment of wormhole detection effectiveness
+    
+    Args:
+        standard_result (Dict): Results from standard algorithm containing:
+                               - total_stopping_time (int): Steps calculated by standard method
+        wormhole_result (Dict): Results from wormhole algorithm containing:
+                               - total_stopping_time (int): Total steps (computed + saved)
+                               - computed_steps (int): Steps calculated manually
+                               - saved_steps (int): Steps saved through wormhole usage
+    
+    Returns:
+        None: This function prints formatted efficiency table directly to console.
+    
+    Table Structure:
+        Header: "COMPUTATIONAL EFFICIENCY TABLE"
+        Columns: Method | Total Steps | Computed | Saved | % Saved
+        Rows:
+        - Standard: Shows traditional algorithm metrics (no optimization)
+        - Wormhole: Shows optimized algorithm with color-coded breakdown
+        
+        Color Coding:
+        - Orange text: Computed steps (standard calculation)
+        - Green text: Saved steps (wormhole optimization)
+        - Regular text: Standard algorithm and totals
+    
+    Examples:
+        For n=51 with wormhole optimization (best case):
+        ================================================================================
+        COMPUTATIONAL EFFICIENCY TABLE
+        ================================================================================
+        Method               Total Steps  Computed   Saved      % Saved
+        --------------------------------------------------------------------------------
+        Standard                      24        24       0       0.000%
+        Wormhole                      24         0      24     100.000%
+        ================================================================================
+
+
+        For n=27 with wormhole optimization:
+        ================================================================================
+        COMPUTATIONAL EFFICIENCY TABLE
+        ================================================================================
+        Method               Total Steps  Computed   Saved      % Saved
+        --------------------------------------------------------------------------------
+        Standard                     111       111       0       0.000%
+        Wormhole                     111        16      95      85.586%
+        ================================================================================
+        
+        For n=84 without wormhole optimization (worst case):
+        ================================================================================
+        COMPUTATIONAL EFFICIENCY TABLE
+        ================================================================================
+        Method               Total Steps  Computed   Saved      % Saved
+        --------------------------------------------------------------------------------
+        Standard                       9         9       0       0.000%
+        Wormhole                       9         9       0       0.000%
+        ================================================================================
+    
+    Notes:
+        - This function provides the primary performance comparison interface
+        - Essential for demonstrating computational benefits of wormhole optimization
+        - Uses color coding to visually distinguish optimization components
+        - Calculates and displays percentage efficiency gains
+        - Provides clear evidence of algorithm effectiveness
+        - Critical for performance analysis and algorithm validation
+        - Helps users understand the practical benefits of optimization
+    """
+    # Extract computational metrics from both algorithm results
+    standard_time = standard_result.get("total_stopping_time", 0)
+    wormhole_time = wormhole_result.get("total_stopping_time", 0)
+    computed_steps = wormhole_result.get("computed_steps", 0)
+    saved_steps = wormhole_result.get("saved_steps", 0)
+    
+    # Display formatted table header
+    print("\n" + "=" * 100)
+    print("COMPUTATIONAL EFFICIENCY TABLE")
+    print("=" * 100)
+    print(f"{'Method':<20} {'Total Steps':<12} {'Computed':<10} {'Saved':<10} {'% Saved':<12}")
+    print("-" * 100)
+    
+    # Display standard algorithm row (baseline performance)
+    print(f"{'Standard':<20} {standard_time:>11} {standard_time:>9} {0:7} {0.0:>11.3f}%")
+    
+    # Calculate optimization efficiency metrics for wormhole algorithm
+    if saved_steps > 0 and standard_time > 0:
+        # Case: Wormhole optimization was successfully applied
+        saved_pct = (saved_steps / standard_time) * 100
+    else:
+        # Case: No wormhole optimization available or applied
+        saved_pct = 0.0
+    
+    # Display wormhole algorithm row with color-coded optimization breakdown
+    # Orange for computed steps, green for saved steps
+    print(f"{'Wormhole':<20} {wormhole_time:>11} \033[38;5;214m{computed_steps:>9}\033[0m \033[32m{saved_steps:7}\033[0m {saved_pct:>11.3f}%")
+      
+    # Display table footer
+    print("=" * 100)
+
+class CountingMap:
+    """
+    Read-only mapping that counts membership lookups and hits per key.
+    
+    Installed over WormholeTable.stopping_times and WormholeTable.odd_cores by
+    Instrumentation.install() and removed again by uninstall(). The hot paths test
+    membership with "in" and .get(), so every lookup goes through this class while
+    instrumentation is enabled and through the plain frozen map otherwise.
+    
+    Attributes:
+        mapping: The wrapped mapping
+        lookups (int): Number of "in" and get() lookups
+        hits (dict): Key -> number of successful lookups
+    
+    Examples:
+        >>> counted = CountingMap({91: 92})
+        >>> 91 in counted, 7 in counted, counted[91]
+        (True, False, 92)
+        >>> counted.lookups, counted.hits
+        (2, {91: 1})
+    """
+    __slots__ = ("mapping", "lookups", "hits")
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+        self.lookups = 0
+        self.hits = {}
+
+    def __contains__(self, key) -> bool:
+        self.lookups += 1
+        if key in self.mapping:
+            self.hits[key] = self.hits.get(key, 0) + 1
+            return True
+        return False
+
+    def get(self, key, default=None):
+        self.lookups += 1
+        value = self.mapping.get(key)
+        if value is None:
+            return default
+        self.hits[key] = self.hits.get(key, 0) + 1
+        return value
+
+    def __getitem__(self, key):
+        return self.mapping[key]
+
+    def __iter__(self):
+        return iter(self.mapping)
+
+    def __len__(self) -> int:
+        return len(self.mapping)
+
+    def keys(self):
+        return self.mapping.keys()
+
+    def values(self):
+        return self.mapping.values()
+
+    def items(self):
+        return self.mapping.items()
+
+class Instrumentation:
+    """
+    Counters, phase timings and optional profiling of one run (--stats, --profile).
+    
+    install() replaces the functions of INSTRUMENTED_FUNCTIONS in the module namespace
+    with wrappers that count calls and time them, and puts CountingMap objects over
+    the lookup maps of the active wormhole table; uninstall() puts the originals back.
+    Callers look these functions and maps up at call time, so a run without
+    instrumentation does not pay anything for it.
+    
+    Time is charged exclusively: while a wrapped function calls another one, the
+    clock runs for the inner function only. The phase of a function is its key in
+    INSTRUMENTED_FUNCTIONS, and time outside every wrapped function is "other".
+    
+    Counted on top of the calls:
+        - Single steps: calls of next_collatz_value() (sequence generation, reference walks)
+        - Wormhole walks: steps computed before the entry point and steps saved by it,
+          from the results of total_stopping_time_with_entry()
+        - Standard walks: steps of standard_total_stopping_time()
+        - Lookups and hits of the entry point map (hits per entry point) and of the odd core map
+        - Validation walks: calls of validate_wormhole_sequence()
+    
+    With profile=True, start() and stop() also run cProfile and tracemalloc around
+    the run. Both are imported only then.
+    
+    Args:
+        counters (bool): Count and time the instrumented functions once install() is called
+        profile (bool): Run cProfile and tracemalloc between start() and stop()
+    
+    Examples:
+        >>> instrumentation = Instrumentation()
+        >>> instrumentation.start()
+        >>> instrumentation.install()
+        >>> calculate_wormhole_total_stopping_time(27)["total_stopping_time"]
+        111
+        >>> instrumentation.uninstall()
+        >>> instrumentation.stop()
+        >>> report = instrumentation.report()
+        >>> report["steps"]["wormhole_computed"], report["steps"]["wormhole_saved"]
+        (16, 95)
+        >>> report["functions"]["total_stopping_time_with_entry"]["calls"]
+        1
+    
+    Notes:
+        - Only the calling process is instrumented; worker processes of --workers are not
+        - The vectorized NumPy kernel tests a whole array of lanes at once, so its
+          lookups and steps are not counted (its calls and time are)
+    """
+
+    def __init__(self, counters: bool = True, profile: bool = False):
+        self.counters = counters
+        self.profile = profile
+        self.calls = {}
+        self.seconds = {}
+        self.phases = {}
+        self.steps = {"single": 0, "wormhole_computed": 0, "wormhole_saved": 0, "standard": 0}
+        self.stack = []
+        self.mark = 0.0
+        self.originals = {}
+        self.table = None
+        self.table_maps = None
+        self.lookup_counts = (CountingMap({}), CountingMap({}))
+        self.start_time = None
+        self.wall_seconds = 0.0
+        self.profiler = None
+        self.profile_rows = []
+        self.memory = None
+
+    def start(self) -> None:
+        """Start the wall clock and, with profile=True, cProfile and tracemalloc."""
+        self.start_time = time.perf_counter()
+        if self.profile:
+            import cProfile
+            import tracemalloc
+            tracemalloc.start()
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop(self) -> None:
+        """Stop the wall clock and the profilers, and keep their results for report()."""
+        self.wall_seconds = time.perf_counter() - self.start_time
+        if self.profiler is None:
+            return
+        self.profiler.disable()
+        import pstats
+        import tracemalloc
+        rows = []
+        for (filename, line, function), (_, calls, own, cumulative, _) in pstats.Stats(self.profiler).stats.items():
+            location = f"{os.path.basename(filename)}:{line}" if line else filename
+            rows.append({"function": f"{function} ({location})", "calls": calls,
+                         "own_seconds": round(own, 6), "cumulative_seconds": round(cumulative, 6)})
+        rows.sort(key=lambda row: row["cumulative_seconds"], reverse=True)
+        self.profile_rows = rows[:PROFILE_REPORT_LINES]
+        current, peak = tracemalloc.get_traced_memory()
+        sites = tracemalloc.take_snapshot().statistics("lineno")[:PROFILE_MEMORY_LINES]
+        tracemalloc.stop()
+        self.memory = {
+            "current_kb": round(current / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "top_allocations": [{"location": f"{os.path.basename(site.traceback[0].filename)}:{site.traceback[0].lineno}",
+                                 "kb": round(site.size / 1024, 1), "blocks": site.count} for site in sites]
+        }
+        self.profiler = None
+
+    def install(self) -> None:
+        """Wrap the instrumented functions and count the lookups of the active wormhole table."""
+        if not self.counters or self.originals:
+            return
+        namespace = globals()
+        hooks = {
+            "total_stopping_time_with_entry": self.record_wormhole_walk,
+            "standard_total_stopping_time": self.record_standard_walk
+        }
+        for phase, names in INSTRUMENTED_FUNCTIONS.items():
+            for name in names:
+                self.originals[name] = namespace[name]
+                self.phases[name] = phase
+                self.calls[name] = 0
+                self.seconds[name] = 0.0
+                namespace[name] = self.timed(name, namespace[name], hooks.get(name))
+        
+        # Single Collatz steps are too short to time, they are only counted
+        step = self.originals["next_collatz_value"] = namespace["next_collatz_value"]
+        steps = self.steps
+        
+        def counted_step(n):
+            steps["single"] += 1
+            return step(n)
+        namespace["next_collatz_value"] = wraps(step)(counted_step)
+        
+        self.table = get_wormhole_table()
+        self.table_maps = (self.table.stopping_times, self.table.odd_cores)
+        self.lookup_counts = (CountingMap(self.table.stopping_times), CountingMap(self.table.odd_cores))
+        self.table.stopping_times, self.table.odd_cores = self.lookup_counts
+
+    def uninstall(self) -> None:
+        """Put the original functions and lookup maps back (the counts are kept)."""
+        if not self.originals:
+            return
+        globals().update(self.originals)
+        self.table.stopping_times, self.table.odd_cores = self.table_maps
+        self.originals = {}
+
+    def timed(self, name: str, function, hook=None):
+        """Return a wrapper of function that counts its calls and charges its exclusive time to name."""
+        calls = self.calls
+        seconds = self.seconds
+        stack = self.stack
+        clock = time.perf_counter
+        
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            now = clock()
+            if stack:
+                seconds[stack[-1]] += now - self.mark
+            stack.append(name)
+            self.mark = now
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                now = clock()
+                seconds[stack.pop()] += now - self.mark
+                self.mark = now
+            if hook is not None:
+                hook(result)
+            return result
+        return wraps(function)(wrapper)
+
+    def record_wormhole_walk(self, result: tuple) -> None:
+        """Count the computed and saved steps of one total_stopping_time_with_entry() result."""
+        total, entry_point, position = result
+        computed = total if entry_point is None else position
+        self.steps["wormhole_computed"] += computed
+        self.steps["wormhole_saved"] += total - computed
+
+    def record_standard_walk(self, result: int) -> None:
+        """Count the steps of one standard_total_stopping_time() result."""
+        self.steps["standard"] += result
+
+    def report(self) -> dict:
+        """
+        Return the collected counters as a JSON-serializable dictionary.
+        
+        Returns:
+            dict: wall_seconds, phases (exclusive seconds, with "other"), functions
+                  (calls and exclusive seconds of each called function), steps, lookups,
+                  entry_point_hits (most hit first), validation_walks, and profile
+                  (top functions and memory) when profiling was enabled
+        """
+        report = {"wall_seconds": round(self.wall_seconds, 6)}
+        if self.counters:
+            entry_points, odd_cores = self.lookup_counts
+            
+            phases = {phase: 0.0 for phase in INSTRUMENTED_FUNCTIONS}
+            for name, seconds in self.seconds.items():
+                phases[self.phases[name]] += seconds
+            phases["other"] = max(0.0, self.wall_seconds - sum(phases.values()))
+            report["phases"] = {phase: round(seconds, 6) for phase, seconds in phases.items()}
+            report["functions"] = {name: {"calls": self.calls[name], "seconds": round(self.seconds[name], 6)}
+                                   for name in sorted(self.calls, key=self.seconds.get, reverse=True)
+                                   if self.calls[name]}
+            report["steps"] = dict(self.steps)
+            report["lookups"] = {
+                "entry_point_lookups": entry_points.lookups,
+                "entry_point_hits": sum(entry_points.hits.values()),
+                "odd_core_lookups": odd_cores.lookups,
+                "odd_core_hits": sum(odd_cores.hits.values())
+            }
+            report["entry_point_hits"] = {str(key): count for key, count in
+                                          sorted(entry_points.hits.items(), key=lambda item: (-item[1], item[0]))}
+            report["validation_walks"] = self.calls.get("validate_wormhole_sequence", 0)
+        if self.memory is not None:
+            report["profile"] = {"functions": self.profile_rows, "memory": self.memory}
+        return report
+
+def display_instrumentation_report(report: dict, report_format: str = "text") -> None:
+    """
+    Print an Instrumentation report (--stats, --profile) on stderr.
+    
+    Args:
+        report (dict): The result of Instrumentation.report()
+        report_format (str): "text" for a readable summary, "json" for the full report
+    
+    Console Output:
+        - Wall time, and exclusive time per phase and per function
+        - Single, wormhole and standard steps, table lookups and hits, validation walks
+        - The most used entry points
+        - With --profile: the top functions by cumulative time and the memory peak
+    """
+    import json
+    
+    out = sys.stderr
+    if report_format == "json":
+        print(json.dumps(report, indent=2), file=out)
+        return
+    
+    wall_seconds = report["wall_seconds"]
+    print("", file=out)
+    print("[*] Instrumentation report", file=out)
+    print(f"    Wall time:             {wall_seconds * 1000:12.3f} ms", file=out)
+    if "phases" in report:
+        print("    Phases (exclusive time):", file=out)
+        for phase, seconds in report["phases"].items():
+            share = seconds / wall_seconds * 100 if wall_seconds else 0.0
+            print(f"      {phase:<21}{seconds * 1000:12.3f} ms {share:6.1f}%", file=out)
+        print("    Functions (calls, exclusive time):", file=out)
+        for name, counts in report["functions"].items():
+            print(f"      {name:<40}{counts['calls']:>12,}{counts['seconds'] * 1000:12.3f} ms", file=out)
+        steps = report["steps"]
+        lookups = report["lookups"]
+        print(f"    Single steps:          {steps['single']:>12,}  (next_collatz_value calls)", file=out)
+        print(f"    Wormhole walks:        {steps['wormhole_computed']:>12,}  computed, "
+              f"{steps['wormhole_saved']:,} saved", file=out)
+        print(f"    Standard walks:        {steps['standard']:>12,}  steps", file=out)
+        print(f"    Entry point lookups:   {lookups['entry_point_lookups']:>12,}  "
+              f"({lookups['entry_point_hits']:,} hits)", file=out)
+        print(f"    Odd core lookups:      {lookups['odd_core_lookups']:>12,}  "
+              f"({lookups['odd_core_hits']:,} hits)", file=out)
+        print(f"    Validation walks:      {report['validation_walks']:>12,}", file=out)
+        top = list(report["entry_point_hits"].items())[:STATS_TOP_ENTRY_POINTS]
+        if top:
+            print("    Most used entry points: " + ", ".join(f"{key} ({count:,})" for key, count in top), file=out)
+    if "profile" in report:
+        print("    Profile (top functions by cumulative time):", file=out)
+        print(f"      {'calls':>10} {'own ms':>10} {'cum ms':>10}  function", file=out)
+        for row in report["profile"]["functions"]:
+            print(f"      {row['calls']:>10,} {row['own_seconds'] * 1000:10.3f} {row['cumulative_seconds'] * 1000:10.3f}  "
+                  f"{row['function']}", file=out)
+        memory = report["profile"]["memory"]
+        print(f"    Traced memory:         {memory['peak_kb']:12,.1f} KB peak, {memory['current_kb']:,.1f} KB at the end",
+              file=out)
+        for site in memory["top_allocations"]:
+            print(f"      {site['kb']:10,.1f} KB {site['blocks']:>8,} blocks  {site['location']}", file=out)
+
+def display_startup_report(main_start_time: float) -> None:
+    """
+    Print where the time of this run went (--time-startup), on stderr.
+    
+    Args:
+        main_start_time (float): perf_counter() value when main() started
+    
+    Console Output:
+        - Module execution time (imports, DICTIONARY literal, function definitions)
+        - Lazy initializations: wormhole table build (or load from its marshalled
+          cache) and NumPy import, if they happened
+        - Command time, and the process CPU time, which also covers the interpreter
+          start-up and the loading (or compilation) of the module bytecode
+    """
+    now = time.perf_counter()
+    table_seconds = STARTUP_TIMINGS.get("wormhole_table")
+    numpy_seconds = STARTUP_TIMINGS.get("numpy_import")
+    table_source = " (cache)" if STARTUP_TIMINGS.get("wormhole_table_cached") else ""
+    
+    report = sys.stderr
+    print("", file=report)
+    print("[*] Startup report", file=report)
+    print(f"    Module execution:      {(main_start_time - MODULE_START_TIME) * 1000:9.3f} ms", file=report)
+    print("    Wormhole table build:  " + (f"{table_seconds * 1000:9.3f} ms{table_source}" if table_seconds is not None
+                                           else "    not built"), file=report)
+    print("    NumPy import:          " + (f"{numpy_seconds * 1000:9.3f} ms" if numpy_seconds is not None
+                                           else " not imported"), file=report)
+    print(f"    Command:               {(now - main_start_time) * 1000:9.3f} ms", file=report)
+    print(f"    Process CPU time:      {time.process_time() * 1000:9.3f} ms "
+          f"(includes interpreter start-up and bytecode loading)", file=report)
+
+def pop_option(args: list, option: str, default: str = None) -> str:
+    """
+    Remove an "option value" pair from a list of command-line arguments.
+    
+    Args:
+        args (list): Remaining command-line arguments (modified in place)
+        option (str): The option name, e.g. "--workers"
+        default (str): Value returned when the option is absent
+    
+    Returns:
+        str: The option value, or default when the option is not present
+    
+    Raises:
+        ValueError: If the option is present but not followed by a value
+    
+    Examples:
+        >>> args = ["--workers", "8"]
+        >>> pop_option(args, "--workers", "1")
+        '8'
+        >>> args
+        []
+    """
+    if option not in args:
+        return default
+    index = args.index(option)
+    if index + 1 >= len(args):
+        raise ValueError(f"{option} requires a value")
+    value = args[index + 1]
+    del args[index:index + 2]
+    return value
+
+def print_usage():
+    """
+    Display comprehensive usage information and help documentation for the CLI application.
+    
+    This function provides complete command-line interface documentation, explaining
+    all available commands, their syntax, and practical examples. It serves as the
+    primary help system for users to understand how to properly use the Collatz
+    total stopping time predictor with wormhole optimization.
+    
+    The usage information includes:
+    - Command syntax and parameter requirements for all operations
+    - Available operation modes (single analysis, batch testing, help requests)
+    - Practical examples with real inputs and expected behaviors
+    - Clear explanations of each command's purpose and use cases
+    - Multiple ways to access help information
+    
+    Args:
+        None: This function requires no parameters.
+    
+    Returns:
+        None: This function prints usage documentation directly to console.
+    
+    Console Output Structure:
+        1. Usage Syntax Section:
+           - Command format for single number analysis
+           - Command format for sequence equivalence testing
+           - Command format for help requests (multiple variants)
+        
+        2. Commands Description Section:
+           - Detailed explanation of each available command
+           - Parameter requirements and formats
+           - Help system access methods
+        
+        3. Examples Section:
+           - Practical examples showing real command usage
+           - Different scenarios and use cases
+           - Error handling demonstrations
+    
+    Available Commands Documented:
+        1. Single Number Analysis:
+           - Syntax: python total_stopping_time_predictor.py <n>
+           - Purpose: Analyze one specific number with full comparison
+        
+        2. Sequence Equivalence Testing:
+           - Syntax: python total_stopping_time_predictor.py --test-sequences <max_n> [--workers <N>]
+                     [--checkpoint <file>] [--checkpoint-every <K>] [--resume <file>]
+                     [--quiet] [--progress-every <K>] [--detail-file <file>] [--histograms <file>]
+           - Purpose: Validate algorithm correctness across a range, optionally in parallel
+                      and resumable after an interruption
+        
+        2b. Range Sweep:
+           - Syntax: python total_stopping_time_predictor.py --range <start> <end> [--entry-points]
+           - Purpose: Write stopping times for every number of a range as CSV
+        
+        2h. Range Statistics:
+           - Syntax: python total_stopping_time_predictor.py --statistics <start> <end> [--workers <N>]
+                     [--histograms <file.json>]
+           - Purpose: Summarize a range in constant memory and export its histograms as JSON
+        
+        2i. Trajectory Export:
+           - Syntax: python total_stopping_time_predictor.py --sequence <n> [--wormhole]
+           - Purpose: Stream one trajectory through iter_standard()/iter_wormhole()
+        
+        2j. Entry Point Attribution:
+           - Syntax: python total_stopping_time_predictor.py --predecessors <entry> --limit <N> [--ceiling <C>]
+           - Purpose: List every n <= N whose first entry point is <entry>, with iter_predecessors()
+        
+        2c. Jump Table Report:
+           - Syntax: python total_stopping_time_predictor.py --jump-table [<k>]
+           - Purpose: Report the build time and memory of a k-step jump table
+        
+        2d. Streaming Batch Mode:
+           - Syntax: python total_stopping_time_predictor.py (--stdin | --input <file>) [--format csv|jsonl]
+           - Purpose: Compute stopping times for piped values in constant memory
+        
+        2e. Engine Benchmark:
+           - Syntax: python total_stopping_time_predictor.py --benchmark [--range-max <N>] [--samples <N>]
+           - Purpose: Measure wall-clock time of the standard, wormhole, memo, jump, batch and range engines
+        
+        2f. Wormhole Table Generation:
+           - Syntax: python total_stopping_time_predictor.py --generate-table <bound> --output <file> [--format json|binary]
+           - Purpose: Derive and verify pseudocycle entry points, then load them with --table <file>
+        
+        2g. Query Server:
+           - Syntax: python total_stopping_time_predictor.py --serve [--host <addr>] [--port <N> | --socket <path>]
+                     [--cache <size>]
+                     python total_stopping_time_predictor.py --query <value|stats>... [--json] [--port <N> | --socket <path>]
+           - Purpose: Answer cached, batched stopping-time queries over a local socket
+        
+        3. Help Display:
+           - Syntax: python total_stopping_time_predictor.py [--help|-h|help]
+           - Purpose: Display this usage information
+    
+    Examples:
+        >>> print_usage()
+        # Outputs complete usage documentation
+        
+        Typical usage scenarios:
+        - User needs help: python total_stopping_time_predictor.py --help
+        - User wants analysis: python total_stopping_time_predictor.py 27
+        - User wants validation: python total_stopping_time_predictor.py --test-sequences 1000
+        - Invalid input: Shows specific error + suggests --help
+    
+    Notes:
+        - This function is automatically called when insufficient arguments provided
+        - Essential for user onboarding and command discovery
+        - Provides clear guidance for both beginners and advanced users
+        - Documents all available functionality in one place
+        - Critical for CLI usability and user experience
+        - Should be updated whenever new commands are added
+        - Supports multiple help command variants for user convenience
+        - Integrates with improved error handling system
+    """
+    print("Usage:")
+    print("  python total_stopping_time_predictor.py <n>")
+    print("  python total_stopping_time_predictor.py --test-sequences <max_n> [--workers <N>]")
+    print("                                          [--checkpoint <file>] [--checkpoint-every <K>] [--resume <file>]")
+    print("                                          [--quiet] [--progress-every <K>] [--detail-file <file>]")
+    print("                                          [--histograms <file.json>]")
+    print("  python total_stopping_time_predictor.py --range <start> <end> [--entry-points]")
+    print("  python total_stopping_time_predictor.py --statistics <start> <end> [--workers <N>] [--histograms <file.json>]")
+    print("  python total_stopping_time_predictor.py --sequence <n> [--wormhole]")
+    print("  python total_stopping_time_predictor.py --predecessors <entry> --limit <N> [--ceiling <C>]")
+    print("  python total_stopping_time_predictor.py --jump-table [<k>]")
+    print("  python total_stopping_time_predictor.py --generate-table <bound> --output <file> [--format json|binary]")
+    print("  python total_stopping_time_predictor.py (--stdin | --input <file>) [--format csv|jsonl] [--memo <size>]")
+    print("  python total_stopping_time_predictor.py --benchmark [--range-max <N>] [--samples <N>] [--seed <S>]")
+    print("                                          [--engines <a,b,...>] [--output <file.json>]")
+    print("  python total_stopping_time_predictor.py --serve [--host <addr>] [--port <N> | --socket <path>] [--cache <size>]")
+    print("  python total_stopping_time_predictor.py --query <value|stats>... [--json] [--host <addr>] [--port <N> | --socket <path>]")
+    print("  python total_stopping_time_predictor.py [--help | -h | help]")
+    print("")
+    print("Commands:")
+    print("  <n>                      Analyze single number (integer, float, or string)")
+    print("  --test-sequences <max_n> Test sequences equivalence from 1 to max_n")
+    print("  --range <start> <end>    Write stopping times of start..end as CSV (one sweep)")
+    print("  --statistics <start> <end> Summarize start..end: histograms, records, entry point hits")
+    print("  --sequence <n>           Stream the trajectory of n, one value per line (lazy, constant memory)")
+    print("  --predecessors <entry>   List every n <= --limit whose first entry point is <entry> (inverse tree walk)")
+    print("  --jump-table [<k>]       Build a k-step jump table and report build time and memory")
+    print("  --generate-table <bound> Derive pseudocycle entry points from the trajectories of n <= bound")
+    print("  --stdin, --input <file>  Stream one value per line and write one result per line")
+    print("  --benchmark              Time every engine and report ns/number, numbers/sec, RSS and speedup")
+    print("  --serve                  Answer line or JSON queries on a local socket until interrupted")
+    print("  --query <value|stats>... Send values (or stats) to a running --serve server")
+    print("  --help, -h, help         Display this help information")
+    print("")
+    print("Options:")
+    print("  --workers <N>            Run --test-sequences on N worker processes")
+    print("  --checkpoint <file>      Save the --test-sequences state to <file> while running")
+    print("  --checkpoint-every <K>   Numbers tested between two checkpoints (default: 1000000)")
+    print("  --resume <file>          Continue an interrupted --test-sequences run from its checkpoint")
+    print("  --quiet                  Drop the per-n lines of --test-sequences and only keep the counters")
+    print("  --progress-every <K>     Print a progress line (numbers/sec, ETA) every K tested numbers")
+    print("  --detail-file <file>     Write the per-n lines of --test-sequences to <file>")
+    print("  --histograms <file.json> Write the statistics of --test-sequences/--statistics as JSON")
+    print("  --entry-points           Add the first wormhole entry point column to --range")
+    print("  --wormhole               Stream --sequence with the wormhole algorithm (stored tail spliced in)")
+    print("  --limit <N>              Largest n listed by --predecessors")
+    print("  --ceiling <C>            Largest value explored by --predecessors (default: the limit)")
+    print("  --format csv|jsonl       Output format of --stdin/--input (default: csv)")
+    print("  --memo <size>            Share a memo table of <size> stopping times across --stdin/--input values")
+    print("  --strict-revalidate      Re-walk every wormhole each time it is used (audit mode)")
+    print("  --max-input <N|none>     Reject inputs above N (default: none, any size is accepted)")
+    print("  --max-steps <N>          Give up on trajectories longer than N steps (default: 10000)")
+    print("  --table <file>           Use a table written by --generate-table instead of the built-in one")
+    print("  --interior               Treat every value stored inside a wormhole as an entry point")
+    print("  --time-startup           Report module, table, NumPy and command timings on stderr")
+    print("  --stats [text|json]      Report calls, phase times, steps, table lookups and entry point hits on stderr")
+    print("  --profile [text|json]    Run under cProfile and tracemalloc and report the top functions and memory")
+    print("                           (binary tables are memory-mapped and binary-searched)")
+    print("  --range-max <N>          Range workload of --benchmark is 1..N (default: 100000)")
+    print("  --samples <N>            Random workload of --benchmark has N values (default: 10000)")
+    print("  --engines <a,b,...>      Engines to benchmark: standard, wormhole, wormhole-strict, memo, jump, batch, range")
+    print("  --output <file.json>     Write the --benchmark results as JSON")
+    print("  --host <addr>            Address of --serve/--query (default: 127.0.0.1)")
+    print("  --port <N>               TCP port of --serve/--query (default: 8765)")
+    print("  --socket <path>          Use a Unix socket instead of TCP for --serve/--query")
+    print("  --cache <size>           Result dictionaries cached by --serve (default: 100000)")
+    print("  --json                   Send --query values as JSON requests and print JSON results")
+    print("")
+    print("Examples:")
+    print("  python total_stopping_time_predictor.py 27")
+    print("  python total_stopping_time_predictor.py \"100\"")
+    print("  python total_stopping_time_predictor.py 42.0")
+    print("  python total_stopping_time_predictor.py 340282366920938463463374607431768211455")
+    print("  python total_stopping_time_predictor.py --test-sequences 1000")
+    print("  python total_stopping_time_predictor.py --test-sequences 100000000 --workers 64")
+    print("  python total_stopping_time_predictor.py --test-sequences 1000000000 --resume run.json")
+    print("  python total_stopping_time_predictor.py --test-sequences 1000000000 --quiet --progress-every 10000000")
+    print("  python total_stopping_time_predictor.py --range 1 1000000 --entry-points > times.csv")
+    print("  python total_stopping_time_predictor.py --sequence 27 --wormhole | head")
+    print("  python total_stopping_time_predictor.py --predecessors 91 --limit 1000000 --ceiling 100000000")
+    print("  python total_stopping_time_predictor.py --statistics 1 100000000 --workers 64 --histograms stats.json")
+    print("  seq 1 1000000 | python total_stopping_time_predictor.py --stdin --format jsonl")
+    print("  python total_stopping_time_predictor.py --generate-table 100000 --output table.json")
+    print("  python total_stopping_time_predictor.py 27 --table table.json")
+    print("  python total_stopping_time_predictor.py --test-sequences 1000000 --interior --quiet")
+    print("  python total_stopping_time_predictor.py 27 --time-startup")
+    print("  python total_stopping_time_predictor.py --test-sequences 100000 --quiet --stats json 2> stats.json")
+    print("  python total_stopping_time_predictor.py --generate-table 100000 --output table.bin --format binary")
+    print("  python total_stopping_time_predictor.py --serve --socket /tmp/collatz.sock")
+    print("  python total_stopping_time_predictor.py --query 27 28 stats --socket /tmp/collatz.sock")
+    print("  python total_stopping_time_predictor.py --help")
+    print("")
+    print("Input Formats:")
+    print("  - Integers: 27, 100, 1")
+    print("  - Strings: \"27\", \"100\" (will be converted)")
+    print("  - Floats: 27.0, 100.0 (must be whole numbers)")
+    print("")
+    print("Error Examples:")
+    print("  python total_stopping_time_predictor.py abc     # Invalid format")
+    print("  python total_stopping_time_predictor.py 3.14    # Not a whole number")
+    print("  python total_stopping_time_predictor.py -5      # Must be positive")
+
+def main():
+   """
+   Main entry point and command-line interface coordinator for the Collatz predictor application.
+   
+   This function serves as the central dispatcher that processes command-line arguments,
+   validates user input, and routes execution to the appropriate analysis or testing
+   functions. It provides comprehensive error handling and user feedback for all
+   supported operations with improved help system and validation.
+   
+   Supported Operations:
+   1. Single Number Analysis: Comprehensive analysis of one input number
+   2. Sequence Equivalence Testing: Batch validation across a range of numbers
+   3. Help Display: Usage information via multiple command formats
+   
+   Command Line Argument Processing:
+   - Validates minimum argument requirements
+   - Parses and routes commands to appropriate functions
+   - Handles numeric inputs, command flags, and help requests
+   - Provides specific error messages for different failure types
+   - Distinguishes between help requests and invalid inputs
+   
+   Args:
+       None: Uses sys.argv to access command-line arguments directly.
+   
+   Returns:
+       None: This function coordinates execution and exits with appropriate status codes.
+   
+   Exit Codes:
+       - 0: Successful execution or help display
+       - 1: Invalid arguments, input errors, or execution failures
+   
+   Command Line Formats:
+       1. python total_stopping_time_predictor.py <n>
+          - Performs complete analysis of number n
+          - Displays sequences, wormhole info, validation, and efficiency
+       
+       2. python total_stopping_time_predictor.py --test-sequences <max_n> [--workers <N>]
+          - Tests algorithm equivalence for range [1, max_n]
+          - Validates wormhole correctness across multiple inputs
+          - Optionally splits the range across N worker processes
+          - --checkpoint <file> saves the state every --checkpoint-every numbers, and
+            --resume <file> continues an interrupted run with identical final totals
+          - --quiet drops the per-n lines, --progress-every <K> prints a rate-limited
+            progress line and --detail-file <file> sends the per-n lines to a file
+          - --histograms <file> writes the statistics of the run as JSON
+       
+       2b. python total_stopping_time_predictor.py --range <start> <end> [--entry-points]
+          - Computes stopping times of [start, end] in one sweep with compute_range()
+          - Writes n,total_stopping_time[,entry_point] CSV lines to stdout
+       
+       2h. python total_stopping_time_predictor.py --statistics <start> <end> [--workers <N>] [--histograms <file>]
+          - Accumulates a RangeStatistics over [start, end] with run_range_statistics()
+          - Prints min/max, records, entry point hits and the percent saved distribution,
+            and optionally writes all histograms as JSON
+          - --test-sequences also accepts --histograms <file> for the tested range
+       
+       2i. python total_stopping_time_predictor.py --sequence <n> [--wormhole]
+          - Writes the trajectory of n one value per line with print_sequence()
+          - Lazy: values come from iter_standard() or iter_wormhole() in blocks
+       
+       2j. python total_stopping_time_predictor.py --predecessors <entry> --limit <N> [--ceiling <C>]
+          - Walks the inverse Collatz tree breadth-first from <entry> with print_predecessors()
+          - Cuts branches above the ceiling and at other entry points, and writes
+            n,total_stopping_time,entry_point_position CSV lines as they are found
+       
+       2c. python total_stopping_time_predictor.py --jump-table [<k>]
+          - Builds a JumpTable with 2^k entries and reports build time and memory
+       
+       2d. python total_stopping_time_predictor.py (--stdin | --input <file>) [--format csv|jsonl] [--memo <size>]
+          - Streams newline-delimited values through stream_stopping_times()
+          - Writes plain CSV or JSON Lines results suitable for Unix pipelines
+       
+       2e. python total_stopping_time_predictor.py --benchmark [--range-max <N>] [--samples <N>] [--output <file>]
+          - Times every engine over a range and a random sample with run_benchmark()
+          - Optionally writes the machine-readable report as JSON
+       
+       2f. python total_stopping_time_predictor.py --generate-table <bound> --output <file> [--format json|binary]
+          - Scans the trajectories of n <= bound for pseudocycle entry points
+          - Verifies them, reports hit rate and saved steps before and after, and
+            writes the enlarged table for the global --table <file> option
+          - The binary format is memory-mapped and binary-searched when loaded
+       
+       2g. python total_stopping_time_predictor.py --serve [--host <addr>] [--port <N> | --socket <path>] [--cache <size>]
+          - Answers line (CSV row) or JSON queries with run_server() until interrupted
+          - Shares a result cache across clients and batches concurrent queries
+          - "stats" reports throughput, p50/p99 latency, cache and batch counters
+          - --query <value|stats>... [--json] is the matching client (query_server())
+       
+       3. python total_stopping_time_predictor.py [--help|-h|help]
+          - Displays usage information and exits successfully
+       
+       4. python total_stopping_time_predictor.py
+          - Shows usage information when no arguments provided
+   
+   Error Handling:
+       - Insufficient arguments: Shows usage and exits
+       - Invalid numeric inputs: Displays specific validation errors with guidance
+       - Help requests: Shows usage and exits successfully
+       - Computation interruption: Handles Ctrl+C gracefully
+       - Unexpected errors: Captures and reports with diagnostic info
+   
+   Examples:
+       Command line usage:
+       $ python total_stopping_time_predictor.py 27
+       # Analyzes n=27 with full comparison
+       
+       $ python total_stopping_time_predictor.py --test-sequences 100
+       # Tests equivalence for n=1 to n=100
+       
+       $ python total_stopping_time_predictor.py --help
+       # Shows usage information
+       
+       $ python total_stopping_time_predictor.py abc
+       # Shows "Error: Invalid number format: abc" with help guidance
+   
+   Notes:
+       - This function is the primary entry point for CLI execution
+       - Provides robust error handling for all execution paths with specific messaging
+       - Essential for user experience and application reliability
+       - Handles both interactive and automated execution scenarios
+       - Critical for proper application lifecycle management
+       - Ensures graceful handling of user interruptions and errors
+       - Improved help system allows multiple ways to request usage information
+       - Early input validation prevents confusion between help requests and invalid inputs
+   """
+   import json
+   
+   main_start_time = time.perf_counter()
+   
+   # Work on a copy of the arguments so global options can be removed before routing
+   argv = list(sys.argv)
+   
+   # Global option: report where the start-up time went once the command is done
+   time_startup = "--time-startup" in argv
+   if time_startup:
+       argv.remove("--time-startup")
+   
+   # Global options: counters and phase timings (--stats), cProfile and tracemalloc (--profile)
+   instrumentation = None
+   stats_format = "text"
+   if "--stats" in argv or "--profile" in argv:
+       for option in ("--stats", "--profile"):
+           if option in argv:
+               index = argv.index(option)
+               if index + 1 < len(argv) and argv[index + 1] in STATS_FORMATS:
+                   stats_format = argv.pop(index + 1)
+       instrumentation = Instrumentation(counters="--stats" in argv, profile="--profile" in argv)
+       argv = [arg for arg in argv if arg not in ("--stats", "--profile")]
+       instrumentation.start()
+   
+   try:
+       # Global option: re-walk every wormhole on each use instead of the cached verdicts
+       if "--strict-revalidate" in argv:
+           argv.remove("--strict-revalidate")
+           set_strict_revalidation(True)
+       
+       # Global options: input and trajectory limits of every engine
+       try:
+           max_input_value = pop_option(argv, "--max-input", "none")
+           max_input_value = None if max_input_value.lower() == "none" else int(max_input_value)
+           max_computation_steps = int(pop_option(argv, "--max-steps", str(DEFAULT_MAX_COMPUTATION_STEPS)))
+           configure_limits(max_input_value, max_computation_steps)
+       except ValueError:
+           print("Error: --max-input requires a positive integer or none, --max-steps a positive integer")
+           sys.exit(1)
+       
+       # Global option: replace the built-in DICTIONARY with a JSON or binary table file
+       try:
+           table_path = pop_option(argv, "--table", None)
+           if table_path is not None:
+               set_wormhole_table(load_wormhole_table(table_path))
+       except ValueError:
+           print("Error: --table requires a file path")
+           sys.exit(1)
+       except ValidationError as e:
+           print(f"Error: {e}")
+           sys.exit(1)
+       
+       # Global option: enter wormholes at every value stored inside them, not only at the keys
+       interior = "--interior" in argv
+       if interior:
+           argv.remove("--interior")
+           set_wormhole_table(get_wormhole_table().with_interior_points())
+       
+       # Wrap the instrumented functions once the final wormhole table is known
+       if instrumentation is not None:
+           instrumentation.install()
+       
+       # Validate minimum command-line argument requirements
+       if len(argv) < 2:
+           print_usage()
+           sys.exit(1)
+       
+       # Extract the primary command from command-line arguments
+       command = argv[1]
+       
+       # Route 1: Sequence equivalence testing command
+       if command == "--test-sequences":
+           # Validate that maximum number parameter is provided
+           if len(argv) < 3:
+               print("Error: --test-sequences requires a maximum number")
+               sys.exit(1)
+           try:
+               # Parse and validate the maximum number for testing range
+               max_n = int(argv[2])
+           except ValueError:
+               # Handle invalid integer conversion for test range parameter
+               print("Error: Maximum number must be an integer")
+               sys.exit(1)
+           
+           # Parse the optional number of worker processes
+           options = argv[3:]
+           try:
+               workers = int(pop_option(options, "--workers", "1"))
+               if workers < 1:
+                   raise ValueError
+           except ValueError:
+               print("Error: --workers requires a positive integer")
+               sys.exit(1)
+           
+           # Parse the optional checkpoint options; a resumed run keeps saving to its own file
+           try:
+               resume_path = pop_option(options, "--resume", None)
+               checkpoint_path = pop_option(options, "--checkpoint", resume_path)
+               checkpoint_every = int(pop_option(options, "--checkpoint-every", str(DEFAULT_CHECKPOINT_INTERVAL)))
+               if checkpoint_every < 1:
+                   raise ValueError
+           except ValueError:
+               print("Error: --checkpoint and --resume require a file, --checkpoint-every a positive integer")
+               sys.exit(1)
+           
+           # Parse the optional output options
+           quiet = "--quiet" in options
+           if quiet:
+               options.remove("--quiet")
+           try:
+               histograms_path = pop_option(options, "--histograms", None)
+               detail_path = pop_option(options, "--detail-file", None)
+               progress_every = pop_option(options, "--progress-every", None)
+               if progress_every is not None:
+                   progress_every = int(progress_every)
+                   if progress_every < 1:
+                       raise ValueError
+           except ValueError:
+               print("Error: --progress-every requires a positive integer, --detail-file and --histograms a file")
+               sys.exit(1)
+           if options:
+               print(f"Error: Unknown option {options[0]}")
+               sys.exit(1)
+           
+           try:
+               test_sequence_equivalence(max_n, workers=workers, checkpoint_path=checkpoint_path,
+                                         checkpoint_every=checkpoint_every, resume_path=resume_path,
+                                         quiet=quiet, progress_every=progress_every, detail_path=detail_path,
+                                         histograms_path=histograms_path)
+           except (ValueError, OSError) as e:
+               # Unusable checkpoint file
+               print(f"Error: {e}")
+               sys.exit(1)
+               
+       # Route: Range sweep of stopping times written as CSV
+       elif command == "--range":
+           # Validate that both bounds are provided
+           if len(argv) < 4:
+               print("Error: --range requires a start and an end number")
+               sys.exit(1)
+           try:
+               # Parse the inclusive range bounds
+               start = int(argv[2])
+               end = int(argv[3])
+           except ValueError:
+               print("Error: Range bounds must be integers")
+               sys.exit(1)
+           
+           options = argv[4:]
+           track_entry_points = "--entry-points" in options
+           if track_entry_points:
+               options.remove("--entry-points")
+           if options:
+               print(f"Error: Unknown option {options[0]}")
+               sys.exit(1)
+           
+           try:
+               stopping_times, entry_points = compute_range(start, end + 1, track_entry_points)
+           except (ValidationError, ComputationError) as e:
+               print(f"Error: {e}")
+               sys.exit(1)
+           print_range_results(start, stopping_times, entry_points)
+           
+       # Route: Streaming statistics (histograms, records, entry point hits) of a range
+       elif command == "--statistics":
+           options = argv[2:]
+           try:
+               start = int(options.pop(0)) if options else 0
+               end = int(options.pop(0)) if options else 0
+               workers = int(pop_option(options, "--workers", "1"))
+               histograms_path = pop_option(options, "--histograms", None)
+               if start < 1 or end < start or workers < 1:
+                   raise ValueError
+           except ValueError:
+               print("Error: --statistics requires a positive start and end, --workers a positive integer "
+                     "and --histograms a file")
+               sys.exit(1)
+           if options:
+               print(f"Error: Unknown option {options[0]}")
+               sys.exit(1)
+           
+           try:
+               statistics = run_range_statistics(start, end + 1, workers)
+           except ValidationError as e:
+               print(f"Error: {e}")
+               sys.exit(1)
+           display_range_statistics(statistics)
+           if histograms_path is not None:
+               with open(histograms_path, "w") as histograms_file:
+                   json.dump(statistics.to_dict(), histograms_file, indent=2)
+               print(f"\n[*] Statistics written to {histograms_path}")
+           
+       # Route: Stream the trajectory of one number, one value per line
+       elif command == "--sequence":
+           options = argv[2:]
+           wormhole = "--wormhole" in options
+           if wormhole:
+               options.remove("--wormhole")
+           if len(options) != 1:
+               print("Error: --sequence requires exactly one number")
+               sys.exit(1)
+           try:
+               print_sequence(validate_input(options[0]), wormhole)
+           except (ValidationError, ComputationError) as e:
+               print(f"Error: {e}")
+               sys.exit(1)
+           
+       # Route: Every n up to a limit whose first entry point is a given key (inverse tree walk)
+       elif command == "--predecessors":
+           options = argv[3:]
+           try:
+               if len(argv) < 3:
+                   raise ValueError("--predecessors requires an entry point")
+               entry_point = int(argv[2])
+               limit = pop_option(options, "--limit", None)
+               if limit is None:
+                   raise ValueError("--predecessors requires --limit")
+               limit = int(limit)
+               ceiling = pop_option(options, "--ceiling", None)
+               ceiling = int(ceiling) if ceiling is not None else None
+           except ValueError:
+               print("Error: --predecessors requires an entry point and --limit <N>, --ceiling <N> an integer")
+               sys.exit(1)
+           if options:
+               print(f"Error: Unknown option {options[0]}")
+               sys.exit(1)
+           try:
+               _, cut_at_ceiling = print_predecessors(entry_point, limit, ceiling)
+           except ValidationError as e:
+               print(f"Error: {e}")
+               sys.exit(1)
+           if cut_at_ceiling:
+               # Keep stdout clean CSV, but never truncate silently
+               print(f"[!] Branches cut above the ceiling {ceiling if ceiling is not None else limit}: "
+                     f"{cut_at_ceiling}. Numbers whose trajectory climbs higher before reaching "
+                     f"{entry_point} are not listed (raise --ceiling)", file=sys.stderr)
+           
+       # Route: Build a k-step jump table and report its cost
+       elif command == "--jump-table":
+           try:
+               bits = int(argv[2]) if len(argv) > 2 else DEFAULT_JUMP_BITS
+               jump_table = JumpTable(bits)
+           except ValueError as e:
+               print(f"Error: {e}")
+               sys.exit(1)
+           report = jump_table.describe()
+           print(f"[*] Jump table with k={report['bits']}: {report['entries']} entries, "
+                 f"built in {report['build_seconds']:.6f} s, {report['memory_bytes']} bytes")
+           
+       # Route: Derive more wormhole entry points and save the enlarged table
+       elif command == "--generate-table":
+           options = argv[2:]
+           try:
+               bound = int(options.pop(0)) if options else 0
+               output_path = pop_option(options, "--output", None)
+               table_format = pop_option(options, "--format", "json")
+               if bound < 1 or output_path is None or table_format not in ("json", "binary"):
+                   raise ValueError
+           except ValueError:
+               print("Error: --generate-table requires a positive bound, --output <file> and --format json|binary")
+               sys.exit(1)
+           if options:
+               print(f"Error: Unknown option {options[0]}")
+               sys.exit(1)
+           # The interior index would turn every value inside a wormhole into a saved key
+           if interior:
+               print("Error: --generate-table cannot be combined with --interior")
+               sys.exit(1)
+           
+           print(f"[*] Scanning the trajectories of n <= {bound} for pseudocycle entry points")
+           start_time = time.perf_counter()
+           base_dictionary = DICTIONARY if table_path is None else table_to_dictionary(WORMHOLE_TABLE)
+           dictionary = generate_wormhole_dictionary(bound, base_dictionary)
+           elapsed = time.perf_counter() - start_time
+           
+           # Coverage of the inputs 1..bound before and after the expansion
+           hit_rate_before, saved_before = table_coverage(bound)
+           set_wormhole_table(WormholeTable.from_dictionary(dictionary))
+           hit_rate_after, saved_after = table_coverage(bound)
+           
+           try:
+               if table_format == "binary":
+                   get_wormhole_table().save(output_path)
+               else:
+                   save_wormhole_dictionary(dictionary, output_path)
+           except OSError as e:
+               print(f"Error: Cannot write {output_path}: {e}")
+               sys.exit(1)
+           print(f"[*] Entry points: {len(base_dictionary)} -> {len(dictionary)} "
+                 f"({len(dictionary) - len(base_dictionary)} new, verified) in {elapsed:.3f} s")
+           print(f"[*] Hit rate for n <= {bound}: {hit_rate_before:.3%} -> {hit_rate_after:.3%}")
+           print(f"[*] Steps saved for n <= {bound}: {saved_before} -> {saved_after}")
+           print(f"[*] Table written to {output_path}, load it with --table {output_path}")
+           
+       # Route: Streaming batch mode over stdin or a file
+       elif command in ["--stdin", "--input"]:
+           options = argv[2:]
+           try:
+               input_path = options.pop(0) if command == "--input" and options else None
+               output_format = pop_option(options, "--format", "csv")
+               memo_size = pop_option(options, "--memo")
+               memo = StoppingTimeMemo(int(memo_size)) if memo_size is not None else None
+           except ValueError as e:
+               print(f"Error: {e}", file=sys.stderr)
+               sys.exit(1)
+           if command == "--input" and input_path is None:
+               print("Error: --input requires a file path", file=sys.stderr)
+               sys.exit(1)
+           if output_format not in STREAM_FORMATS:
+               print(f"Error: --format must be one of {', '.join(STREAM_FORMATS)}", file=sys.stderr)
+               sys.exit(1)
+           if options:
+               print(f"Error: Unknown option {options[0]}", file=sys.stderr)
+               sys.exit(1)
+           
+           try:
+               if input_path is None:
+                   stream_stopping_times(sys.stdin, sys.stdout, output_format, memo)
+               else:
+                   with open(input_path, "r") as input_stream:
+                       stream_stopping_times(input_stream, sys.stdout, output_format, memo)
+           except OSError as e:
+               if isinstance(e, BrokenPipeError):
+                   # Downstream consumer closed the pipe (e.g. head): stop quietly
+                   sys.stdout = open(os.devnull, "w")
+                   sys.exit(0)
+               print(f"Error: {e}", file=sys.stderr)
+               sys.exit(1)
+           
+       # Route: Long-lived query server on a TCP or Unix socket
+       elif command == "--serve":
+           options = argv[2:]
+           try:
+               host = pop_option(options, "--host", DEFAULT_SERVER_HOST)
+               port = int(pop_option(options, "--port", str(DEFAULT_SERVER_PORT)))
+               socket_path = pop_option(options, "--socket")
+               cache_size = int(pop_option(options, "--cache", str(DEFAULT_SERVER_CACHE_SIZE)))
+               if options:
+                   raise ValueError(f"Unknown option {options[0]}")
+               stats = run_server(host, port, socket_path, cache_size)
+           except (ValueError, OSError) as e:
+               print(f"Error: {e}")
+               sys.exit(1)
+           print(f"\n[*] Served {stats['requests']} requests: p50 {stats['latency_p50_ms']} ms, "
+                 f"p99 {stats['latency_p99_ms']} ms, cache hit rate {stats['cache_hit_rate']:.2%}, "
+                 f"mean batch {stats['mean_batch_size']}", file=sys.stderr)
+           
+       # Route: Client of a running --serve server
+       elif command == "--query":
+           options = argv[2:]
+           try:
+               host = pop_option(options, "--host", DEFAULT_SERVER_HOST)
+               port = int(pop_option(options, "--port", str(DEFAULT_SERVER_PORT)))
+               socket_path = pop_option(options, "--socket")
+           except ValueError:
+               print("Error: --host and --socket require a value, --port an integer")
+               sys.exit(1)
+           json_requests = "--json" in options
+           if json_requests:
+               options.remove("--json")
+           if not options:
+               print("Error: --query requires at least one value or stats")
+               sys.exit(1)
+           
+           requests = options
+           if json_requests:
+               requests = [{"command": "stats"} if value == "stats" else {"n": value} for value in options]
+           try:
+               responses = query_server(requests, host, port, socket_path)
+           except OSError as e:
+               print(f"Error: Cannot query the server: {e}")
+               sys.exit(1)
+           for response in responses:
+               print(json.dumps(response) if isinstance(response, dict) else response)
+           
+       # Route: Wall-clock benchmark of the engines
+       elif command == "--benchmark":
+           options = argv[2:]
+           try:
+               range_max = int(pop_option(options, "--range-max", str(DEFAULT_BENCHMARK_RANGE)))
+               samples = int(pop_option(options, "--samples", str(DEFAULT_BENCHMARK_SAMPLES)))
+               seed = int(pop_option(options, "--seed", "0"))
+               engines = pop_option(options, "--engines")
+               output_path = pop_option(options, "--output")
+               if options:
+                   raise ValueError(f"Unknown option {options[0]}")
+               report = run_benchmark(range_max, samples, seed, engines.split(",") if engines else None)
+           except ValueError as e:
+               print(f"Error: {e}")
+               sys.exit(1)
+           
+           display_benchmark_results(report)
+           if output_path is not None:
+               # Machine-readable results for tracking regressions between versions
+               with open(output_path, "w") as output_file:
+                   json.dump(report, output_file, indent=2)
+               print(f"\n[*] Results written to {output_path}")
+           
+       # Route 2: Help command variants (multiple formats supported)
+       elif command in ["--help", "-h", "help"]:
+           # Display usage information and exit successfully
+           print_usage()
+           sys.exit(0)
+           
+       else:
+           # Route 3: Single number analysis command
+           try:
+               # Perform early input validation to distinguish between help requests and invalid numbers
+               # This prevents confusion where invalid inputs might be interpreted as help requests
+               validate_input(command)  # Raises ValidationError for invalid formats
+               
+               # Input validation passed - proceed with comprehensive analysis
+               display_complete_analysis(command)
+               
+           except ValidationError as e:
+               # Handle specific input validation errors with clear messaging
+               # Provide specific error details and guidance for proper usage
+               print(f"Error: {e}")
+               print("\nUse --help for usage information")
+               sys.exit(1)
+       
+   except KeyboardInterrupt:
+       # Handle user interruption (Ctrl+C) gracefully
+       print("\n\n[!] Computation interrupted by user")
+       sys.exit(1)
+   except Exception as e:
+       # Handle unexpected errors with diagnostic information
+       # This catches system-level errors that shouldn't normally occur
+       print(f"\n[!] UNEXPECTED ERROR: {e}")
+       sys.exit(1)
+   finally:
+       if instrumentation is not None:
+           instrumentation.uninstall()
+           instrumentation.stop()
+           display_instrumentation_report(instrumentation.report(), stats_format)
+       if time_startup:
+           display_startup_report(main_start_time)